@@ -0,0 +1,78 @@
+"""Shared helpers for the Kill Tracker benchmarks."""
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_LOG = REPO_ROOT / "Game.log"
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+class NullModule():
+    """Stand-in for the GUI, sounds and Commander Mode modules: swallows every call."""
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return None
+
+
+class NullLogger():
+    def debug(self, msg): pass
+    def info(self, msg): pass
+    def warning(self, msg): pass
+    def error(self, msg): pass
+    def success(self, msg): pass
+
+
+class BenchApiClient():
+    """Minimal API client surface the LogParser touches while replaying a log."""
+    def __init__(self):
+        from modules.sc_data_index import build_sc_data_index
+        self.api_key = {"value": "benchmark"}
+        self.sc_data = {"weapons": [], "ships": [], "ignoredVictimRules": []}
+        self.sc_data_index = build_sc_data_index(self.sc_data)
+        self.connection_healthy = False
+
+    def __getattr__(self, name):
+        return NullModule()
+
+
+def make_parser(rsi_handle="SIIIN", player_geid="201926434272"):
+    """Build a LogParser wired to inert collaborators so it can replay logs outside the app."""
+    from modules.log_parser import LogParser
+    parser = LogParser(
+        NullModule(), BenchApiClient(), NullModule(), NullModule(), "bench",
+        {"active": True}, {"current": rsi_handle}, {"current": player_geid},
+        {"current": "N/A", "previous": "N/A"}, {"enabled": False},
+    )
+    parser.set_logger(NullLogger())
+    return parser
+
+
+def build_log(repeat: int) -> Path:
+    """Return the sample log, or a temporary copy of it concatenated ``repeat`` times."""
+    if repeat <= 1:
+        return SAMPLE_LOG
+    fd, name = tempfile.mkstemp(prefix="bench_game_", suffix=".log")
+    with os.fdopen(fd, "wb") as out:
+        for _ in range(repeat):
+            with open(SAMPLE_LOG, "rb") as src:
+                shutil.copyfileobj(src, out)
+    return Path(name)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS reports bytes
+        return peak / (2 ** 20) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (2 ** 20)
@@ -0,0 +1,94 @@
+"""Benchmark the old-log backfill: peak RSS and throughput.
+
+Each mode runs in its own interpreter so the peak RSS figures do not bleed
+into each other.
+
+    python benchmarks/bench_backfill.py --repeat 200 --workers 4
+"""
+import argparse
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+from _common import build_log, make_parser, peak_rss_mb
+
+
+def run_readlines(log_path) -> int:
+    """The previous backfill: load the entire log into a list first."""
+    parser = make_parser()
+    with open(log_path, "r", errors="replace") as sc_log:
+        lines = sc_log.readlines()
+    for line in lines:
+        parser.dispatch_log_line(line, False)
+    return len(lines)
+
+
+def run_stream(log_path) -> int:
+    """Streaming backfill that still decodes and dispatches every line."""
+    from modules.log_tailer import LogReader
+    parser = make_parser()
+    with LogReader(str(log_path)) as reader:
+        return parser.load_old_log(reader)
+
+
+def run_prefilter(log_path) -> int:
+    """The backfill used by LogParser.tail_log: streaming plus the byte level prefilter."""
+    from modules.log_tailer import LogReader
+    parser = make_parser()
+    with LogReader(str(log_path), prefilter=parser.line_prefilter) as reader:
+        return parser.load_old_log(reader)
+
+
+def run_parallel(log_path, workers) -> int:
+    """Prefiltered backfill with the classification spread over a process pool, whatever the log size."""
+    from modules.log_tailer import LogReader
+    parser = make_parser()
+    parser.backfill_classifier.min_parallel_size = 0
+    if workers:
+        parser.backfill_classifier.workers = workers
+    with LogReader(str(log_path), prefilter=parser.line_prefilter) as reader:
+        return parser.load_old_log(reader)
+
+
+MODES = {"readlines": run_readlines, "stream": run_stream, "prefilter": run_prefilter, "parallel": run_parallel}
+
+
+def child(mode: str, log_path: str, workers: int) -> None:
+    start = perf_counter()
+    line_count = MODES[mode](log_path, workers) if mode == "parallel" else MODES[mode](log_path)
+    elapsed = perf_counter() - start
+    size_mib = os.path.getsize(log_path) / 2 ** 20
+    print(
+        f"{mode:<10} {line_count:>10} lines dispatched {elapsed:8.2f} s {size_mib / elapsed:>9,.1f} MiB/s"
+        f"  peak RSS {peak_rss_mb():8.1f} MiB"
+    )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=1, help="concatenate the sample Game.log this many times")
+    arg_parser.add_argument("--workers", type=int, default=0, help="processes for the parallel mode (default: cores - 1)")
+    arg_parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    arg_parser.add_argument("--log", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child:
+        child(args.child, args.log, args.workers)
+        return
+
+    log_path = build_log(args.repeat)
+    try:
+        print(f"Log: {log_path} ({log_path.stat().st_size / 2 ** 20:.1f} MiB)")
+        for mode in MODES:
+            subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--log", str(log_path), "--workers", str(args.workers)],
+                check=True,
+            )
+    finally:
+        if args.repeat > 1:
+            log_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark mining a logbackups/ directory for kills and deaths with the mmap scanner.
+
+    python benchmarks/bench_backup_scan.py --files 50
+"""
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from _common import SAMPLE_LOG, make_parser
+
+SYNTHETIC_KILLS = (
+    "<2025-10-15T20:30:00.000Z> [Notice] <Actor Death> CActor::Kill: 'SIIIN' [201926434272] in zone 'ANVL_Hornet_F7CM_Mk2_6734193926082' "
+    "killed by 'Enemy1' [215423956176] using 'ESPR_BallisticCannon_S5_6607088543131' [Class unknown] with damage type 'VehicleDestruction' "
+    "from direction x: 0.000000, y: 0.000000, z: 0.000000 [Team_ActorTech][Actor]\n"
+    "<2025-10-15T20:30:03.000Z> [Notice] <Actor Death> CActor::Kill: 'Victim2' [2] in zone 'AEGS_Gladius_99' killed by 'SIIIN' [201926434272] "
+    "using 'KLWE_LaserRepeater_S3_1' [Class unknown] with damage type 'Bullet' from direction x: 0, y: 0, z: 0 [Team_ActorTech][Actor]\n"
+)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--files", type=int, default=50, help="number of backup logs to generate")
+    arg_parser.add_argument("--repeat", type=int, default=4, help="copies of the sample log per backup file")
+    args = arg_parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_logbackups_"))
+    try:
+        backup_dir = work_dir / "logbackups"
+        backup_dir.mkdir()
+        sample = SAMPLE_LOG.read_bytes() + SYNTHETIC_KILLS.encode()
+        for index in range(args.files):
+            (backup_dir / f"Game Build(10392434) {index:04}.log").write_bytes(sample * args.repeat)
+        total_mib = sum(backup.stat().st_size for backup in backup_dir.iterdir()) / 2 ** 20
+
+        parser = make_parser()
+        parser.log_file_location = str(work_dir / "Game.log")
+        start = perf_counter()
+        results = parser.scan_backup_logs()
+        elapsed = perf_counter() - start
+        print(
+            f"{args.files} backups, {total_mib:.1f} MiB: {len(results)} kills/deaths in {elapsed:.2f} s"
+            f" ({total_mib / elapsed:,.0f} MiB/s, {args.files / elapsed:,.1f} files/s)"
+        )
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark BountyTracker.inspect_line: keyword gated regexes vs the handle gate in front of them.
+
+    python benchmarks/bench_bounty.py --rounds 10
+"""
+import argparse
+from time import perf_counter
+
+from _common import SAMPLE_LOG, NullModule
+from modules.bounty_tracker import BountyTracker
+
+
+def legacy_inspect(tracker, line):
+    """inspect_line before the handle gate: every keyword hit ran its regexes."""
+    lowered = line.lower()
+    bounties = tracker._registry.index
+    if "lock" in lowered:
+        tracker._try_patterns(line, "lock", tracker._LOCK_PATTERNS, bounties)
+    if "scan" in lowered:
+        tracker._try_patterns(line, "scan", tracker._SCAN_PATTERNS, bounties)
+    if any(trigger in lowered for trigger in ("detect", "tracking", "radar contact")):
+        tracker._try_patterns(line, "detect", tracker._DETECT_PATTERNS, bounties)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with open(SAMPLE_LOG, "r", errors="replace") as sc_log:
+        game_lines = sc_log.readlines()
+    # Long chatty lines that mention a keyword but no bounty, the worst case for the .*? patterns
+    noisy_line = (
+        "<2025-10-15T20:24:35.039Z> [Notice] <Net> Scanning " + " ".join(f"'entity_{i}'" for i in range(200))
+        + " target lock lost, detect tracking reset\n"
+    )
+    workloads = (("Game.log", game_lines * args.rounds), ("noisy lines", [noisy_line] * 2000 * args.rounds))
+
+    tracker = BountyTracker(NullModule(), None)
+    for name, lines in workloads:
+        for label, inspect in (("legacy", lambda line: legacy_inspect(tracker, line)), ("gated", tracker.inspect_line)):
+            start = perf_counter()
+            for line in lines:
+                inspect(line)
+            elapsed = perf_counter() - start
+            print(f"{name:<12} {label:<7} {elapsed:8.3f} s {len(lines) / elapsed:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark the data map refresh: nested list diff vs hashed diff, full vs conditional download.
+
+    python benchmarks/bench_data_map.py --entries 5000 --refreshes 20
+"""
+import argparse
+import itertools
+import os
+import tempfile
+from time import perf_counter
+
+from _common import NullLogger, NullModule
+from modules.api_client import API_Client
+from modules.sc_data_cache import diff_sc_data
+from tools.stub_servitor import start_stub_servitor
+
+
+def legacy_diff(old, new):
+    """The two filterfalse passes get_data_map used before, O(n*m)."""
+    return list(itertools.filterfalse(lambda x: x in old, new)) + list(itertools.filterfalse(lambda x: x in new, old))
+
+
+def make_entries(count):
+    return [{"id": f"MANU_Weapon_{i}", "name": f"Weapon {i}"} for i in range(count)]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--entries", type=int, default=5000)
+    arg_parser.add_argument("--refreshes", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    old = make_entries(args.entries)
+    new = old[:-5] + make_entries(args.entries + 5)[-5:]
+    for name, diff in (("filterfalse diff", legacy_diff), ("hashed diff", lambda a, b: sum(diff_sc_data(a, b), []))):
+        start = perf_counter()
+        changes = diff(old, new)
+        print(f"{name:<20} {(perf_counter() - start) * 1000:>10.1f} ms  ({len(changes)} changed entries)")
+
+    os.chdir(tempfile.mkdtemp(prefix="bench_data_map_"))
+    server = start_stub_servitor()
+    server.data_maps["weapons"] = old
+    api = API_Client(NullModule(), NullModule(), {"active": True}, "bench", {"current": "SIIIN"})
+    api.log = NullLogger()
+    api.api_key["value"] = "benchmark"
+    api.api_fqdn = f"http://127.0.0.1:{server.server_port}"
+
+    api.get_data_map("weapons")
+    start = perf_counter()
+    for _ in range(args.refreshes):
+        api.get_data_map("weapons")
+    elapsed = perf_counter() - start
+    print(
+        f"{'conditional refresh':<20} {elapsed / args.refreshes * 1000:>10.1f} ms  "
+        f"({server.stats.not_modified} of {args.refreshes} answered 304)"
+    )
+    api.sc_data_cache.validators = lambda data_type: {}
+    start = perf_counter()
+    for _ in range(args.refreshes):
+        api.get_data_map("weapons")
+    elapsed = perf_counter() - start
+    print(f"{'full refresh':<20} {elapsed / args.refreshes * 1000:>10.1f} ms")
+
+    start = perf_counter()
+    API_Client(NullModule(), NullModule(), {"active": True}, "bench", {"current": "SIIIN"})
+    print(f"{'startup from cache':<20} {(perf_counter() - start) * 1000:>10.1f} ms  ({args.entries} weapons ready)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark routing Game.log lines to parser handlers: substring cascade vs <Tag> dispatch table.
+
+    python benchmarks/bench_dispatch.py --rounds 20
+"""
+import argparse
+from time import perf_counter
+
+from _common import SAMPLE_LOG, make_parser
+
+
+def legacy_route(parser, line):
+    """The substring cascade read_log_line used before the dispatch table."""
+    if "<Vehicle Control Flow>" in line:
+        if (
+            ("CVehicleMovementBase::SetDriver:" in line and "requesting control token for" in line) or
+            ("CVehicle::Initialize::<lambda_1>::operator ():" in line and "granted control token for" in line)
+        ):
+            return "vehicle_control_flow"
+        if (
+            ("CVehicleMovementBase::ClearDriver:" in line and "releasing control token for" in line) or
+            ("losing control token for" in line)
+        ):
+            return "vehicle_control_flow"
+    if "<Context Establisher Done>" in line:
+        return "context_established"
+    elif "CPlayerShipRespawnManager::OnVehicleSpawned" in line and (
+            "SC_Default" != parser.game_mode) and (parser.player_geid["current"] in line):
+        return "vehicle_spawned"
+    elif ("<Vehicle Destruction>" in line or
+        "<local client>: Entering control state dead" in line) and (
+            parser.active_ship_id in line):
+        return "vehicle_destruction"
+    elif parser.rsi_handle["current"] in line:
+        if "OnEntityEnterZone" in line:
+            return "entity_enter_zone"
+        if "CActor::Kill" in line:
+            return "actor_death"
+    elif "<Jump Drive State Changed>" in line:
+        return "jump_drive_state_changed"
+    return None
+
+
+def time_routing(name, route, lines, rounds):
+    start = perf_counter()
+    routed = 0
+    for _ in range(rounds):
+        for line in lines:
+            if route(line) is not None:
+                routed += 1
+    elapsed = perf_counter() - start
+    total = len(lines) * rounds
+    print(f"{name:<22} {total / elapsed:>14,.0f} lines/s  ({routed // rounds} routed per pass)")
+    return total / elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rounds", type=int, default=20, help="passes over the sample log")
+    args = arg_parser.parse_args()
+
+    with open(SAMPLE_LOG, "r", encoding="utf-8", errors="replace") as f:
+        lines = f.readlines()
+    parser = make_parser()
+
+    legacy = time_routing("substring cascade", lambda line: legacy_route(parser, line), lines, args.rounds)
+    tagged = time_routing("tag dispatch table", parser.route_log_line, lines, args.rounds)
+    print(f"speedup: {tagged / legacy:.2f}x")
+
+    start = perf_counter()
+    for _ in range(args.rounds):
+        for line in lines:
+            parser.read_log_line(line, False)
+    elapsed = perf_counter() - start
+    print(f"{'read_log_line (replay)':<22} {len(lines) * args.rounds / elapsed:>14,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
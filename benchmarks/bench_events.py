@@ -0,0 +1,66 @@
+"""Benchmark kill records: nested result dicts vs __slots__ events, and buffer deduplication.
+
+    python benchmarks/bench_events.py --events 20000
+"""
+import argparse
+import tracemalloc
+from time import perf_counter
+
+import _common  # noqa: F401  (puts the repo on sys.path)
+from modules.cfg_handler import Cfg_Handler
+from modules.log_events import KillEvent
+
+
+def make_dict(i):
+    """The {"result": ..., "data": {...}} record parse_kill_line used to build."""
+    return {"result": "killer", "data": {
+        "player": "SIIIN", "killers_ship": "AEGS_Gladius", "victim": f"Victim_{i}", "time": "<2025-10-15T20:24:35.039Z>",
+        "zone": "ANVL_Hornet_F7A_Mk2_1", "weapon": "KLWE_LaserRepeater_S3", "rsi_profile": f"https://robertsspaceindustries.com/citizens/Victim_{i}",
+        "game_mode": "SC_Default", "client_ver": "1.6", "anonymize_state": {"enabled": False},
+    }}
+
+
+def make_event(i):
+    return KillEvent(
+        "SIIIN", "AEGS_Gladius", f"Victim_{i}", "<2025-10-15T20:24:35.039Z>", "ANVL_Hornet_F7A_Mk2_1",
+        "KLWE_LaserRepeater_S3", "SC_Default", "1.6", False,
+    )
+
+
+def measure(factory, count):
+    tracemalloc.start()
+    start = perf_counter()
+    records = [factory(i) for i in range(count)]
+    elapsed = perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return records, elapsed, size
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--events", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    for name, factory in (("dict", make_dict), ("KillEvent", make_event)):
+        _, elapsed, size = measure(factory, args.events)
+        print(f"{name:<10} build {elapsed * 1000:8.1f} ms  {size / args.events:8.0f} bytes/event")
+
+    records = [make_dict(i) for i in range(args.events)]
+    start = perf_counter()
+    buffer = []
+    for kill_result in records:
+        pickle_payload = {"kill_result": kill_result, "endpoint": "reportKill"}
+        if pickle_payload not in buffer:
+            buffer.append(pickle_payload)
+    print(f"{'list in':<10} dedup {perf_counter() - start:8.3f} s")
+
+    cfg_handler = Cfg_Handler({"enabled": True}, {"active": True}, {"current": "SIIIN"})
+    start = perf_counter()
+    for kill_result in records:
+        cfg_handler.add_pickle(kill_result, "reportKill")
+    print(f"{'key set':<10} dedup {perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
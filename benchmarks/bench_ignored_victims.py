@@ -0,0 +1,42 @@
+"""Benchmark check_ignored_victims: per-rule lowercase scan vs the compiled IgnoredVictimMatcher.
+
+    python benchmarks/bench_ignored_victims.py --rules 300
+"""
+import argparse
+from time import perf_counter
+
+from _common import SAMPLE_LOG
+from modules.sc_data_index import IgnoredVictimMatcher
+
+
+def legacy_check(rules, line):
+    """The loop check_ignored_victims ran before: lowercase the line once per rule."""
+    for data in rules:
+        if data["value"].lower() in line.lower():
+            return True
+    return False
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rules", type=int, default=100, help="number of ignoredVictimRules")
+    arg_parser.add_argument("--rounds", type=int, default=5000)
+    args = arg_parser.parse_args()
+
+    rules = [{"value": f"PU_Human_Enemy_GroundCombat_NPC_Type{i}"} for i in range(args.rules)]
+    rules.append({"value": "NPC_Archetypes"})
+    with open(SAMPLE_LOG, "r", errors="replace") as sc_log:
+        lines = [line for line in sc_log if "CActor::Kill" in line] * args.rounds
+
+    start = perf_counter()
+    matcher = IgnoredVictimMatcher(rules)
+    print(f"build    {(perf_counter() - start) * 1000:8.2f} ms for {len(rules)} rules")
+    for name, check in (("per rule", lambda line: legacy_check(rules, line)), ("matcher", lambda line: matcher.match(line) is not None)):
+        start = perf_counter()
+        ignored = sum(check(line) for line in lines)
+        elapsed = perf_counter() - start
+        print(f"{name:<8} {elapsed:8.3f} s {len(lines) / elapsed:>12,.0f} lines/s  {ignored} ignored")
+
+
+if __name__ == "__main__":
+    main()
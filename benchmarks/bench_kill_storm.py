@@ -0,0 +1,87 @@
+"""Benchmark a kill storm against the local stub Servitor: one post per kill vs coalesced batches.
+
+    python benchmarks/bench_kill_storm.py --kills 500 --latency 20
+"""
+import argparse
+from time import perf_counter, sleep
+
+from _common import NullLogger, NullModule
+from modules.api_client import API_Client
+from modules.kill_batcher import KillBatcher
+from modules.log_events import KillEvent
+from tools.stub_servitor import start_stub_servitor
+
+
+def make_kill(i):
+    return KillEvent(
+        "SIIIN", "AEGS_Gladius", f"Victim_{i}", "<2025-10-15T20:24:35.039Z>", "ANVL_Hornet_F7A_Mk2_1",
+        "KLWE_LaserRepeater_S3", "SC_Default", "bench", False,
+    )
+
+
+def make_api(server):
+    api = API_Client(NullModule(), NullModule(), {"active": True}, "bench", {"current": "SIIIN"})
+    api.log = NullLogger()
+    api.api_key["value"] = "benchmark"
+    api.api_fqdn = f"http://127.0.0.1:{server.server_port}"
+    return api
+
+
+def storm(name, server, enqueue, kills, burst, pause):
+    """Fire ``kills`` kills in bursts and wait until the stub has received all of them."""
+    stats = server.stats
+    requests_before, kills_before = stats.requests, stats.kills
+    start = perf_counter()
+    for i in range(kills):
+        enqueue(make_kill(i))
+        if burst and (i + 1) % burst == 0:
+            sleep(pause)
+    while stats.kills - kills_before < kills:
+        sleep(0.001)
+    elapsed = perf_counter() - start
+    requests = stats.requests - requests_before
+    print(
+        f"{name:<18} {elapsed:>7.2f} s  {requests:>6} requests  {requests / elapsed:>9,.1f} req/s  "
+        f"{kills / elapsed:>9,.1f} kills/s"
+    )
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--kills", type=int, default=500)
+    arg_parser.add_argument("--latency", type=float, default=20, help="stub milliseconds per POST")
+    arg_parser.add_argument("--burst", type=int, default=10, help="kills logged back to back before a pause")
+    arg_parser.add_argument("--pause", type=float, default=0.05, help="seconds between bursts")
+    arg_parser.add_argument("--window", type=float, default=0.5)
+    arg_parser.add_argument("--max-batch", type=int, default=25)
+    args = arg_parser.parse_args()
+
+    server = start_stub_servitor(latency_ms=args.latency)
+    api = make_api(server)
+
+    # A one kill batch goes out as a normal single post
+    single_poster = KillBatcher(api, window=0, max_batch=1, maxsize=args.kills)
+    single = storm(
+        "single posts", server, lambda kill: single_poster.add(kill, "reportKill"),
+        args.kills, args.burst, args.pause,
+    )
+    batcher = KillBatcher(api, window=args.window, max_batch=args.max_batch, maxsize=args.kills)
+    batched = storm(
+        "batched posts", server, lambda kill: batcher.add(kill, "reportKill"),
+        args.kills, args.burst, args.pause,
+    )
+    print(f"batcher: {batcher.summary()}")
+    print(f"speedup: {single / batched:.2f}x")
+
+    server.accept_batches = False
+    api.kill_batch_unsupported_until = 0.0
+    storm(
+        "batch rejected", server, lambda kill: batcher.add(kill, "reportKill"),
+        min(args.kills, 100), args.burst, args.pause,
+    )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark buffering kills during an outage: config pickle list vs the append-only outbox.
+
+Measures how fast failed kills can be buffered, how long reopening a backlog
+takes after a restart, and how long the backlog takes to drain to the local
+stub Servitor once it is reachable again.
+
+    python benchmarks/bench_outbox.py --kills 2000
+"""
+import argparse
+import os
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter, sleep
+
+from _common import NullLogger, NullModule
+from modules.api_client import API_Client
+from modules.cfg_handler import Cfg_Handler
+from modules.outbox import KillOutbox
+from tools.stub_servitor import start_stub_servitor
+
+
+def make_kill(i):
+    return {"result": "killer", "data": {
+        "player": "SIIIN", "killers_ship": "AEGS_Gladius", "victim": f"Victim_{i}", "time": "<2025-10-15T20:24:35.039Z>",
+        "zone": "ANVL_Hornet_F7A_Mk2_1", "weapon": "KLWE_LaserRepeater_S3", "rsi_profile": f"https://robertsspaceindustries.com/citizens/Victim_{i}",
+        "game_mode": "SC_Default", "client_ver": "bench", "anonymize_state": {"enabled": False},
+    }}
+
+
+def make_cfg_handler(program_state, monitoring):
+    cfg_handler = Cfg_Handler(program_state, monitoring, {"current": "SIIIN"})
+    cfg_handler.log = NullLogger()
+    cfg_handler._set_cfg_vars()
+    return cfg_handler
+
+
+def bench_config_buffer(kills):
+    """The previous buffer: a list inside the encrypted config, saved whole after every failed kill."""
+    cfg_handler = make_cfg_handler({"enabled": True}, {"active": True})
+    buffer = []
+    start = perf_counter()
+    for i in range(kills):
+        pickle_payload = {"kill_result": make_kill(i), "endpoint": "reportKill"}
+        if pickle_payload not in buffer:
+            buffer.append(pickle_payload)
+        cfg_handler.save_cfg("pickle", buffer)
+    return perf_counter() - start
+
+
+def bench_outbox_add(path, kills, sync_batch):
+    outbox = KillOutbox(sync_batch=sync_batch)
+    outbox.open(path)
+    start = perf_counter()
+    for i in range(kills):
+        outbox.add(make_kill(i), "reportKill")
+    outbox.sync()
+    elapsed = perf_counter() - start
+    outbox.close()
+    return elapsed
+
+
+def bench_drain(kills, latency):
+    """Start with ``kills`` waiting in the outbox and time until the stub Servitor has all of them."""
+    server = start_stub_servitor(latency_ms=latency)
+    program_state, monitoring = {"enabled": True}, {"active": True}
+    cfg_handler = make_cfg_handler(program_state, monitoring)
+    for i in range(kills):
+        cfg_handler.add_pickle(make_kill(i), "reportKill")
+    api = API_Client(cfg_handler, NullModule(), monitoring, "bench", {"current": "SIIIN"})
+    api.log = NullLogger()
+    api.api_key["value"] = "benchmark"
+    api.api_fqdn = f"http://127.0.0.1:{server.server_port}"
+    api.connection_healthy = True
+    cfg_handler.api = api
+    start = perf_counter()
+    drain = threading.Thread(target=cfg_handler.drain_outbox, daemon=True)
+    drain.start()
+    while len(cfg_handler.outbox):
+        sleep(0.005)
+    elapsed = perf_counter() - start
+    program_state["enabled"] = False
+    drain.join()
+    server.shutdown()
+    return elapsed, server.stats.requests
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--kills", type=int, default=2000)
+    arg_parser.add_argument("--config-kills", type=int, default=200, help="kills for the config buffer, it is quadratic")
+    arg_parser.add_argument("--latency", type=float, default=20, help="stub milliseconds per POST")
+    args = arg_parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_outbox_")
+    os.chdir(workdir)
+    journal = Path(workdir) / "outbox.jsonl"
+
+    elapsed = bench_config_buffer(args.config_kills)
+    print(f"{'config buffer':<22} {args.config_kills / elapsed:>10,.0f} kills/s  ({args.config_kills} kills)")
+    for name, sync_batch in (("outbox, fsync each", 1), ("outbox, fsync batched", 64)):
+        if journal.exists():
+            journal.unlink()
+        elapsed = bench_outbox_add(journal, args.kills, sync_batch)
+        print(f"{name:<22} {args.kills / elapsed:>10,.0f} kills/s  ({args.kills} kills)")
+
+    start = perf_counter()
+    outbox = KillOutbox()
+    outbox.open(journal)
+    print(f"{'reopen backlog':<22} {(perf_counter() - start) * 1000:>10.1f} ms     ({len(outbox)} kills waiting)")
+    outbox.close()
+
+    elapsed, requests = bench_drain(args.kills, args.latency)
+    print(f"{'drain backlog':<22} {elapsed:>10.2f} s      ({requests} requests, the config pickler sent one kill per minute: {args.kills} min)")
+
+
+if __name__ == "__main__":
+    main()
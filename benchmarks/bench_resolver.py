@@ -0,0 +1,61 @@
+"""Benchmark weapon name lookups: linear substring scan vs the NameResolver trie.
+
+    python benchmarks/bench_resolver.py --entries 5000
+"""
+import argparse
+import random
+from time import perf_counter
+
+import _common  # noqa: F401  (puts the repo on sys.path)
+from modules.sc_data_index import NameResolver
+
+
+def linear_lookup(entries, data_id):
+    """The scan get_sc_data did before the resolver: first listed id contained in the raw id."""
+    for data in entries:
+        if data["id"] in data_id:
+            return data["name"]
+    return None
+
+
+def make_entries(count):
+    manufacturers = ["KLWE", "BEHR", "GATS", "ESPR", "AMRS", "MXOX", "APAR", "KSAR", "HRST", "VOLT"]
+    kinds = ["LaserRepeater", "BallisticCannon", "LaserCannon", "DistortionRepeater", "Rifle", "SMG", "Pistol"]
+    entries = []
+    for i in range(count):
+        data_id = f"{manufacturers[i % len(manufacturers)]}_{kinds[i % len(kinds)]}_S{i % 10}_{i}"
+        entries.append({"id": data_id, "name": f"Weapon {i}"})
+    return entries
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--entries", type=int, default=2000, help="size of the weapons data map")
+    arg_parser.add_argument("--lookups", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    entries = make_entries(args.entries)
+    rng = random.Random(1)
+    # Raw log ids carry an entity id suffix, a few are unknown to Servitor
+    raw_ids = [
+        f"{rng.choice(entries)['id']}_{rng.randrange(10 ** 12)}" if rng.random() > 0.05 else f"UNKN_Thing_{rng.randrange(100)}"
+        for _ in range(args.lookups)
+    ]
+
+    start = perf_counter()
+    resolver = NameResolver(entries)
+    print(f"build       {(perf_counter() - start) * 1000:8.1f} ms for {args.entries} entries")
+
+    start = perf_counter()
+    linear = [linear_lookup(entries, raw_id) for raw_id in raw_ids]
+    linear_time = perf_counter() - start
+    start = perf_counter()
+    indexed = [resolver.resolve(raw_id) for raw_id in raw_ids]
+    indexed_time = perf_counter() - start
+    mismatches = sum(a != b for a, b in zip(linear, indexed))
+    print(f"linear scan {linear_time:8.3f} s {args.lookups / linear_time:>12,.0f} lookups/s")
+    print(f"resolver    {indexed_time:8.3f} s {args.lookups / indexed_time:>12,.0f} lookups/s  ({mismatches} differ, longest id wins)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark log timestamp parsing: strptime format cascade vs the fixed layout fast path.
+
+    python benchmarks/bench_timestamp.py --rounds 20
+"""
+import argparse
+from datetime import datetime
+from time import perf_counter
+
+from _common import SAMPLE_LOG, make_parser
+
+
+def legacy_extract_timestamp(line):
+    """The strptime cascade _extract_timestamp used before the fast path."""
+    if line.startswith("<") and ">" in line:
+        raw_timestamp = line[1:line.index(">")]
+        cleaned = raw_timestamp.replace("T", " ").strip()
+        for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%H:%M:%S", "%H:%M:%S.%f"):
+            try:
+                return datetime.strptime(cleaned, fmt).strftime("%H:%M:%S")
+            except ValueError:
+                continue
+        try:
+            return datetime.fromisoformat(raw_timestamp).strftime("%H:%M:%S")
+        except ValueError:
+            pass
+    return datetime.now().strftime("%H:%M:%S")
+
+
+def timed(func, lines, rounds) -> float:
+    start = perf_counter()
+    for _ in range(rounds):
+        for line in lines:
+            func(line)
+    return perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rounds", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    parser = make_parser()
+    with open(SAMPLE_LOG, "r", errors="replace") as sc_log:
+        lines = [line for line in sc_log if line.startswith("<20")]
+    mismatches = sum(legacy_extract_timestamp(line) != parser._extract_timestamp(line) for line in lines)
+    print(f"{len(lines)} timestamped lines x {args.rounds} rounds, {mismatches} mismatches")
+
+    total = len(lines) * args.rounds
+    for name, func in (
+        ("strptime", legacy_extract_timestamp),
+        ("fast path", parser._extract_timestamp),
+        ("with epoch", parser.parse_event_time),
+    ):
+        elapsed = timed(func, lines, args.rounds)
+        print(f"{name:<10} {elapsed:8.3f} s {total / elapsed:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
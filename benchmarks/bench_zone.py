@@ -0,0 +1,49 @@
+"""Benchmark ship zone classification: manufacturer startswith loop vs the cached ZoneClassifier.
+
+    python benchmarks/bench_zone.py --lookups 200000
+"""
+import argparse
+import random
+from time import perf_counter
+
+import _common  # noqa: F401  (puts the repo on sys.path)
+from modules.sc_data_index import ZoneClassifier
+
+GLOBAL_SHIP_LIST = [
+    'DRAK', 'ORIG', 'AEGS', 'ANVL', 'CRUS', 'BANU', 'MISC',
+    'KRIG', 'XNAA', 'ARGO', 'VNCL', 'ESPR', 'RSI', 'CNOU',
+    'GRIN', 'TMBL', 'GAMA'
+]
+
+
+def legacy_classify(zone):
+    """The loop set_player_zone ran before."""
+    for x in GLOBAL_SHIP_LIST:
+        if zone.startswith(x):
+            return zone[:zone.rindex('_')], zone[zone.rindex('_') + 1:]
+    return None
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--lookups", type=int, default=200000)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(7)
+    # A session sees the same handful of ships and rooms over and over
+    zones = [f"{code}_Ship_{n}_{rng.randrange(10 ** 12)}" for code in GLOBAL_SHIP_LIST for n in range(3)]
+    zones += [f"Hangar_Room_{n}" for n in range(20)]
+    lookups = [rng.choice(zones) for _ in range(args.lookups)]
+
+    classifier = ZoneClassifier()
+    assert all(legacy_classify(zone) == classifier.classify(zone) for zone in zones)
+    for name, classify in (("startswith", legacy_classify), ("classifier", classifier.classify)):
+        start = perf_counter()
+        for zone in lookups:
+            classify(zone)
+        elapsed = perf_counter() - start
+        print(f"{name:<10} {elapsed:8.3f} s {args.lookups / elapsed:>12,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,7 @@ echo.
 echo [3/3] Building the executable...
 set "exe_name=VoidLedger"
 
-pyinstaller --noconfirm --onefile --windowed --name "%exe_name%" --icon="voidledger.ico" --add-data "static;static" --add-data "sounds;sounds" --add-data "mappings.js;." main.py
+pyinstaller --noconfirm --onefile --windowed --name "%exe_name%" --icon="voidledger.ico" --add-data "static;static" --add-data "sounds;sounds" --add-data "mappings.js;." --add-data "bounty_targets.json;." main.py
 
 if %errorlevel% neq 0 (
     echo BUILD FAILED!
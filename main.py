@@ -4,6 +4,7 @@ from os import path
 from psutil import process_iter
 from threading import Thread
 from queue import Queue
+from multiprocessing import freeze_support
 import warnings
 warnings.filterwarnings("ignore", message="Couldn't find ffmpeg or avconv")
 
@@ -123,11 +124,11 @@ class KillTracker():
                 elif game_running and self.monitoring["active"]:
                     if self.rsi_handle["current"] == "N/A":
                         # Check for current RSI handle if it does not exist
-                        new_handle = self.log_parser.find_rsi_handle()
+                        new_handle, new_geid = self.log_parser.find_rsi_identity()
                         if new_handle != self.rsi_handle["current"] and new_handle != "N/A":
                             self.log.info(f"RSI handle name found and set to {new_handle}.")
                             self.rsi_handle["current"] = new_handle
-                            self.player_geid["current"] = self.log_parser.find_rsi_geid()
+                            self.player_geid["current"] = new_geid
                             self.log.debug(f'Current User GEID is {self.player_geid["current"]}')
                             # Handle any config changes and save them
                             self.cfg_module._set_cfg_vars()
@@ -302,10 +303,10 @@ def main():
             print(f"main(): ERROR in setting up the sounds module: {e.__class__.__name__} {e}")
 
         try:
-            # Kill Tracker log pickler
-            pickler_thr = Thread(target=kt.cfg_module.log_pickler, daemon=True).start()
+            # Upload kills left in the outbox
+            outbox_thr = Thread(target=kt.cfg_module.drain_outbox, daemon=True).start()
         except Exception as e:
-            print(f"main(): ERROR starting log pickler: {e.__class__.__name__} {e}")
+            print(f"main(): ERROR starting kill outbox drain: {e.__class__.__name__} {e}")
 
         try:
              # Kill Tracker monitor loop
@@ -321,8 +322,8 @@ def main():
     except KeyboardInterrupt:
         print("Program interrupted. Exiting gracefully...")
         kt.monitoring["active"] = False
-        if isinstance(pickler_thr, Thread):
-            pickler_thr.join(1)
+        if isinstance(outbox_thr, Thread):
+            outbox_thr.join(1)
         if isinstance(monitor_thr, Thread):
             monitor_thr.join(1)
         gui_module.app.quit()
@@ -330,6 +331,8 @@ def main():
         print(f"main(): ERROR starting GUI main loop: {e.__class__.__name__} {e}")
 
 if __name__ == '__main__':
+    # Needed by the frozen build so backfill worker processes don't start another Kill Tracker
+    freeze_support()
     try:
         main()
     except Exception as e:
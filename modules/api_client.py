@@ -1,12 +1,14 @@
 import requests
 import webbrowser
 from threading import Thread
-from datetime import datetime
-import pytz
-from tzlocal import get_localzone
 from packaging import version
-from time import sleep
-import itertools
+from time import monotonic
+
+from modules.log_events import LogEvent
+from modules.sc_data_index import build_sc_data_index
+from modules.transport import Transport
+from modules.sc_data_cache import ScDataCache, diff_sc_data
+from modules.key_expiry import KeyExpiryScheduler
 
 class API_Client():
     """API client for the Kill Tracker."""
@@ -19,14 +21,25 @@ class API_Client():
         self.monitoring = monitoring
         self.local_version = local_version
         self.rsi_handle = rsi_handle
-        self.request_timeout = 60
+        # Pooled keep-alive session, shared with Commander Mode
+        self.transport = Transport()
+        self.transport.session.hooks["response"].append(self._on_servitor_response)
         self.api_key = {"value": None}
         self.api_fqdn = "http://blightveil.org:25966"
         self.sc_data = {"weapons": [], "ships": [], "ignoredVictimRules": []}
+        # The last good maps from disk, so names resolve before the first refresh
+        self.sc_data_cache = ScDataCache()
+        self.sc_data.update(self.sc_data_cache.load())
+        # Lookup structures rebuilt from sc_data on every refresh, swapped in whole so the tail thread never sees a half built one
+        self.sc_data_index = build_sc_data_index(self.sc_data)
         self.expiration_time = None
         self.countdown_active = False
         self.connection_healthy = False
-        self.countdown_interval = 60
+        self.key_expiry = KeyExpiryScheduler(self)
+        # Servitor builds without batch support reject array payloads, kills are then posted one by one for a while
+        self.kill_batch_rejected_codes = (400, 404, 405, 413, 415, 422)
+        self.kill_batch_retry_interval = 600
+        self.kill_batch_unsupported_until = 0.0
         self.key_status_valid_color = "#04B431"
         self.key_status_invalid_color = "red"
 
@@ -41,10 +54,10 @@ class API_Client():
         try:
             github_api_url = "https://api.github.com/repos/BlightVeil/Killtracker/releases/latest"
             headers = {'User-Agent': f'Killtracker/{self.local_version}'}
-            response = requests.get(
-                github_api_url, 
-                headers=headers, 
-                timeout=self.request_timeout
+            response = self.transport.get(
+                github_api_url,
+                kind="update",
+                headers=headers
             )
             if response.status_code == 200:
                 release_data = response.json()
@@ -89,11 +102,11 @@ class API_Client():
                 "player_name": self.rsi_handle["current"]
             }
             self.log.debug(f"validate_api_key(): Request payload: {api_key_data}")
-            response = requests.post(
-                url, 
+            response = self.transport.post(
+                url,
+                kind="key",
                 headers=headers, 
-                json=api_key_data, 
-                timeout=self.request_timeout
+                json=api_key_data
             )
             self.log.debug(f"validate_api_key(): Response text: {response.text}")
             if response.status_code != 200:
@@ -136,6 +149,9 @@ class API_Client():
                         self.countdown_active = True
                         thr = Thread(target=self.start_api_key_countdown, daemon=True)
                         thr.start()
+                    else:
+                        # The running countdown still counts down to the previous key, fetch this one's expiry now
+                        self.key_expiry.revalidate_soon()
                 else:
                     self.log.error("Invalid key. Please enter a valid key from Discord.")
                     self.api_key["value"] = None
@@ -158,11 +174,11 @@ class API_Client():
                 "player_name": self.rsi_handle["current"]
             }
             self.log.debug(f"post_api_key_expiration_time(): Request payload: {api_key_exp_time}")
-            response = requests.post(
-                url, 
+            response = self.transport.post(
+                url,
+                kind="key",
                 headers=headers, 
-                json=api_key_exp_time, 
-                timeout=self.request_timeout
+                json=api_key_exp_time
             )
             self.log.debug(f"post_api_key_expiration_time(): Response text: {response.text}")
             if response.status_code == 200:
@@ -189,89 +205,13 @@ class API_Client():
         return "error"
 
     def start_api_key_countdown(self) -> None:
-        """Start the countdown for the API key's expiration, refreshing expiry data periodically."""
-        def stop_countdown():
-            if self.cm:
-                self.cm.stop_heartbeat_threads()
-            self.api_key["value"] = None
-            self.monitoring["active"] = False
-            self.gui.api_status_label.config(text="Key Status: Expired", fg=self.key_status_invalid_color)
-            self.countdown_active = False
-
-        server_tz = pytz.timezone('US/Mountain')
-        local_tz = get_localzone()
-
-        while self.countdown_active:
-            try:
-                if not self.api_key["value"]:
-                    raise Exception("Request to get the expiration time will not be sent because the API key does not exist.")
-                if self.rsi_handle["current"] == "N/A":
-                    self.log.debug("start_api_key_countdown(): RSI handle name does not exist. Game was closed?")
-                    continue
-
-                # Get the expiration time from the server (already returned in UTC)
-                post_key_exp_result = self.post_api_key_expiration_time()
-                if post_key_exp_result == "error":
-                    self.log.warning("Failed to get the key expiration time. Continuing anyway ...")
-                elif post_key_exp_result == "invalidated":
-                    self.cfg_handler.save_cfg("key", "")
-                    self.log.error("Key has been invalidated by Servitor. Please get a new key or speak with a BlightVeil admin.")
-                    stop_countdown()
-                    continue # Skip further calculations if invalidated
-                # Expiration time was returned
-                else:
-                    expiration_time = datetime.strptime(post_key_exp_result, "%Y-%m-%dT%H:%M:%S.%fZ")
-                    expiration_time = expiration_time.replace(tzinfo=local_tz)
-                    now = datetime.now(server_tz)
-
-                    # Check if the key has expired
-                    if now > expiration_time:
-                        self.log.error(f"Key expired. Please enter a new Kill Tracker key.")
-                        self.cfg_handler.save_cfg("key", "")
-                        stop_countdown()
-                        continue # Skip further calculations if expired
-
-                    # Calculate the remaining time
-                    remaining_time = expiration_time - now
-                    total_seconds = int(remaining_time.total_seconds())
+        """Count down to the API key's expiration, refreshing SC data periodically."""
+        self.key_expiry.run()
 
-                    # Debugging output
-                    self.log.debug(f"Expiration Time: {expiration_time}")
-                    self.log.debug(f"Current Time (now): {now}")
-                    self.log.debug(f"Remaining Time: {remaining_time}")
-                    self.log.debug(f"Total Seconds Remaining: {total_seconds}")
-
-                    # Break the total seconds into days, hours, minutes, and seconds
-                    days, remainder = divmod(total_seconds, 86400)
-                    hours, remainder = divmod(remainder, 3600)
-                    minutes, seconds = divmod(remainder, 60)
-
-                    # Building the countdown text
-                    if total_seconds > 0:
-                        if days > 0:
-                            countdown_text = f"Key Status: Valid (Expires in {days} days)"
-                        elif hours > 0:
-                            countdown_text = f"Key Status: Valid (Expires in {hours} hours {minutes} minutes)"
-                        else:
-                            countdown_text = f"Key Status: Valid (Expires in {minutes} minutes {seconds} seconds)"
-                        self.gui.api_status_label.config(text=countdown_text, fg=self.key_status_valid_color)
-                        self.cfg_handler.save_cfg("key", self.api_key["value"])
-                        # Update local SC data
-                        self.log.debug("Pulling SC data mappings from Servitor.")
-                        self.get_data_map("weapons")
-                        sleep(1)
-                        #self.get_data_map("ships") # NOT NEEDED ATM
-                        #sleep(1)
-                        self.get_data_map("ignoredVictimRules")
-                        sleep(1)
-                    else:
-                        self.log.error(f"Key expired. Please enter a new Kill Tracker key.")
-                        self.cfg_handler.save_cfg("key", "")
-                        stop_countdown()
-            except Exception as e:
-                self.log.error(f"General error in key expiration countdown: {e.__class__.__name__} {e}")
-            finally:
-                sleep(self.countdown_interval)
+    def _on_servitor_response(self, response, *args, **kwargs) -> None:
+        """Have the key validated again as soon as any Servitor call gets refused with a 403."""
+        if response.status_code == 403 and response.url.startswith(self.api_fqdn) and self.countdown_active:
+            self.key_expiry.revalidate_soon()
         
 #########################################################################################################
 ### LOG PARSER API                                                                                    ###
@@ -286,26 +226,32 @@ class API_Client():
             
             url = f"{self.api_fqdn}/api/server/data/{data_type}"
             headers = {
-                'Authorization': self.api_key["value"] if self.api_key["value"] else ""
+                'Authorization': self.api_key["value"] if self.api_key["value"] else "",
+                **self.sc_data_cache.validators(data_type)
             }
             self.log.debug(f"get_data_map(): Requesting data for {data_type} from Servitor.")
-            response = requests.get(
-                url, 
-                headers=headers, 
-                timeout=self.request_timeout
+            response = self.transport.get(
+                url,
+                kind="data",
+                headers=headers
             )
-            if response.status_code == 200:
+            if response.status_code == 304:
+                self.connection_healthy = True
+                self.log.debug(f"get_data_map(): Local SC data for {data_type} is the same as Servitor (not modified).")
+            elif response.status_code == 200:
                 self.connection_healthy = True
                 self.log.debug(f'{data_type} data has been downloaded from Servitor.')
                 # Merge incoming SC data into new dict
                 server_data = response.json()[data_type]
-                diff = list(itertools.filterfalse(lambda x: x in self.sc_data[data_type], server_data)) + list(itertools.filterfalse(lambda x: x in server_data, self.sc_data[data_type]))
-                if len(diff) > 0:
+                added, removed = diff_sc_data(self.sc_data.get(data_type, []), server_data)
+                if added or removed:
                     self.log.debug(f"get_data_map(): Local SC data for the Kill Tracker differs from Servitor data. Updating local data for {data_type}")
-                    self.log.debug(f'get_data_map(): Diff for {data_type} data: {diff}')
+                    self.log.debug(f'get_data_map(): Diff for {data_type} data: {added + removed}')
                     self.sc_data[data_type] = server_data
+                    self.index_sc_data(data_type)
                 else:
                     self.log.debug(f"get_data_map(): Local SC data for {data_type} is the same as Servitor.")
+                self.sc_data_cache.store(data_type, self.sc_data[data_type], response.headers.get("ETag"), response.headers.get("Last-Modified"))
             else:
                 self.log.error(f"{response.status_code} Error when pulling data for {data_type}.")
                 self.connection_healthy = False
@@ -316,8 +262,14 @@ class API_Client():
             self.log.error(f"get_data_map(): {e.__class__.__name__} {e}")
             self.connection_healthy = False
 
-    def post_kill_event(self, kill_result: dict, endpoint: str) -> bool:
-        """Post the kill parsed from the log."""
+    def index_sc_data(self, data_type: str) -> None:
+        """Rebuild the lookup structure for freshly pulled SC data."""
+        self.sc_data_index = {**self.sc_data_index, **build_sc_data_index(self.sc_data, data_type)}
+
+    def post_kill_event(self, kill_result, endpoint: str) -> bool:
+        """Post the kill parsed from the log. Takes a LogEvent or a {"result": ..., "data": ...} dict."""
+        if isinstance(kill_result, LogEvent):
+            kill_result = kill_result.to_dict()
         try:
             if not self.api_key["value"]:
                 self.log.error("Kill event will not be sent because the key does not exist. Please enter a valid Kill Tracker key to establish connection with Servitor...")
@@ -329,11 +281,11 @@ class API_Client():
                 'Authorization': self.api_key["value"] if self.api_key["value"] else ""
             }
             self.log.debug(f"post_kill_event(): Sending to API {endpoint} the payload: {kill_result['data']}")
-            response = requests.post(
-                url, 
+            response = self.transport.post(
+                url,
+                kind="kill",
                 headers=headers, 
-                json=kill_result["data"], 
-                timeout=self.request_timeout
+                json=kill_result["data"]
             )
             self.log.debug(f"post_kill_event(): Response text: {response.text}")
             if response.status_code == 200:
@@ -350,8 +302,51 @@ class API_Client():
         # Failure state
         self.log.error(f"Kill event will not be sent! Event dump: {kill_result}")
         self.connection_healthy = False
-        pickle_payload = {"kill_result": kill_result, "endpoint": endpoint}
-        if pickle_payload not in self.cfg_handler.cfg_dict["pickle"]:
-            self.cfg_handler.cfg_dict["pickle"].append(pickle_payload)
+        if self.cfg_handler.add_pickle(kill_result, endpoint):
             self.log.warning(f'Connection seems to be unhealthy. Pickling kill.')
         return False
+
+    def post_kill_batch(self, kill_results: list, endpoint: str) -> list:
+        """Post several kills for the same endpoint as one JSON array. Returns the kills that were uploaded."""
+        kill_results = [k.to_dict() if isinstance(k, LogEvent) else k for k in kill_results]
+        if len(kill_results) == 1 or monotonic() < self.kill_batch_unsupported_until:
+            return [kill_result for kill_result in kill_results if self.post_kill_event(kill_result, endpoint)]
+        try:
+            if not self.api_key["value"]:
+                self.log.error("Kill events will not be sent because the key does not exist. Please enter a valid Kill Tracker key to establish connection with Servitor...")
+                return []
+
+            url = f"{self.api_fqdn}/{endpoint}"
+            headers = {
+                'content-type': 'application/json',
+                'Authorization': self.api_key["value"] if self.api_key["value"] else ""
+            }
+            self.log.debug(f"post_kill_batch(): Sending {len(kill_results)} kills to API {endpoint}.")
+            response = self.transport.post(
+                url,
+                kind="kill",
+                headers=headers,
+                json=[kill_result["data"] for kill_result in kill_results]
+            )
+            self.log.debug(f"post_kill_batch(): Response text: {response.text}")
+            if response.status_code == 200:
+                self.connection_healthy = True
+                for kill_result in kill_results:
+                    self.log.success(f'Kill of {kill_result["data"]["victim"]} by {kill_result["data"]["player"]} has been posted to Servitor!')
+                return kill_results
+            if response.status_code in self.kill_batch_rejected_codes:
+                self.log.warning(f"post_kill_batch(): Servitor rejected the batch with code {response.status_code}, posting the kills one by one.")
+                self.kill_batch_unsupported_until = monotonic() + self.kill_batch_retry_interval
+                return [kill_result for kill_result in kill_results if self.post_kill_event(kill_result, endpoint)]
+            self.log.error(f"Error when posting kill batch: code {response.status_code}")
+        except requests.exceptions.RequestException as e:
+            self.gui.async_loading_animation()
+            self.log.error(f"HTTP Error sending kill batch: {e}")
+        except Exception as e:
+            self.log.error(f"post_kill_batch(): {e.__class__.__name__} {e}")
+        # Failure state, the whole batch waits in the buffer
+        self.connection_healthy = False
+        pickled = sum(1 for kill_result in kill_results if self.cfg_handler.add_pickle(kill_result, endpoint))
+        if pickled:
+            self.log.warning(f'Connection seems to be unhealthy. Pickling {pickled} kills.')
+        return []
@@ -0,0 +1,128 @@
+"""Continental bounty targets, loaded from bounty_targets.json and reloaded when the file changes."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+import modules.helpers as Helpers
+
+
+class BountyRegistry:
+    """Read-only index of bounty targets: normalized handle -> (canonical handle, requirement).
+
+    The targets file maps each RSI handle to its special requirement, or null
+    when there is none. A ``bounty_targets.json`` next to the executable takes
+    precedence over the bundled one, so the list can be updated without a new
+    build. The file is checked for changes at most every ``check_interval``
+    seconds on access; a changed file is parsed into a new immutable index that
+    replaces the old one in a single assignment, so readers on other threads
+    always see either the old or the new list in full.
+    """
+
+    file_name = "bounty_targets.json"
+
+    def __init__(self, targets_path: Optional[Path] = None, check_interval: float = 5.0) -> None:
+        self.log = None
+        self.targets_path = targets_path
+        self.check_interval = check_interval
+        self._index: Mapping[str, Tuple[str, str]] = MappingProxyType({})
+        self._loaded_from = None
+        self._next_check = 0.0
+        self._last_error = None
+        self._unreported_error = None
+        self._reload_lock = Lock()
+
+    def set_logger(self, logger) -> None:
+        """Attach the application logger and hand it a load error from before it existed."""
+        self.log = logger
+        if self._unreported_error:
+            self.log.error(self._unreported_error)
+            self._unreported_error = None
+
+    @property
+    def index(self) -> Mapping[str, Tuple[str, str]]:
+        """The current index, reloaded first if the targets file changed."""
+        if monotonic() >= self._next_check:
+            self.refresh()
+        return self._index
+
+    def lookup(self, handle: str) -> Optional[Tuple[str, str]]:
+        """Get (canonical handle, requirement) of a bounty target, None if the handle is not listed."""
+        return self.index.get(self.normalize(handle))
+
+    @staticmethod
+    def normalize(handle: str) -> str:
+        cleaned = handle.strip().strip("'\"")
+        if "[" in cleaned:
+            cleaned = cleaned.split("[", 1)[0]
+        return cleaned.lower()
+
+    def _find_targets_file(self) -> Path:
+        if self.targets_path:
+            return self.targets_path
+        override = Path.cwd() / self.file_name
+        if override.is_file():
+            return override
+        bundled = Path(Helpers.resource_path(self.file_name))
+        if bundled.is_file():
+            return bundled
+        # Running from source with another working directory
+        return Path(__file__).resolve().parent.parent / self.file_name
+
+    def refresh(self) -> None:
+        """Reload the targets if the file (or the file in use) changed since the last load."""
+        # Only the very first load is waited for, later ones keep serving the current index meanwhile
+        if not self._reload_lock.acquire(blocking=self._loaded_from is None):
+            return
+        try:
+            self._next_check = monotonic() + self.check_interval
+            targets_file = self._find_targets_file()
+            try:
+                file_stat = os.stat(targets_file)
+            except OSError as e:
+                self._report(f"refresh(): Bounty targets file {targets_file} not readable: {e.__class__.__name__} {e}")
+                return
+            signature = (str(targets_file), file_stat.st_mtime_ns, file_stat.st_size)
+            if signature == self._loaded_from:
+                return
+            self._index = self._load(targets_file)
+            self._loaded_from = signature
+            self._last_error = None
+            self._unreported_error = None
+            if self.log:
+                self.log.debug(f"refresh(): Loaded {len(self._index)} bounty targets from {targets_file}.")
+        except Exception as e:
+            # A half written or broken file keeps the previous list active
+            self._report(f"refresh(): {e.__class__.__name__} {e}")
+        finally:
+            self._reload_lock.release()
+
+    def _load(self, targets_file: Path) -> Mapping[str, Tuple[str, str]]:
+        with open(targets_file, "r", encoding="utf-8") as f:
+            targets = json.load(f)
+        if not isinstance(targets, dict):
+            raise ValueError(f"{targets_file} must map RSI handles to requirements")
+        return MappingProxyType({
+            self.normalize(handle): (handle, requirement or "")
+            for handle, requirement in targets.items()
+        })
+
+    def _report(self, message: str) -> None:
+        # Checked every few seconds, only complain once about the same problem
+        if message == self._last_error:
+            return
+        self._last_error = message
+        if self.log:
+            self.log.error(message)
+        else:
+            # The first load can run before the GUI logger exists
+            self._unreported_error = message
+
+
+# Shared by the bounty tracker and the GUI
+bounty_registry = BountyRegistry()
@@ -3,9 +3,9 @@ from __future__ import annotations
 
 import re
 from collections import deque
-from typing import Deque, Dict, Iterable, Optional, Tuple
+from typing import Deque, Iterable, Mapping, Optional, Tuple
 
-from modules.bounty_list import BOUNTY_TARGETS
+from modules.bounty_registry import BountyRegistry, bounty_registry
 
 
 class BountyTracker:
@@ -28,14 +28,17 @@ class BountyTracker:
         re.compile(r"Tracking contact .*?['\"](?P<target>[A-Za-z0-9_\-]+)", re.IGNORECASE),
     )
 
-    def __init__(self, gui, sounds) -> None:
+    # Handles are captured as maximal runs of these characters, so a listed handle is always one whole token
+    _HANDLE_TOKEN: re.Pattern[str] = re.compile(r"[a-z0-9_\-]+")
+
+    # Case-insensitive keywords a line needs before inspect_line looks at it, lets the log reader skip the rest undecoded.
+    BYTE_TRIGGERS: Tuple[bytes, ...] = (b"lock", b"scan", b"detect", b"tracking", b"radar contact")
+
+    def __init__(self, gui, sounds, registry: Optional[BountyRegistry] = None) -> None:
         self._gui = gui
         self._sounds = sounds
         self._logger = None
-        self._bounties: Dict[str, Tuple[str, str]] = {
-            handle.lower(): (handle, requirement or "")
-            for handle, requirement in BOUNTY_TARGETS.items()
-        }
+        self._registry = registry or bounty_registry
         # Track recently reported events so we do not spam duplicate notifications
         self._recent_events: Deque[Tuple[str, str, str]] = deque(maxlen=128)
         self._recent_keys = set()
@@ -46,30 +49,40 @@ class BountyTracker:
     def set_logger(self, logger) -> None:
         """Attach a logger instance once it exists."""
         self._logger = logger
+        self._registry.set_logger(logger)
 
     def inspect_line(self, line: str) -> None:
         """Inspect a raw log line for passive bounty interactions."""
         lowered = line.lower()
         # Quick keyword filters to avoid running regex on irrelevant lines
-        if "lock" in lowered:
-            self._try_patterns(line, "lock", self._LOCK_PATTERNS)
-        if "scan" in lowered:
-            self._try_patterns(line, "scan", self._SCAN_PATTERNS)
-        if any(trigger in lowered for trigger in ("detect", "tracking", "radar contact")):
-            self._try_patterns(line, "detect", self._DETECT_PATTERNS)
+        lock = "lock" in lowered
+        scan = "scan" in lowered
+        detect = any(trigger in lowered for trigger in ("detect", "tracking", "radar contact"))
+        if not (lock or scan or detect):
+            return
+        # The patterns only ever report a listed handle, so skip lines that do not name one at all
+        bounties = self._registry.index
+        if bounties.keys().isdisjoint(self._HANDLE_TOKEN.findall(lowered)):
+            return
+        if lock:
+            self._try_patterns(line, "lock", self._LOCK_PATTERNS, bounties)
+        if scan:
+            self._try_patterns(line, "scan", self._SCAN_PATTERNS, bounties)
+        if detect:
+            self._try_patterns(line, "detect", self._DETECT_PATTERNS, bounties)
 
     def handle_kill(self, killer: str, victim: str, weapon: Optional[str] = None, raw_line: str = "") -> None:
         """Handle confirmed kill events reported elsewhere in the parser."""
-        normalized = self._normalize_handle(victim)
-        if normalized not in self._bounties:
+        target = self._registry.lookup(victim)
+        if target is None:
             return
-        canonical, requirement = self._bounties[normalized]
+        canonical, requirement = target
         message = f"Continental bounty kill on {canonical} by {killer}."
         if requirement:
             message += f" Requirement: {requirement}"
         self._notify(
             event_type="kill",
-            target_key=normalized,
+            target=target,
             message=message,
             actor=killer,
             raw_line=raw_line or victim,
@@ -83,6 +96,7 @@ class BountyTracker:
         line: str,
         event_type: str,
         patterns: Iterable[re.Pattern[str]],
+        bounties: Mapping[str, Tuple[str, str]],
     ) -> None:
         for pattern in patterns:
             match = pattern.search(line)
@@ -91,25 +105,25 @@ class BountyTracker:
             raw_handle = match.group("target") if "target" in match.groupdict() else None
             if not raw_handle:
                 continue
-            normalized = self._normalize_handle(raw_handle)
-            if normalized not in self._bounties:
+            target = bounties.get(self._registry.normalize(raw_handle))
+            if target is None:
                 continue
-            canonical, requirement_text = self._bounties[normalized]
+            canonical, requirement_text = target
             message = f"Continental bounty {event_type} on {canonical} detected."
             if requirement_text:
                 message += f" Requirement: {requirement_text}"
-            self._notify(event_type, normalized, message, raw_line=line)
+            self._notify(event_type, target, message, raw_line=line)
             break
 
     def _notify(
         self,
         event_type: str,
-        target_key: str,
+        target: Tuple[str, str],
         message: str,
         actor: Optional[str] = None,
         raw_line: str = "",
     ) -> None:
-        canonical, requirement = self._bounties[target_key]
+        canonical, requirement = target
         key = (event_type, canonical, raw_line.strip())
         if not self._remember_event(key):
             return
@@ -141,11 +155,3 @@ class BountyTracker:
             old_key = self._recent_events.popleft()
             self._recent_keys.discard(old_key)
         return True
-
-    @staticmethod
-    def _normalize_handle(handle: str) -> str:
-        cleaned = handle.strip().strip("'\"")
-        if "[" in cleaned:
-            cleaned = cleaned.split("[", 1)[0]
-        return cleaned.lower()
-
@@ -3,9 +3,10 @@ import hashlib
 import json
 import re
 from pathlib import Path
-from time import sleep
+from time import sleep, monotonic
 
 import global_settings
+from modules.outbox import KillOutbox
 
 class Cfg_Handler:
     """Config Handler with backward compatibility and per-account encrypted config."""
@@ -23,8 +24,11 @@ class Cfg_Handler:
         self.cfg_dict = {
             "key": "",
             "volume": {"level": global_settings.volume, "is_muted": global_settings.is_muted},
-            "pickle": [],
         }
+        # Kills waiting for upload live in their own journal next to the config, not in the config itself
+        self.outbox = KillOutbox()
+        self.drain_batch = 25
+        self.drain_probe_interval = 30
 
     def _safe_filename(self) -> str:
         return re.sub(r'[\\/*?:"<>|]', "_", self.rsi_handle["current"])
@@ -44,6 +48,11 @@ class Cfg_Handler:
         self.crypt_key = self._derive_key()
         self.cfg_path = Path.cwd() / f'bv_killtracker_{self._safe_filename()}.cfg'
         self.log.debug(f"Set config file path: {self.cfg_path}")
+        try:
+            self.outbox.open(Path.cwd() / f'bv_killtracker_{self._safe_filename()}_outbox.jsonl')
+            self.log.debug(f"Opened kill outbox {self.outbox.path} with {len(self.outbox)} kills waiting.")
+        except Exception as e:
+            self.log.error(f"_set_cfg_vars(): Opening kill outbox: {e.__class__.__name__} {e}")
 
     def migrate_old_configs(self):
         # Migrate old config file
@@ -83,6 +92,7 @@ class Cfg_Handler:
             try:
                 decrypted_data = self._xor_encrypt(base64.b64decode(file_data)).decode()
                 self.cfg_dict = json.loads(decrypted_data)
+                self.migrate_pickle_buffer()
                 if self.log:
                     self.log.debug(f"load_cfg(): cfg: {self.cfg_dict}")
                 else:
@@ -114,6 +124,7 @@ class Cfg_Handler:
                 # Fallback: old Base64 encoded JSON (should not happen if migrated)
                 cfg_str = base64.b64decode(file_data).decode()
                 self.cfg_dict = json.loads(cfg_str)
+                self.migrate_pickle_buffer()
                 if self.log:
                     self.log.warning("Fallback: loaded old Base64 config.")
                 else:
@@ -142,30 +153,77 @@ class Cfg_Handler:
         except Exception as e:
             self.log.error(f"Was not able to save the config to {str(self.cfg_path)} - {e.__class__.__name__} {e}.")
 
-    def log_pickler(self) -> None:
-        """Pickle and unpickle kill logs."""
+    def migrate_pickle_buffer(self) -> None:
+        """Move kills buffered in the config by older versions into the outbox."""
+        pickle_buffer = self.cfg_dict.get("pickle")
+        if not pickle_buffer:
+            return
+        # The config keeps its copy until every kill is synced to the journal on disk
+        if not self.outbox.is_open:
+            if self.log:
+                self.log.warning("Kill outbox is not open, the kills buffered in the config stay there for now.")
+            return
+        try:
+            for pickle_payload in pickle_buffer:
+                self.outbox.add(pickle_payload["kill_result"], pickle_payload["endpoint"])
+            self.outbox.sync()
+            missing = [
+                pickle_payload for pickle_payload in pickle_buffer
+                if not self.outbox.is_pending(pickle_payload["kill_result"], pickle_payload["endpoint"])
+            ]
+        except Exception as e:
+            if self.log:
+                self.log.error(f"migrate_pickle_buffer(): {e.__class__.__name__} {e}. The buffered kills stay in the config.")
+            return
+        if missing:
+            if self.log:
+                self.log.error(f"migrate_pickle_buffer(): {len(missing)} buffered kills did not reach the kill outbox. They stay in the config.")
+            return
+        self.cfg_dict.pop("pickle", None)
+        self.save_cfg("all", "")
+        if self.log:
+            self.log.info(f"Moved {len(pickle_buffer)} buffered kills from the config to the kill outbox.")
+
+    def add_pickle(self, kill_result: dict, endpoint: str) -> bool:
+        """Buffer a kill that failed to upload, unless it is already waiting. Returns True if it was added."""
+        try:
+            return self.outbox.add(kill_result, endpoint)
+        except Exception as e:
+            if self.log:
+                self.log.error(f"add_pickle(): {e.__class__.__name__} {e}")
+            return False
+
+    def drain_outbox(self) -> None:
+        """Upload the kills waiting in the outbox as soon as Servitor is reachable."""
+        next_probe = 0.0
         while self.program_state["enabled"]:
             try:
-                if self.log:
-                    self.log.debug(f'Current pickling buffer: {self.cfg_dict["pickle"]}')
-                
-                if self.monitoring["active"] and len(self.cfg_dict["pickle"]) > 0:
-                    self.save_cfg("pickle", self.cfg_dict["pickle"])
-                    if self.api and getattr(self.api, "connection_healthy", False):
-                        pickle_payload = self.cfg_dict["pickle"][0]
-                        if self.log:
-                            self.log.info(f'Attempting to post a previous kill from the buffer: {pickle_payload["kill_result"]}')
-                        uploaded = self.api.post_kill_event(pickle_payload["kill_result"], pickle_payload["endpoint"])
-                        if uploaded:
-                            self.cfg_dict["pickle"].pop(0)
-                            self.save_cfg("pickle", self.cfg_dict["pickle"])
+                self.outbox.sync()
+                self.outbox.maybe_compact()
+                if self.monitoring["active"] and len(self.outbox) and self.api:
+                    healthy = getattr(self.api, "connection_healthy", False)
+                    # While Servitor is unreachable only the oldest kill is tried now and then, to notice when it is back
+                    if healthy or monotonic() >= next_probe:
+                        next_probe = monotonic() + self.drain_probe_interval
+                        batch = self.outbox.peek(self.drain_batch if healthy else 1)
+                        self.log.info(f"Attempting to post {len(batch)} previous kills from the buffer, {len(self.outbox)} waiting.")
+                        if self._upload_buffered(batch) and len(self.outbox):
+                            continue
             except Exception as e:
-                self.log.error(f"log_pickler(): {e.__class__.__name__} {e}")
-
-            for sec in range(60):
-                if not self.program_state["enabled"]:
-                    if self.log:
-                        self.log.info("Executing final config save.")
-                    self.save_cfg("pickle", self.cfg_dict["pickle"])
-                    break
-                sleep(1)
+                self.log.error(f"drain_outbox(): {e.__class__.__name__} {e}")
+            sleep(1)
+        if self.log:
+            self.log.info("Closing the kill outbox.")
+        self.outbox.close()
+
+    def _upload_buffered(self, batch: list) -> int:
+        by_endpoint = {}
+        for record in batch:
+            by_endpoint.setdefault(record["endpoint"], []).append(record["kill_result"])
+        uploaded_total = 0
+        for endpoint, kill_results in by_endpoint.items():
+            uploaded = self.api.post_kill_batch(kill_results, endpoint)
+            for kill_result in uploaded:
+                self.outbox.ack(kill_result, endpoint)
+            uploaded_total += len(uploaded)
+        return uploaded_total
@@ -1,8 +1,11 @@
+from bisect import bisect_left, insort
 from threading import Thread
 from time import sleep
 # Inherit sub-modules
 from modules.commander_mode.cm_api import CM_API_Client
+from modules.commander_mode.cm_fleet import FleetStore
 from modules.commander_mode.cm_gui import CM_GUI
+from modules.commander_mode.cm_heartbeat import HeartbeatScheduler
 
 class CM_Core(CM_API_Client, CM_GUI):
     """Commander Mode core module for the Kill Tracker."""
@@ -11,7 +14,7 @@ class CM_Core(CM_API_Client, CM_GUI):
         self.gui = gui_module
         self.api_key = api_module.api_key
         self.api_fqdn = api_module.api_fqdn
-        self.request_timeout = api_module.request_timeout
+        self.transport = api_module.transport
         self.monitoring = monitoring
         self.heartbeat_status = heartbeat_status
         self.rsi_handle = rsi_handle
@@ -20,13 +23,19 @@ class CM_Core(CM_API_Client, CM_GUI):
         self.heartbeat_daemon = None
         self.cm_update_daemon = None
         self.commander_window = None
-        self.connected_users = []
+        # Connected users keyed by player, refreshes only touch the rows that changed
+        self.fleet = FleetStore()
+        self.shown_users = []
+        self.user_filter = ""
         self.connected_users_listbox = None
         self.alloc_users = []
+        self.alloc_index = {}
         self.allocated_forces_listbox = None
         self.connect_commander_button = None
         self.join_timeout = 10
         self.heartbeat_interval = 5
+        # Sends the periodic beat and the event beats, callers only hand over their update
+        self.heartbeat = HeartbeatScheduler(self)
 
         # Battle Tracking info
         self.is_commander = False
@@ -37,32 +46,28 @@ class CM_Core(CM_API_Client, CM_GUI):
     def allocate_selected_users(self) -> None:
         """Allocate selected Connected Users to Allocated Forces."""
         try:
-            curr_alloc_users = [user["player"] for user in self.alloc_users]
-            self.log.debug(f"allocate_selected_users(): curr_alloc_users: {curr_alloc_users}")
+            self.log.debug(f"allocate_selected_users(): curr_alloc_users: {list(self.alloc_index)}")
             selected_indices = self.connected_users_listbox.curselection()
             for index in selected_indices:
                 player_name = self.connected_users_listbox.get(index)
                 # Find the full user info
-                user_info = next((user for user in self.connected_users if user['player'] == player_name), None)
-                if user_info and user_info["player"] not in curr_alloc_users:
+                user_info = self.fleet.get(player_name)
+                if user_info and user_info["player"] not in self.alloc_index:
                     # Add to allocated forces
-                    self.alloc_users.append(user_info)
                     self.log.debug(f"allocate_selected_users(): Inserting into allocated forces: {user_info}")
-                    self.allocated_forces_insert(f"{user_info['player']} - Zone: {user_info['zone']}")
+                    self.allocate_user(user_info)
         except Exception as e:
             self.log.error(f"allocate_selected_users(): {e.__class__.__name__} - {e}")
 
     def allocate_all_users(self) -> None:
         """Allocate all Connected Users to Allocated Forces if not already in."""
         try:
-            curr_alloc_users = [user["player"] for user in self.alloc_users]
-            self.log.debug(f"allocate_all_users(): curr_alloc_users: {curr_alloc_users}")
-            for conn_user in self.connected_users:
-                if conn_user["player"] not in curr_alloc_users:
+            self.log.debug(f"allocate_all_users(): curr_alloc_users: {list(self.alloc_index)}")
+            for conn_user in self.fleet:
+                if conn_user["player"] not in self.alloc_index:
                     # Add to allocated forces
-                    self.alloc_users.append(conn_user)
                     self.log.debug(f"allocate_all_users(): Inserting into allocated forces: {conn_user}")
-                    self.allocated_forces_insert(f"{conn_user['player']} - Zone: {conn_user['zone']}")
+                    self.allocate_user(conn_user)
         except Exception as e:
             self.log.error(f"allocate_all_users(): {e.__class__.__name__} - {e}")
 
@@ -108,43 +113,72 @@ class CM_Core(CM_API_Client, CM_GUI):
 
     # def reset_battle_counts(self) -> None:
 
-    def update_allocated_forces(self) -> None:
-        """Update the status of users in the allocated forces list."""
+    def allocate_user(self, user:dict) -> None:
+        """Append a connected user to the allocated forces."""
+        self.alloc_index[user["player"]] = len(self.alloc_users)
+        self.alloc_users.append(user)
+        self.show_allocated_user(len(self.alloc_users) - 1, user)
+
+    def show_allocated_user(self, index:int, user:dict, replace:bool = False) -> None:
+        """Draw one allocated forces row, replacing the row at index if asked."""
+        if replace:
+            self.allocated_forces_remove(index)
+        self.allocated_forces_insert(f"{user['player']} - Zone: {user['zone']}", index)
+        # Change text color of allocated users based on status
+        if user['status'] == "dead":
+            self.allocated_forces_listbox.itemconfig(index, {'fg': 'red'})
+        elif user['status'] == "alive":
+            self.allocated_forces_listbox.itemconfig(index, {'fg': '#04B431'})
+
+    def update_allocated_forces(self, left:list, changed:list) -> None:
+        """Drop allocated users that disconnected and redraw the ones whose zone or status changed."""
         try:
-            for index in range(self.allocated_forces_listbox.size()):
-                item_text = self.allocated_forces_listbox.get(index)
-                # Extract the player's name
-                player_name = item_text.split(" - ")[0]
-                user = next((user for user in self.connected_users if user["player"] == player_name), None)
-                # Remove allocated user
+            gone = sorted((self.alloc_index.pop(user["player"]) for user in left if user["player"] in self.alloc_index), reverse=True)
+            for index in gone:
                 del self.alloc_users[index]
-                self.allocated_forces_listbox.delete(index)
-                # Only re-add user if they are currently connected
-                if user:
-                    self.alloc_users.insert(index, user)
-                    self.allocated_forces_listbox.insert(index, f"{user['player']} - Zone: {user['zone']}")
-                    # Change text color of allocated users based on status
-                    if user['status'] == "dead":
-                        self.allocated_forces_listbox.itemconfig(index, {'fg': 'red'})
-                    elif user['status'] == "alive":
-                        self.allocated_forces_listbox.itemconfig(index, {'fg': '#04B431'})
+                self.allocated_forces_remove(index)
+            if gone:
+                # Rows below the first removed one moved up
+                for index in range(gone[-1], len(self.alloc_users)):
+                    self.alloc_index[self.alloc_users[index]["player"]] = index
+            for user in changed:
+                index = self.alloc_index.get(user["player"])
+                if index is None:
+                    continue
+                previous = self.alloc_users[index]
+                self.alloc_users[index] = user
+                if (previous.get("zone"), previous.get("status")) != (user.get("zone"), user.get("status")):
+                    self.show_allocated_user(index, user, replace=True)
         except Exception as e:
             self.log.error(f"update_allocated_forces(): {e.__class__.__name__} - {e}")
 
-    # Refresh User List Function
-    def refresh_user_list(self, active_users:dict) -> None:
-        """Refresh the connected users list and update allocated forces based on status."""
-        # Remove any dupes and sort alphabetically
-        no_dupes = [dict(t) for t in {tuple(user.items()) for user in active_users}]
-        self.connected_users = sorted(no_dupes, key=lambda user: user["player"])
-        #self.log.debug(f"refresh_user_list(): initial connected users: {self.connected_users}")
-        # Update Connected Users Listbox
+    def show_connected_users(self) -> None:
+        """Redraw the connected users list from the fleet store, e.g. when the search changes."""
+        self.shown_users = [player for player in self.fleet.players if self.user_filter in player.lower()]
         self.connected_users_delete()
-        for user in self.connected_users:
-            self.connected_users_insert(user["player"])
-            #self.log.debug(f"refresh_user_list(): inserting into connected users: {user}")
+        for player in self.shown_users:
+            self.connected_users_insert(player)
+
+    # Refresh User List Function
+    def refresh_user_list(self, active_users:list) -> None:
+        """Apply a roster to the fleet store and push only what changed to the listboxes."""
+        delta = self.fleet.apply(active_users)
+        if not any(delta):
+            return
+        #self.log.debug(f"refresh_user_list(): {len(delta.joined)} joined, {len(delta.left)} left, {len(delta.changed)} changed")
+        # Update Connected Users Listbox, rows stay sorted by player
+        for user in delta.left:
+            index = bisect_left(self.shown_users, user["player"])
+            if index < len(self.shown_users) and self.shown_users[index] == user["player"]:
+                del self.shown_users[index]
+                self.connected_users_remove(index)
+        for user in delta.joined:
+            if self.user_filter in user["player"].lower():
+                index = bisect_left(self.shown_users, user["player"])
+                insort(self.shown_users, user["player"])
+                self.connected_users_insert(user["player"], index)
         # Update Allocated Forces Listbox
-        self.update_allocated_forces()
+        self.update_allocated_forces(delta.left, delta.changed)
 
     def check_for_cm_updates(self) -> None:
         """
@@ -155,6 +189,9 @@ class CM_Core(CM_API_Client, CM_GUI):
             try:
                 if not self.update_queue.empty():
                     active_commanders = self.update_queue.get()
+                    # Only the newest roster matters, skip the ones it replaces
+                    while not self.update_queue.empty():
+                        active_commanders = self.update_queue.get()
                     #self.log.debug(f"check_for_cm_updates(): Received active commanders payload: {active_commanders}")
                     self.refresh_user_list(active_commanders)
                 sleep(1)
@@ -185,6 +222,7 @@ class CM_Core(CM_API_Client, CM_GUI):
             ):
                 self.log.info("Commander is shutting down...")
                 self.heartbeat_status["active"] = False
+                self.heartbeat.wake()
                 self.clear_listboxes()
                 self.heartbeat_daemon = None
                 self.log.debug(f"stop_heartbeat_threads(): Stopped heartbeat thread.")
@@ -198,10 +236,12 @@ class CM_Core(CM_API_Client, CM_GUI):
 
     def clear_listboxes(self) -> None:
         """Cleanup listboxes when disconnected."""
-        self.log.debug(f"clear_listboxes(): Data before clearing - connected_users: {self.connected_users}, alloc_users: {self.alloc_users}")
-        self.connected_users.clear()
+        self.log.debug(f"clear_listboxes(): Data before clearing - connected_users: {list(self.fleet)}, alloc_users: {self.alloc_users}")
+        self.fleet.clear()
+        self.shown_users.clear()
         self.alloc_users.clear()
+        self.alloc_index.clear()
         if self.commander_window:
             self.connected_users_delete()
             self.allocated_forces_delete()
-        self.log.debug(f"clear_listboxes(): Data after clearing - connected_users: {self.connected_users}, alloc_users: {self.alloc_users}")
+        self.log.debug(f"clear_listboxes(): Data after clearing - connected_users: {list(self.fleet)}, alloc_users: {self.alloc_users}")
@@ -0,0 +1,63 @@
+"""Connected users of a Commander Mode session, keyed by player."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class FleetDelta(NamedTuple):
+    """What one roster changed: users that joined, left, or whose entry (zone, status) changed."""
+    joined: List[Dict]
+    left: List[Dict]
+    changed: List[Dict]
+
+
+class FleetStore:
+    """Hold the last roster Servitor sent and turn the next one into a per-player delta.
+
+    Every heartbeat response carries the full ``commanders`` list. Applying it
+    here gives back only the players that joined, left or changed, so the
+    listboxes are touched for those rows and not rebuilt. Player names are
+    kept sorted, a row's position is a bisect away.
+    """
+
+    def __init__(self) -> None:
+        self.users: Dict[str, Dict] = {}
+        self.players: List[str] = []
+        self._roster: Optional[List[Dict]] = None
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Users sorted by player."""
+        return (self.users[player] for player in self.players)
+
+    def get(self, player: str) -> Optional[Dict]:
+        return self.users.get(player)
+
+    def apply(self, roster: List[Dict]) -> FleetDelta:
+        """Make ``roster`` the current fleet and get what changed. A player listed twice keeps the last entry."""
+        if roster == self._roster:
+            return FleetDelta([], [], [])
+        self._roster = roster
+        users = {user["player"]: user for user in roster if isinstance(user, dict) and "player" in user}
+        joined, changed = [], []
+        for player, user in users.items():
+            known = self.users.get(player)
+            if known is None:
+                joined.append(user)
+            elif known != user:
+                changed.append(user)
+        left = [user for player, user in self.users.items() if player not in users]
+        self.users = users
+        for user in left:
+            del self.players[bisect_left(self.players, user["player"])]
+        for user in joined:
+            insort(self.players, user["player"])
+        return FleetDelta(joined, left, changed)
+
+    def clear(self) -> None:
+        self.users.clear()
+        self.players.clear()
+        self._roster = None
@@ -2,17 +2,25 @@ import tkinter as tk
 
 class CM_GUI():
     """Commander Mode API module for the Kill Tracker."""
-    def connected_users_insert(self, player_data:str) -> None:
+    def connected_users_insert(self, player_data:str, index=tk.END) -> None:
         """Insert into connected users GUI element"""
-        self.connected_users_listbox.insert(tk.END, player_data)
+        self.connected_users_listbox.insert(index, player_data)
+
+    def connected_users_remove(self, index:int) -> None:
+        """Remove one row from connected users GUI element"""
+        self.connected_users_listbox.delete(index)
 
     def connected_users_delete(self) -> None:
         """Delete from connected users GUI element"""
         self.connected_users_listbox.delete(0, tk.END)
 
-    def allocated_forces_insert(self, player_data:str) -> None:
+    def allocated_forces_insert(self, player_data:str, index=tk.END) -> None:
         """Insert into allocated forces GUI element"""
-        self.allocated_forces_listbox.insert(tk.END, player_data)
+        self.allocated_forces_listbox.insert(index, player_data)
+
+    def allocated_forces_remove(self, index:int) -> None:
+        """Remove one row from allocated forces GUI element"""
+        self.allocated_forces_listbox.delete(index)
 
     def allocated_forces_delete(self) -> None:
         """Delete from allocated forces GUI element"""
@@ -140,12 +148,10 @@ class CM_GUI():
             
             # Search Functionality
             def search_users(*args):
-                search_query = search_var.get().lower()
-                self.connected_users_listbox.delete(0, tk.END)
-                if self.connected_users:
-                    for user in self.connected_users:
-                        if search_query in user['player'].lower():
-                            self.connected_users_listbox.insert(tk.END, user['player'])
+                search_query = search_var.get()
+                # The placeholder text is not a search
+                self.user_filter = "" if search_query == search_bar.placeholder else search_query.lower()
+                self.show_connected_users()
 
             search_var.trace("w", search_users)
         except Exception as e:
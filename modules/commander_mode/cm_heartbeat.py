@@ -0,0 +1,233 @@
+"""Single sender for all Commander Mode heartbeat traffic to /validateKey."""
+from __future__ import annotations
+
+from collections import deque
+from threading import Condition
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+
+class HeartbeatScheduler:
+    """Send the periodic heartbeat and the event beats from one thread, callers never wait.
+
+    The periodic beat reads the latest local state when it goes out, so any
+    number of zone changes between two beats cost nothing extra and only the
+    last one is sent. Beats carry the full state unless the server answers
+    with ``partial_heartbeats: true``. While it does, only the fields that
+    changed since the last beat are sent next to the identity fields, with
+    the full state after a failed beat and every ``full_state_interval``
+    seconds so the server can always catch up. Delta beats can be switched
+    off with ``send_deltas``, and a session falls back to full beats for good
+    when a delta fails while the full beat right after it goes through, since
+    the server then evidently refuses partial payloads. Deaths and commander flag updates are queued
+    as event beats with their payload taken at call time and go out right
+    away, in order.
+
+    The periodic cadence adapts to activity. It stays at
+    ``cm.heartbeat_interval`` while a battle is started, or for
+    ``activity_window`` seconds after a local zone change, death or flag
+    update or a change in the commander roster Servitor answers with. Once
+    idle it doubles with every beat up to ``idle_interval``, and activity
+    brings the next beat straight back. A ``heartbeat_interval`` in the
+    Servitor response overrides the local choice while it is sent.
+    """
+
+    identity_keys = ("is_heartbeat", "player", "client_ver", "mode")
+
+    def __init__(
+        self, cm, full_state_interval: float = 60, max_events: int = 32, idle_interval: float = 30,
+        activity_window: float = 60, min_interval: float = 1, max_interval: float = 120, send_deltas: bool = True
+    ) -> None:
+        self.cm = cm
+        self.full_state_interval = full_state_interval
+        self.send_deltas = send_deltas
+        self.deltas_active = False
+        self._deltas_refused = False
+        self._delta_failed = False
+        self.idle_interval = idle_interval
+        self.activity_window = activity_window
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._events = deque(maxlen=max_events)
+        self._cond = Condition()
+        self._last_sent: Optional[Dict] = None
+        self._next_full = 0.0
+        self._generation = 0
+        self._last_activity = 0.0
+        self._last_beat = 0.0
+        self._next_beat = 0.0
+        self._last_roster = None
+        self._server_interval: Optional[float] = None
+        self._sent_at = deque()
+        self._started = monotonic()
+        self.interval: Optional[float] = None
+        self.beats = 0
+        self.events = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.dropped = 0
+
+    @property
+    def log(self):
+        return self.cm.log
+
+    def state_changed(self) -> None:
+        """Note a local state change, the next periodic beat carries it."""
+        with self._cond:
+            self.coalesced += 1
+            self._mark_activity()
+
+    def send_now(self, payload: Dict) -> None:
+        """Queue an event beat to be sent right away. A full queue drops its oldest event beat."""
+        with self._cond:
+            overflowed = len(self._events) == self._events.maxlen
+            if overflowed:
+                self.dropped += 1
+            self._events.append(payload)
+            self._mark_activity()
+            self._cond.notify()
+        if overflowed:
+            self.log.warning(f"send_now(): Heartbeat event queue is full, dropped the oldest event ({self.dropped} so far).")
+
+    def wake(self) -> None:
+        with self._cond:
+            self._cond.notify()
+
+    def effective_rate(self) -> float:
+        """Heartbeat posts per minute over the last minute."""
+        now = monotonic()
+        recent = sum(1 for sent_at in list(self._sent_at) if now - sent_at <= 60)
+        return recent * 60 / max(min(now - self._started, 60), 1)
+
+    def summary(self) -> str:
+        interval = f"{self.interval:g}s" if self.interval is not None else "not started"
+        return (
+            f"{self.beats} beats, {self.events} event beats, {self.coalesced} changes coalesced, {self.failures} failed, "
+            f"{self.dropped} events dropped, "
+            f"interval {interval}, {self.effective_rate():.1f} posts/min"
+            + ("" if self.deltas_active else ", full beats only")
+        )
+
+    def _active_interval(self) -> float:
+        return self._server_interval if self._server_interval is not None else self.cm.heartbeat_interval
+
+    def _mark_activity(self) -> None:
+        """Go back to the active cadence, the caller holds the condition."""
+        self._last_activity = monotonic()
+        if self.interval is not None and self.interval > self._active_interval():
+            self.interval = self._active_interval()
+            self._next_beat = min(self._next_beat, self._last_beat + self.interval)
+            self._cond.notify()
+
+    def _next_interval(self) -> float:
+        """Pick the wait until the next periodic beat."""
+        if self._server_interval is not None:
+            return self._server_interval
+        fast = self.cm.heartbeat_interval
+        if self.cm.start_battle or monotonic() - self._last_activity < self.activity_window:
+            return fast
+        # Idle, back off a step per beat
+        return min(max(self.idle_interval, fast), max(fast, (self.interval or fast) * 2))
+
+    def _delta(self, state: Dict) -> Tuple[Dict, bool]:
+        """Get the beat payload for ``state`` and whether it is the full state."""
+        if not self.deltas_active or self._last_sent is None or monotonic() >= self._next_full:
+            self._next_full = monotonic() + self.full_state_interval
+            return dict(state), True
+        payload = {key: state[key] for key in self.identity_keys if key in state}
+        payload.update((key, value) for key, value in state.items() if self._last_sent.get(key) != value)
+        return payload, False
+
+    def _read_response(self, response: Dict) -> None:
+        """Take the server's interval and delta support, and note roster changes as fleet activity."""
+        self.deltas_active = self.send_deltas and not self._deltas_refused and response.get("partial_heartbeats") is True
+        suggested = response.get("heartbeat_interval")
+        if isinstance(suggested, (int, float)) and not isinstance(suggested, bool):
+            self._server_interval = min(max(float(suggested), self.min_interval), self.max_interval)
+        else:
+            self._server_interval = None
+        roster = response.get("commanders")
+        if roster is not None:
+            if self._last_roster is not None and roster != self._last_roster:
+                with self._cond:
+                    self._mark_activity()
+            self._last_roster = roster
+
+    def _send(self, payload: Dict, full: bool = False, event: bool = False) -> None:
+        now = monotonic()
+        self._sent_at.append(now)
+        while now - self._sent_at[0] > 60:
+            self._sent_at.popleft()
+        response = self.cm.send_heartbeat(payload)
+        if response is None:
+            self.failures += 1
+            self._last_sent = None
+            if not event:
+                self._delta_failed = not full
+            return
+        if full and not event and self._delta_failed and self.deltas_active:
+            # A delta failed but the full state went through, the server does not take partial beats
+            self._deltas_refused = True
+            self.log.warning("Commander server refused a partial heartbeat, sending the full state for the rest of the session.")
+        if not event:
+            self._delta_failed = False
+        if full:
+            self._last_sent = dict(payload)
+        elif self._last_sent is not None:
+            # Event beats also carry flags the periodic beat does not send, only track what it does
+            self._last_sent.update((key, value) for key, value in payload.items() if not event or key in self._last_sent)
+        self._read_response(response)
+
+    def run(self) -> None:
+        """Heartbeat loop, runs while Commander Mode is connected."""
+        # A quick disconnect and reconnect starts a new loop before the old one noticed, the old one then bows out
+        with self._cond:
+            self._generation += 1
+            generation = self._generation
+            self._cond.notify_all()
+            self._last_sent = None
+            self._last_roster = None
+            self._server_interval = None
+            self.deltas_active = False
+            self._deltas_refused = False
+            self._delta_failed = False
+            self._sent_at.clear()
+            self._started = monotonic()
+            self._last_activity = monotonic()
+            self.interval = self.cm.heartbeat_interval
+            self._last_beat = monotonic()
+            self._next_beat = self._last_beat + self.interval
+        while self.cm.heartbeat_status["active"] and generation == self._generation:
+            try:
+                with self._cond:
+                    while not self._events and monotonic() < self._next_beat and self.cm.heartbeat_status["active"] and generation == self._generation:
+                        self._cond.wait(self._next_beat - monotonic())
+                    if generation != self._generation:
+                        break
+                    event_payload = self._events.popleft() if self._events else None
+                if not self.cm.heartbeat_status["active"]:
+                    break
+                if event_payload is not None:
+                    self.events += 1
+                    self._send(event_payload, event=True)
+                    continue
+                if not self.cm.api_key["value"]:
+                    self.log.warning("Heartbeat will not be sent because the key does not exist.")
+                    # Call disconnect commander and exit
+                    self.cm.toggle_commander()
+                    break
+                with self._cond:
+                    self._last_beat = monotonic()
+                    self._next_beat = self._last_beat + self.interval
+                self.beats += 1
+                payload, full = self._delta(self.cm.heartbeat_state())
+                self._send(payload, full=full)
+                with self._cond:
+                    interval = self._next_interval()
+                    if interval != self.interval:
+                        self.log.debug(f"post_heartbeat(): Heartbeat interval {self.interval:g}s -> {interval:g}s, {self.effective_rate():.1f} posts/min")
+                    self.interval = interval
+                    self._next_beat = self._last_beat + interval
+            except Exception as e:
+                self.log.error(f"post_heartbeat(): {e.__class__.__name__} {e}")
+        self.log.debug(f"post_heartbeat(): Heartbeat stopped: {self.summary()}")
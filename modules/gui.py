@@ -13,7 +13,7 @@ import webbrowser
 import global_settings
 import modules.helpers as Helpers
 from modules import mappings_parser
-from modules.bounty_list import BOUNTY_TARGETS
+from modules.bounty_registry import bounty_registry
 
 class AppLogger():
     def __init__(self, text_widget): self.text_widget = text_widget
@@ -47,7 +47,7 @@ class GUI():
         self.key_entry=None; self.api_status_label=None; self.volume_slider=None
         self.session_kills_label=None; self.session_deaths_label=None; self.kd_ratio_label=None
         self.curr_killstreak_label=None; self.max_killstreak_label=None
-        self.log_parser=None
+        self.log_parser=None; self.scan_backups_button=None
         self.killer_handle_entry=None
         self.killer_ship_combo=None
         self.killer_weapon_combo=None
@@ -837,6 +837,21 @@ class GUI():
         self.killer_weapon_combo['values'] = weapon_game_names
         self.log.success("Mappings loaded successfully. Star citizen Must be open to continue...")
 
+    def scan_backup_logs(self):
+        """Scan the rotated game logs for past kills and deaths on a worker thread, the counts go to the log."""
+        if not self.log_parser:
+            return
+        if not self.log_parser.log_file_location:
+            self.log.warning("Star Citizen must be running so the backup logs can be found.")
+            return
+        self.scan_backups_button.config(state=tk.DISABLED)
+        def run_scan():
+            try:
+                self.log_parser.scan_backup_logs()
+            finally:
+                self.app.after(0, lambda: self.scan_backups_button.config(state=tk.NORMAL))
+        Thread(target=run_scan, daemon=True).start()
+
     def _apply_injected_stat_update(self, outcome):
         parser = getattr(self, "log_parser", None)
         if parser:
@@ -973,22 +988,21 @@ class GUI():
                     )
 
             if game_mode_for_server == "SC_Default":
-                cleaned_victim_input = victim_h.strip().lower()
-                for target_name, requirement in BOUNTY_TARGETS.items():
-                    if cleaned_victim_input == target_name.lower():
-                        if self.log:
-                            self.log.success(
-                                f"Bounty Test triggered for injected kill on {target_name}!"
-                            )
-                        if self.sounds:
-                            self.sounds.play_bounty_sound()
-                        self.display_bounty_event(
-                            event_type="kill",
-                            target=target_name,
-                            requirement=requirement,
-                            actor=killer_h
+                bounty_target = bounty_registry.lookup(victim_h)
+                if bounty_target:
+                    target_name, requirement = bounty_target
+                    if self.log:
+                        self.log.success(
+                            f"Bounty Test triggered for injected kill on {target_name}!"
                         )
-                        break
+                    if self.sounds:
+                        self.sounds.play_bounty_sound()
+                    self.display_bounty_event(
+                        event_type="kill",
+                        target=target_name,
+                        requirement=requirement,
+                        actor=killer_h
+                    )
             
             self.killer_handle_entry.delete(0, tk.END)
             self.victim_handle_entry.delete(0, tk.END)
@@ -1254,6 +1268,7 @@ class GUI():
         bottom_frame.pack(fill=tk.X)
         button_style = {'relief': tk.FLAT, 'font': ("Segoe UI", 9, "bold"), 'fg': '#FFFFFF'}
         tk.Button(bottom_frame, text="Commander Mode", command=lambda: self.cm.setup_commander_mode() if self.cm else None, bg=self.colors['button'], **button_style).pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=(0, 5))
+        self.scan_backups_button = tk.Button(bottom_frame, text="Scan Backup Logs", command=self.scan_backup_logs, bg=self.colors['button'], **button_style); self.scan_backups_button.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=(5, 5))
         self.anonymize_button = tk.Button(bottom_frame, text="Anonymity Off", command=self.toggle_anonymize, **button_style, bg=self.colors['bg_light'], width=9); self.anonymize_button.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=(5, 0))
 
         footer_frame = tk.Frame(main_frame, bg=self.colors['bg_dark'])
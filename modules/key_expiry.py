@@ -0,0 +1,137 @@
+"""Local countdown to the Kill Tracker key expiry, validated with Servitor only when it matters."""
+from __future__ import annotations
+
+from datetime import datetime
+from threading import Event
+from time import monotonic
+from typing import Optional
+
+import pytz
+from tzlocal import get_localzone
+
+
+class KeyExpiryScheduler:
+    """Count the key lifetime down against a monotonic deadline instead of asking Servitor every minute.
+
+    ``expires_at`` is fetched when the countdown starts and turned into a
+    deadline on the monotonic clock. After that the key is only validated
+    again once when ``revalidate_before`` seconds are left (it may have been
+    extended), when the deadline is reached, and right away when another call
+    got a 403 (``revalidate_soon``). The status label is refreshed on a tick
+    that matches what it shows: every minute while hours are left, every
+    second in the last hour. The SC data maps are refreshed on their own,
+    slower cadence.
+    """
+
+    def __init__(self, api, revalidate_before: float = 300, retry_interval: float = 60, data_refresh_interval: float = 300) -> None:
+        self.api = api
+        self.revalidate_before = revalidate_before
+        self.retry_interval = retry_interval
+        self.data_refresh_interval = data_refresh_interval
+        self.server_tz = pytz.timezone('US/Mountain')
+        self.local_tz = get_localzone()
+        self.deadline: Optional[float] = None
+        self._next_validation = 0.0
+        self._shown_text = None
+        self._wake = Event()
+        self.validations = 0
+        self.data_refreshes = 0
+
+    @property
+    def log(self):
+        return self.api.log
+
+    def revalidate_soon(self) -> None:
+        """Validate the key on the next tick, e.g. after Servitor refused it or a new key was entered."""
+        self._next_validation = 0.0
+        # The label may have been overwritten meanwhile, show the countdown again after the validation
+        self._shown_text = None
+        self._wake.set()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the key expires, None while the expiry is unknown."""
+        return None if self.deadline is None else self.deadline - monotonic()
+
+    @staticmethod
+    def countdown_text(total_seconds: int) -> str:
+        days, remainder = divmod(total_seconds, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        if days > 0:
+            return f"Key Status: Valid (Expires in {days} days)"
+        if hours > 0:
+            return f"Key Status: Valid (Expires in {hours} hours {minutes} minutes)"
+        return f"Key Status: Valid (Expires in {minutes} minutes {seconds} seconds)"
+
+    def stop(self) -> None:
+        """Drop the expired or invalidated key and stop tracking."""
+        if self.api.cm:
+            self.api.cm.stop_heartbeat_threads()
+        self.api.cfg_handler.save_cfg("key", "")
+        self.api.api_key["value"] = None
+        self.api.monitoring["active"] = False
+        self.api.gui.api_status_label.config(text="Key Status: Expired", fg=self.api.key_status_invalid_color)
+        self.api.countdown_active = False
+        self.deadline = None
+
+    def _validate(self) -> bool:
+        """Fetch expires_at and reset the deadline. Returns False if the countdown had to stop."""
+        self.validations += 1
+        post_key_exp_result = self.api.post_api_key_expiration_time()
+        if post_key_exp_result == "error":
+            self.log.warning("Failed to get the key expiration time. Continuing anyway ...")
+            self._next_validation = monotonic() + self.retry_interval
+            return True
+        if post_key_exp_result == "invalidated":
+            self.log.error("Key has been invalidated by Servitor. Please get a new key or speak with a BlightVeil admin.")
+            self.stop()
+            return False
+        expiration_time = datetime.strptime(post_key_exp_result, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=self.local_tz)
+        remaining = (expiration_time - datetime.now(self.server_tz)).total_seconds()
+        self.deadline = monotonic() + remaining
+        # Once more shortly before the expiry in case the key was extended, and at the expiry itself
+        check_before = self.deadline - self.revalidate_before
+        self._next_validation = check_before if check_before > monotonic() else self.deadline
+        self.log.debug(f"Key expiration time: {expiration_time}, {int(remaining)} seconds remaining.")
+        return True
+
+    def run(self) -> None:
+        """Countdown loop, runs while api.countdown_active is set."""
+        self.deadline = None
+        self._next_validation = 0.0
+        next_data_refresh = 0.0
+        self._shown_text = None
+        while self.api.countdown_active:
+            wait = self.retry_interval
+            try:
+                if not self.api.api_key["value"]:
+                    raise Exception("Request to get the expiration time will not be sent because the API key does not exist.")
+                if self.api.rsi_handle["current"] == "N/A":
+                    self.log.debug("start_api_key_countdown(): RSI handle name does not exist. Game was closed?")
+                else:
+                    if monotonic() >= self._next_validation and not self._validate():
+                        continue
+                    remaining = self.remaining()
+                    if remaining is not None and remaining <= 0:
+                        self.log.error("Key expired. Please enter a new Kill Tracker key.")
+                        self.stop()
+                        continue
+                    if remaining is not None:
+                        countdown_text = self.countdown_text(int(remaining))
+                        if countdown_text != self._shown_text:
+                            self._shown_text = countdown_text
+                            self.api.gui.api_status_label.config(text=countdown_text, fg=self.api.key_status_valid_color)
+                        wait = 60 if remaining > 3600 else 1
+                    if monotonic() >= next_data_refresh:
+                        next_data_refresh = monotonic() + self.data_refresh_interval
+                        self.data_refreshes += 1
+                        self.log.debug("Pulling SC data mappings from Servitor.")
+                        self.api.get_data_map("weapons")
+                        # Ship ids teach the zone classifier new manufacturer codes
+                        self.api.get_data_map("ships")
+                        self.api.get_data_map("ignoredVictimRules")
+                    wait = max(0.0, min(wait, self._next_validation - monotonic(), next_data_refresh - monotonic()))
+            except Exception as e:
+                self.log.error(f"General error in key expiration countdown: {e.__class__.__name__} {e}")
+            self._wake.wait(wait)
+            self._wake.clear()
@@ -0,0 +1,112 @@
+"""Coalesce kill uploads that happen close together into batched Servitor posts."""
+from __future__ import annotations
+
+from collections import deque
+from threading import Condition, Thread
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+
+class KillBatcher:
+    """Collect kills for up to ``window`` seconds or ``max_batch`` kills, then post them together.
+
+    ``add`` only queues the kill and returns. A worker thread waits for the
+    first kill of a batch, keeps collecting until the window closes or the
+    batch is full, and hands the kills to ``api.post_kill_batch`` grouped by
+    endpoint, in the order they happened. A lone kill is sent as a normal
+    single post. At most ``maxsize`` kills wait at a time, the oldest ones go
+    to their ``on_overflow`` fallback beyond that, or are dropped without one.
+    """
+
+    def __init__(self, api, window: float = 0.5, max_batch: int = 25, maxsize: int = 1000) -> None:
+        self.log = None
+        self.api = api
+        self.window = window
+        self.max_batch = max_batch
+        self.maxsize = maxsize
+        self._pending = deque()
+        self._batch_started = 0.0
+        self._cond = Condition()
+        self._worker = None
+        self.batches = 0
+        self.kills = 0
+        self.overflowed = 0
+        self.dropped = 0
+
+    def set_logger(self, logger) -> None:
+        self.log = logger
+
+    def add(self, kill_result, endpoint: str, on_overflow: Optional[Callable] = None) -> None:
+        """Queue a kill for upload to ``endpoint``. ``on_overflow(kill_result, endpoint)`` takes it if it gets evicted."""
+        with self._cond:
+            evicted = self._pending.popleft() if len(self._pending) >= self.maxsize else None
+            if not self._pending:
+                self._batch_started = monotonic()
+            self._pending.append((kill_result, endpoint, on_overflow, monotonic()))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._run, name="kill-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        if evicted is not None:
+            self._evict(evicted)
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    @property
+    def oldest_age(self) -> float:
+        """Seconds the oldest waiting kill has been queued, 0 when none is waiting."""
+        try:
+            return monotonic() - self._pending[0][3]
+        except IndexError:
+            return 0.0
+
+    def summary(self) -> str:
+        average = self.kills / self.batches if self.batches else 0.0
+        return (
+            f"{self.depth} waiting, oldest {self.oldest_age:.1f} s, {self.kills} kills in {self.batches} posts "
+            f"(avg {average:.1f}), {self.overflowed} overflowed, {self.dropped} dropped"
+        )
+
+    def _evict(self, item) -> None:
+        kill_result, endpoint, on_overflow, _ = item
+        self.overflowed += 1
+        if on_overflow is None:
+            self.dropped += 1
+            if self.log:
+                self.log.warning(f"add(): Kill upload queue is full, dropped a kill for {endpoint}.")
+            return
+        try:
+            on_overflow(kill_result, endpoint)
+        except Exception as e:
+            if self.log:
+                self.log.error(f"_evict(): {e.__class__.__name__} {e}")
+
+    def _take_batch(self) -> List:
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            # Kills left over from a full batch have waited long enough, their window is already over
+            while len(self._pending) < self.max_batch:
+                remaining = self._batch_started + self.window - monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            count = min(len(self._pending), self.max_batch)
+            return [self._pending.popleft() for _ in range(count)]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            by_endpoint: Dict[str, List] = {}
+            for kill_result, endpoint, _, _ in batch:
+                by_endpoint.setdefault(endpoint, []).append(kill_result)
+            for endpoint, kill_results in by_endpoint.items():
+                try:
+                    self.api.post_kill_batch(kill_results, endpoint)
+                except Exception as e:
+                    if self.log:
+                        self.log.error(f"_run(): {e.__class__.__name__} {e}")
+                self.batches += 1
+                self.kills += len(kill_results)
@@ -0,0 +1,75 @@
+"""Positional parser for the CActor::Kill lines of Game.log."""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+
+class KillLine:
+    """The fields of one CActor::Kill line, as written by the game (quotes and brackets removed)."""
+
+    __slots__ = (
+        "time", "victim", "victim_id", "zone", "killer", "killer_id", "weapon", "weapon_class", "damage_type",
+    )
+
+    def __init__(self, time, victim, victim_id, zone, killer, killer_id, weapon, weapon_class, damage_type) -> None:
+        self.time = time
+        self.victim = victim
+        self.victim_id = victim_id
+        self.zone = zone
+        self.killer = killer
+        self.killer_id = killer_id
+        self.weapon = weapon
+        self.weapon_class = weapon_class
+        self.damage_type = damage_type
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"KillLine({values})"
+
+
+class KillLineParser:
+    """Cut a kill line apart at its literal anchors in a single left to right pass.
+
+        <2025-10-15T20:24:35.039Z> [Notice] <Actor Death> CActor::Kill: 'victim' [id] in zone 'zone'
+        killed by 'killer' [id] using 'weapon' [Class unknown] with damage type 'type' from direction ...
+
+    Every field ends at the text that follows it in the format, so names are
+    taken whole even if they contain spaces, and a line that does not follow the
+    format is rejected with the reason instead of yielding shifted fields.
+    """
+
+    marker = "CActor::Kill: '"
+    # (field, text closing it) in line order, each field starts right after the previous closing text
+    fields = (
+        ("victim", "' ["),
+        ("victim_id", "] in zone '"),
+        ("zone", "' killed by '"),
+        ("killer", "' ["),
+        ("killer_id", "] using '"),
+        ("weapon", "' ["),
+        ("weapon_class", "] with damage type '"),
+        ("damage_type", "'"),
+    )
+    required = frozenset(("victim", "victim_id", "killer", "killer_id", "weapon"))
+
+    def parse(self, line: str) -> Tuple[Optional[KillLine], str]:
+        """Return (KillLine, "") for a well formed kill line, otherwise (None, why it was rejected)."""
+        if not line.startswith("<"):
+            return None, "line does not start with a timestamp"
+        time_end = line.find(">")
+        if time_end == -1:
+            return None, "timestamp is not closed"
+        pos = line.find(self.marker, time_end)
+        if pos == -1:
+            return None, "not a CActor::Kill line"
+        pos += len(self.marker)
+        values = [line[:time_end + 1]]
+        for field, closing in self.fields:
+            end = line.find(closing, pos)
+            if end == -1:
+                return None, f"{field} is not followed by {closing!r}"
+            if end == pos and field in self.required:
+                return None, f"{field} is empty"
+            values.append(line[pos:end])
+            pos = end + len(closing)
+        return KillLine(*values), ""
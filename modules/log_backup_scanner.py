@@ -0,0 +1,129 @@
+"""Mine the rotated Star Citizen logs in logbackups/ for kills and deaths."""
+from __future__ import annotations
+
+import mmap
+import os
+from heapq import merge
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+from modules.log_backfill import ParallelLogClassifier
+from modules.log_events import LogEvent
+from modules.log_tailer import LinePrefilter
+
+
+class BackupScanState:
+    """Game mode and ship state of one backup log, kept apart from the live parser."""
+
+    def __init__(self) -> None:
+        self.game_mode = "Nothing"
+        self.active_ship = {"current": "FPS", "previous": "N/A"}
+        self.active_ship_id = "N/A"
+
+
+class LogBackupScanner:
+    """Scan Game.log backups through a memory map and classify the player's kills and deaths.
+
+    Marker lookups run over the mapped file, only the lines that carry a marker
+    are ever turned into Python strings, once each even with several markers.
+    Large backups are classified across a process pool instead. Every login in
+    a log switches the player the following events are attributed to.
+    Classification is delegated to the LogParser so historical events come out
+    exactly like live ones.
+    """
+
+    login_marker = b"<Legacy login response> [CIG-net] User Login Success"
+    context_marker = b"<Context Establisher Done>"
+    vehicle_marker = b"<Vehicle Control Flow>"
+    kill_marker = b"<Actor Death>"
+
+    def __init__(self, log_parser) -> None:
+        self.parser = log_parser
+        self.classifier = ParallelLogClassifier(
+            LinePrefilter((self.login_marker, self.context_marker, self.vehicle_marker, self.kill_marker))
+        )
+
+    @staticmethod
+    def find_backup_logs(log_file_location: str) -> List[Path]:
+        """List the backups next to Game.log, oldest first."""
+        backup_dir = Path(log_file_location).parent / "logbackups"
+        if not backup_dir.is_dir():
+            return []
+        return sorted(backup_dir.glob("*.log"), key=lambda backup: backup.stat().st_mtime)
+
+    def scan_backups(self, log_file_location: str) -> Iterator[Tuple[Path, LogEvent]]:
+        """Yield (backup path, kill result) for every kill or death found in the backups."""
+        for backup in self.find_backup_logs(log_file_location):
+            for kill_result in self.scan_file(backup):
+                yield backup, kill_result
+
+    def scan_file(self, log_path) -> List[LogEvent]:
+        """Classify every kill and death of the logged in player in a single log file."""
+        with open(log_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            if self.classifier.should_parallelize(0, size):
+                return self._fold(list(self.classifier.iter_lines(str(log_path), 0, size)))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._scan_mapped(mapped)
+
+    def _scan_mapped(self, mapped: mmap.mmap) -> List[LogEvent]:
+        if mapped.find(self.login_marker) == -1:
+            return []
+        markers = (self.login_marker, self.context_marker, self.vehicle_marker, self.kill_marker)
+        positions = merge(*(self._positions(mapped, marker) for marker in markers))
+        return self._fold(self._marker_lines(mapped, positions))
+
+    def _fold(self, lines: Iterable[str]) -> List[LogEvent]:
+        """Apply the marker lines in file order to a fresh scan state and collect the logged in player's kills and deaths."""
+        login_marker = self.login_marker.decode()
+        context_marker = self.context_marker.decode()
+        vehicle_marker = self.vehicle_marker.decode()
+        kill_marker = self.kill_marker.decode()
+        rsi_handle = "N/A"
+        state = BackupScanState()
+        results = []
+        for line in lines:
+            if login_marker in line:
+                rsi_handle = self.parser.parse_rsi_handle(line)
+            elif context_marker in line:
+                state.game_mode = self.parser.parse_game_mode(line)
+                if state.game_mode == "SC_Default":
+                    state.active_ship["current"] = "FPS"
+                    state.active_ship_id = "N/A"
+            elif vehicle_marker in line:
+                change, ship_data = self.parser.parse_vehicle_control(line)
+                if change == "enter" and ship_data:
+                    state.active_ship["current"] = ship_data["ship_type"]
+                    state.active_ship["previous"] = ship_data["ship_type"]
+                    state.active_ship_id = ship_data["ship_id"]
+                elif change == "exit":
+                    state.active_ship["current"] = "FPS"
+                    state.active_ship_id = "N/A"
+            elif kill_marker in line and rsi_handle != "N/A" and rsi_handle in line and "CActor::Kill" in line and not self.parser.check_ignored_victims(line):
+                kill_result = self.parser.parse_kill_line(line, rsi_handle, state)
+                if kill_result.result in ("killer", "killed", "suicide"):
+                    results.append(kill_result)
+        return results
+
+    @staticmethod
+    def _positions(mapped: mmap.mmap, marker: bytes) -> Iterator[Tuple[int, bytes]]:
+        pos = mapped.find(marker)
+        while pos != -1:
+            yield pos, marker
+            pos = mapped.find(marker, pos + len(marker))
+
+    @staticmethod
+    def _marker_lines(mapped: mmap.mmap, positions: Iterable[Tuple[int, bytes]]) -> Iterator[str]:
+        """Decode the line around each marker position, a line holding several markers only once."""
+        last_start = -1
+        for pos, _ in positions:
+            start = mapped.rfind(b"\n", 0, pos) + 1
+            if start == last_start:
+                continue
+            last_start = start
+            end = mapped.find(b"\n", pos)
+            if end == -1:
+                end = len(mapped)
+            yield mapped[start:end].rstrip(b"\r").decode("utf-8", errors="replace") + "\n"
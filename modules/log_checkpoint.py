@@ -0,0 +1,101 @@
+"""Persisted read position for the Game.log so restarts do not replay the whole file."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from time import time
+from typing import Dict, Optional
+
+
+class LogCheckpoint:
+    """Save and validate the parser's last processed byte offset in Game.log.
+
+    A checkpoint is only trusted when the log on disk is still the same file:
+    same path, same creation time, a size that has not shrunk below the saved
+    offset and the same leading bytes (the log header carries the session start
+    time, which also catches Windows reusing the creation time of a rotated file).
+    """
+
+    head_size = 512
+
+    def __init__(self, checkpoint_path: Optional[Path] = None) -> None:
+        self.checkpoint_path = checkpoint_path or Path.cwd() / "bv_killtracker_log_checkpoint.json"
+        self.last_saved_offset = None
+
+    @staticmethod
+    def _file_created(file_stat: os.stat_result) -> float:
+        """Get the creation time of the log, falling back to the inode where the OS has no such thing."""
+        created = getattr(file_stat, "st_birthtime", None)
+        if created is not None:
+            return created
+        if sys.platform == "win32":
+            return file_stat.st_ctime
+        return float(file_stat.st_ino)
+
+    def _head_digest(self, log_file_location: str, length: Optional[int] = None) -> str:
+        with open(log_file_location, "rb") as f:
+            return hashlib.sha1(f.read(self.head_size if length is None else length)).hexdigest()
+
+    def identify(self, log_file_location: str) -> Dict:
+        """Get the identity of the log file as it is right now."""
+        file_stat = os.stat(log_file_location)
+        head_length = min(file_stat.st_size, self.head_size)
+        return {
+            "log_file": os.path.abspath(log_file_location),
+            "size": file_stat.st_size,
+            "created": self._file_created(file_stat),
+            "head": self._head_digest(log_file_location, head_length),
+            "head_length": head_length,
+        }
+
+    def is_same_log(self, identity: Dict, log_file_location: str) -> bool:
+        """Check that the log on disk is still the file ``identity`` was taken from and has not shrunk."""
+        try:
+            file_stat = os.stat(log_file_location)
+            # A log identified while shorter than head_size is compared on the bytes it had then
+            head = self._head_digest(log_file_location, identity.get("head_length", self.head_size))
+        except OSError:
+            return False
+        return (
+            identity.get("log_file") == os.path.abspath(log_file_location)
+            and identity.get("created") == self._file_created(file_stat)
+            and identity.get("head") == head
+            and identity.get("size", 0) <= file_stat.st_size
+        )
+
+    def load(self, log_file_location: str) -> Optional[Dict]:
+        """Return the saved checkpoint if it still belongs to the current log, otherwise None."""
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            size = os.stat(log_file_location).st_size
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(checkpoint, dict)
+            or not isinstance(checkpoint.get("offset"), int)
+            or checkpoint["offset"] > size
+            or not self.is_same_log(checkpoint, log_file_location)
+        ):
+            return None
+        self.last_saved_offset = checkpoint["offset"]
+        return checkpoint
+
+    def save(self, log_file_location: str, offset: int, game_mode: str, active_ship: str, active_ship_id: str) -> None:
+        """Atomically write the checkpoint for ``offset`` together with the parser state at that point."""
+        checkpoint = self.identify(log_file_location)
+        checkpoint.update({
+            "offset": offset,
+            "game_mode": game_mode,
+            "active_ship": active_ship,
+            "active_ship_id": active_ship_id,
+            "saved_at": time(),
+        })
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+        self.last_saved_offset = offset
@@ -0,0 +1,124 @@
+"""Compact records for the kills, deaths and zone changes parsed out of Game.log."""
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+
+class LogEvent:
+    """A parsed log event. Plain LogEvents carry only an outcome such as "exclusion" or "reset".
+
+    Subclasses list their Servitor payload keys in ``fields``, which double as
+    their ``__slots__``. Equality and hashing go over the outcome and those
+    fields only, so events can be deduplicated in sets and dicts directly.
+    """
+
+    __slots__ = ("result",)
+    fields: Tuple[str, ...] = ()
+
+    def __init__(self, result: str = "") -> None:
+        self.result = result
+
+    def _key(self) -> tuple:
+        return (self.result,) + tuple(getattr(self, name) for name in self.fields)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}(result={self.result!r}{', ' if values else ''}{values})"
+
+    def to_payload(self) -> Dict:
+        """Build the JSON body Servitor expects for this event."""
+        return {name: getattr(self, name) for name in self.fields}
+
+    def to_dict(self) -> Dict:
+        """The legacy {"result": ..., "data": ...} shape, used for the kill outbox."""
+        return {"result": self.result, "data": self.to_payload()}
+
+
+class KillEvent(LogEvent):
+    """The player killed someone (result "killer")."""
+
+    fields = (
+        "player", "killers_ship", "victim", "time", "zone", "weapon", "game_mode", "client_ver", "anonymize",
+    )
+    __slots__ = fields
+
+    def __init__(self, player, killers_ship, victim, time, zone, weapon, game_mode, client_ver, anonymize) -> None:
+        self.result = "killer"
+        self.player = player
+        self.killers_ship = killers_ship
+        self.victim = victim
+        self.time = time
+        self.zone = zone
+        self.weapon = weapon
+        self.game_mode = game_mode
+        self.client_ver = client_ver
+        self.anonymize = anonymize
+
+    def to_payload(self) -> Dict:
+        return {
+            "player": self.player,
+            "killers_ship": self.killers_ship,
+            "victim": self.victim,
+            "time": self.time,
+            "zone": self.zone,
+            "weapon": self.weapon,
+            "rsi_profile": f"https://robertsspaceindustries.com/citizens/{self.victim}",
+            "game_mode": self.game_mode,
+            "client_ver": self.client_ver,
+            "anonymize_state": {"enabled": self.anonymize},
+        }
+
+
+class DeathEvent(LogEvent):
+    """The player died, either "killed" by someone else or by "suicide"."""
+
+    fields = ("player", "victim", "killer", "weapon", "zone", "game_mode", "client_ver")
+    __slots__ = fields
+
+    def __init__(self, result, player, victim, killer, weapon, zone, game_mode, client_ver) -> None:
+        self.result = result
+        self.player = player
+        self.victim = victim
+        self.killer = killer
+        self.weapon = weapon
+        self.zone = zone
+        self.game_mode = game_mode
+        self.client_ver = client_ver
+
+
+class ACDeathEvent(LogEvent):
+    """The player was killed in Arena Commander, reported from the killer's point of view."""
+
+    fields = ("time", "player", "victim", "victim_ship", "weapon", "zone", "game_mode", "client_ver")
+    __slots__ = fields
+
+    def __init__(self, time, player, victim, victim_ship, weapon, zone, game_mode, client_ver) -> None:
+        self.result = "killed"
+        self.time = time
+        self.player = player
+        self.victim = victim
+        self.victim_ship = victim_ship
+        self.weapon = weapon
+        self.zone = zone
+        self.game_mode = game_mode
+        self.client_ver = client_ver
+
+
+class ZoneEvent(LogEvent):
+    """The player's zone changed to a ship (result "zone")."""
+
+    fields = ("ship_type", "ship_id")
+    __slots__ = fields
+
+    def __init__(self, ship_type, ship_id) -> None:
+        self.result = "zone"
+        self.ship_type = ship_type
+        self.ship_id = ship_id
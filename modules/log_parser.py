@@ -1,11 +1,20 @@
 import re
-from datetime import datetime
-from time import sleep
+from datetime import datetime, timezone
+from time import sleep, monotonic, time
 from os import stat
 from threading import Thread
+from typing import Optional
 
 # Continental bounty helpers
 from modules.bounty_tracker import BountyTracker
+from modules.log_tailer import LinePrefilter, LogReader, LogTailer
+from modules.log_checkpoint import LogCheckpoint
+from modules.log_backup_scanner import LogBackupScanner
+from modules.log_backfill import ParallelLogClassifier
+from modules.log_timestamp import LogTimestampParser
+from modules.log_events import ACDeathEvent, DeathEvent, KillEvent, LogEvent, ZoneEvent
+from modules.kill_line import KillLineParser
+from modules.kill_batcher import KillBatcher
 
 class LogParser():
     """Parses the game.log file for Star Citizen."""
@@ -31,6 +40,13 @@ class LogParser():
         self.max_killstreak = 0
         self.kill_total = 0
         self.death_total = 0
+        self.latency_report_interval = 60
+        self.checkpoint = LogCheckpoint()
+        self.checkpoint_interval = 10
+        self.login_success_marker = "<Legacy login response> [CIG-net] User Login Success"
+        self.character_status_marker = "AccountLoginCharacterStatus_Character"
+        self.identity_prefilter = LinePrefilter((self.login_success_marker.encode(), self.character_status_marker.encode()))
+        self._identity_scan = {"identity": None, "offset": 0, "handle": "N/A", "geid": "N/A"}
         self.environment_killer_markers = (
             "npc",
             "ai",
@@ -53,13 +69,41 @@ class LogParser():
         )
         self.collision_markers = ("collision", "crash", "impact")
         
-        self.global_ship_list = [
-            'DRAK', 'ORIG', 'AEGS', 'ANVL', 'CRUS', 'BANU', 'MISC',
-            'KRIG', 'XNAA', 'ARGO', 'VNCL', 'ESPR', 'RSI', 'CNOU',
-            'GRIN', 'TMBL', 'GAMA'
-        ]
-
         self.bounty_tracker = BountyTracker(self.gui, self.sounds)
+        self.backup_scanner = LogBackupScanner(self)
+
+        # The <Tag> right after the log level decides which handler a line goes to, every other line is dropped.
+        # Handlers still check their own markers, some events show up under more than one tag across game builds.
+        self.tag_search_limit = 64
+        self.line_handlers = {
+            "<Vehicle Control Flow>": self._on_vehicle_control_flow,
+            "<Context Establisher Done>": self._on_context_established,
+            "<Spawn Flow>": self._on_vehicle_spawned,
+            "<CPlayerShipRespawnManager::OnVehicleSpawned>": self._on_vehicle_spawned,
+            "<Vehicle Destruction>": self._on_vehicle_destruction,
+            "<[ActorState] Dead>": self._on_actor_state_dead,
+            "<CEntityComponentInstancedInterior::OnEntityEnterZone>": self._on_entity_enter_zone,
+            "<Actor Death>": self._on_actor_death,
+            "<Jump Drive State Changed>": self._on_jump_drive_state_changed,
+        }
+        # Respawns and the local death have moved between tags across game builds, lines whose tag is not
+        # registered are still matched on these markers anywhere in the line, as before the table.
+        # Only read_log_line falls back to them, and it is only fed lines that passed line_prefilter.
+        self.marker_handlers = (
+            ("CPlayerShipRespawnManager::OnVehicleSpawned", self._on_vehicle_spawned),
+            ("<local client>: Entering control state dead", self._on_actor_state_dead),
+        )
+        # Only lines that can reach a handler or the bounty tracker get decoded at all
+        self.line_prefilter = LinePrefilter(
+            [tag.encode() for tag in self.line_handlers] + [marker.encode() for marker, _ in self.marker_handlers],
+            BountyTracker.BYTE_TRIGGERS,
+        )
+        # Large old logs are classified on every core, the state changes are still applied in order here
+        self.backfill_classifier = ParallelLogClassifier(self.line_prefilter)
+        self.timestamp_parser = LogTimestampParser()
+        self.kill_line_parser = KillLineParser()
+        # Kills of a fleet fight that land within the window go up in one post
+        self.kill_batcher = KillBatcher(self.api, window=0.5, max_batch=25)
 
     def start_tail_log_thread(self) -> None:
         """Start the log tailing in a separate thread only if it's not already running."""
@@ -71,13 +115,12 @@ class LogParser():
 
     def tail_log(self) -> None:
         """Read the log file and display events in the GUI."""
+        tailer = LogTailer(self.log_file_location, prefilter=self.line_prefilter, checkpoint=self.checkpoint)
         try:
-            sc_log = open(self.log_file_location, "r")
-            if sc_log is None:
-                self.log.error(f"No log file found at {self.log_file_location}")
-                return
+            tailer.open()
         except Exception as e:
-            self.log.error(f"tail_log(): When opening log file: {e.__class__.__name__} {e}")
+            self.log.error(f"tail_log(): When opening log file {self.log_file_location}: {e.__class__.__name__} {e}")
+            return
         try:
             self.log.warning("Please enter Kill Tracker Key to establish a connection with Servitor. If you don't have a key from a previous session, please generate one in Discord.")
             sleep(1)
@@ -90,62 +133,131 @@ class LogParser():
         except Exception as e:
             self.log.error(f"tail_log(): When waiting for Servitor connection to be established: {e.__class__.__name__} {e}")
 
+        checkpoint = None
+        tracking = False
         try:
             # Read all lines to find out what game mode player is currently, in case they booted up late.
             # Don't upload kills, we don't want repeating last session's kills in case they are actually available.
             if self.monitoring["active"]:
-                self.log.info("Loading old log (if available)! Note that old kills shown will not be uploaded as they are stale.")
-                lines = sc_log.readlines()
-                self.log.debug(f"tail_log(): Number of lines in old log: {len(lines)}")
+                checkpoint = self.checkpoint.load(self.log_file_location)
+                if checkpoint:
+                    self.restore_checkpoint(checkpoint)
+                    tailer.open(checkpoint["offset"])
+                    self.log.info(f"Resuming the log from the last checkpoint at byte {checkpoint['offset']}. Note that old kills shown will not be uploaded as they are stale.")
+                else:
+                    self.log.info("Loading old log (if available)! Note that old kills shown will not be uploaded as they are stale.")
+                old_line_count = self.load_old_log(tailer)
+                self.log.debug(f"tail_log(): Number of relevant lines in old log: {old_line_count}")
         except Exception as e:
             self.log.error(f"tail_log(): When reading old log file: {e.__class__.__name__} {e}")
 
-        for line in lines:
-            try:
-                if not self.api.api_key["value"] or not self.monitoring["active"]:
-                    self.log.error("Key expired or SC was closed. Loading old log stopped.")
-                    break
-                self.read_log_line(line, False)
-            except Exception as e:
-                self.log.warning(f"Could not read line from old log file, continuing anyway. Error: {e.__class__.__name__} {e}")
-
         try:
-            # After loading old log, always default to FPS on the label
+            # After loading old log, always default to FPS on the label unless the ship came from a live checkpoint
             if self.monitoring["active"]:
-                self.active_ship["current"] = "FPS"
-                self.active_ship_id = "N/A"
-                self.gui.update_vehicle_status("FPS")
-                last_log_file_size = stat(self.log_file_location).st_size
-                self.log.debug(f"tail_log(): Last log size: {last_log_file_size}.")
+                if not checkpoint:
+                    self.active_ship["current"] = "FPS"
+                    self.active_ship_id = "N/A"
+                self.gui.update_vehicle_status(self.active_ship["current"])
+                self.log.debug(f"tail_log(): Last log offset: {tailer.offset}. Change notifications: {tailer.uses_notifications}.")
+                self.save_checkpoint(tailer)
+                tracking = True
                 self.log.success("Kill Tracking initiated.")
                 self.log.success("Go Forth And Slaughter...")
         except Exception as e:
             self.log.error(f"Error doing pre-log reading setup: {e.__class__.__name__} {e}")
-        
+
         # Main loop to monitor the log
+        last_latency_report = monotonic()
+        last_checkpoint = monotonic()
         while self.monitoring["active"]:
             try:
                 if not self.api.api_key["value"]:
                     self.log.error("Key is invalid. Kill Tracking is not active...")
                     sleep(5)
                     continue
-                where = sc_log.tell()
-                line = sc_log.readline()
-                if not line:
-                    sleep(1)
-                    sc_log.seek(where)
-                    if last_log_file_size > stat(self.log_file_location).st_size:
-                        sc_log.close()
-                        sc_log = open(self.log_file_location, "r")
-                        last_log_file_size = stat(self.log_file_location).st_size
+                lines = tailer.read_lines()
+                if lines:
+                    tailer.dispatch(lines, self.dispatch_log_line, True)
+                elif tailer.has_rotated():
+                    self.log.debug("tail_log(): Game log was rotated, reopening it.")
+                    tailer.reopen()
                 else:
-                    self.read_log_line(line, True)
+                    tailer.wait()
+                if monotonic() - last_latency_report >= self.latency_report_interval:
+                    last_latency_report = monotonic()
+                    if tailer.latency.count:
+                        self.log.debug(f"tail_log(): Log-to-dispatch latency: {tailer.latency.summary()}")
+                        tailer.latency.reset()
+                    if self.kill_batcher.kills or self.kill_batcher.depth:
+                        self.log.debug(f"tail_log(): Kill uploads: {self.kill_batcher.summary()}")
+                if monotonic() - last_checkpoint >= self.checkpoint_interval:
+                    last_checkpoint = monotonic()
+                    self.save_checkpoint(tailer)
             except Exception as e:
                 self.log.error(f"Error reading game log file: {e.__class__.__name__} {e}")
-        sc_log.close()
+        if tracking:
+            self.save_checkpoint(tailer)
+        tailer.close()
         self.log.info("Game log monitoring has stopped.")
         self.gui.update_vehicle_status("N/A")
 
+    def load_old_log(self, tailer: LogReader) -> int:
+        """Replay the existing log to restore the game mode and ship state without uploading kills."""
+        line_count = 0
+        log_file_location = tailer.log_file_location
+        begin = tailer.offset
+        end = self.backfill_classifier.last_line_end(log_file_location, stat(log_file_location).st_size)
+        parallel = self.backfill_classifier.should_parallelize(begin, end)
+        if parallel:
+            self.log.debug(f"load_old_log(): Classifying {(end - begin) // 2 ** 20} MB of old log on {self.backfill_classifier.workers} processes.")
+            lines = self.backfill_classifier.iter_lines(log_file_location, begin, end)
+        else:
+            lines = tailer.iter_lines()
+        try:
+            for line in lines:
+                if not self.api.api_key["value"] or not self.monitoring["active"]:
+                    self.log.error("Key expired or SC was closed. Loading old log stopped.")
+                    break
+                self.dispatch_log_line(line, False)
+                line_count += 1
+        finally:
+            if parallel:
+                # Shuts the process pool down, also when the replay stopped early or raised
+                lines.close()
+        if parallel:
+            # Live tailing picks up after the classified part, never replay stale kills as new ones
+            tailer.open(end)
+        return line_count
+
+    def restore_checkpoint(self, checkpoint: dict) -> None:
+        """Restore the parser state saved alongside a log checkpoint."""
+        self.game_mode = checkpoint.get("game_mode", self.game_mode)
+        self.active_ship["current"] = checkpoint.get("active_ship", "FPS")
+        self.active_ship_id = checkpoint.get("active_ship_id", "N/A")
+        self.log.debug(f"restore_checkpoint(): Restored game mode {self.game_mode}, ship {self.active_ship['current']} (ID: {self.active_ship_id}).")
+
+    def save_checkpoint(self, tailer: LogTailer) -> None:
+        """Persist the current read position and parser state if anything was read since the last save."""
+        try:
+            if tailer.offset == self.checkpoint.last_saved_offset:
+                return
+            self.checkpoint.save(
+                self.log_file_location, tailer.offset, self.game_mode, self.active_ship["current"], self.active_ship_id
+            )
+            self.log.debug(f"save_checkpoint(): Saved log checkpoint at byte {tailer.offset}.")
+        except Exception as e:
+            self.log.error(f"save_checkpoint(): {e.__class__.__name__} {e}")
+
+    def dispatch_log_line(self, line: str, upload_kills: bool) -> None:
+        """Hand a single line to the parser without letting a bad line stop the tail loop."""
+        try:
+            self.read_log_line(line, upload_kills)
+        except Exception as e:
+            if upload_kills:
+                self.log.error(f"Error reading game log file: {e.__class__.__name__} {e}")
+            else:
+                self.log.warning(f"Could not read line from old log file, continuing anyway. Error: {e.__class__.__name__} {e}")
+
     def _extract_ship_info(self, line):
         match = re.search(r"for '([\w]+(?:_[\w]+)+)_(\d+)'", line)
         if match:
@@ -155,8 +267,16 @@ class LogParser():
         return None
 
     def _extract_timestamp(self, line):
+        return self.parse_event_time(line)[0]
+
+    def parse_event_time(self, line: str):
+        """Get the (HH:MM:SS display time, UTC epoch) of a log line, falling back to now if it has none."""
         if not line:
-            return datetime.now().strftime("%H:%M:%S")
+            return datetime.now().strftime("%H:%M:%S"), time()
+
+        event_time = self.timestamp_parser.parse(line)
+        if event_time:
+            return event_time
 
         if line.startswith("<") and ">" in line:
             raw_timestamp = line[1:line.index(">")]
@@ -164,171 +284,228 @@ class LogParser():
             for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%H:%M:%S", "%H:%M:%S.%f"):
                 try:
                     parsed = datetime.strptime(cleaned, fmt)
-                    return parsed.strftime("%H:%M:%S")
+                    return parsed.strftime("%H:%M:%S"), self._utc_epoch(parsed)
                 except ValueError:
                     continue
             try:
                 parsed = datetime.fromisoformat(raw_timestamp)
-                return parsed.strftime("%H:%M:%S")
+                return parsed.strftime("%H:%M:%S"), self._utc_epoch(parsed)
             except ValueError:
                 pass
 
-        return datetime.now().strftime("%H:%M:%S")
+        return datetime.now().strftime("%H:%M:%S"), time()
+
+    @staticmethod
+    def _utc_epoch(parsed: datetime) -> float:
+        """Epoch of a parsed log time. Log times are UTC, a bare clock time has no date to anchor it so use now."""
+        if parsed.year == 1900:
+            return time()
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    def route_log_line(self, line: str):
+        """Find the handler registered for the line's <Tag>, or None if nothing cares about it."""
+        # Lines look like: <2025-10-15T20:24:35.039Z> [Notice] <Actor Death> CActor::Kill: ...
+        tag_start = line.find("] <", 0, self.tag_search_limit)
+        if tag_start == -1:
+            return None
+        tag_end = line.find(">", tag_start + 3)
+        return self.line_handlers.get(line[tag_start + 2:tag_end + 1])
+
+    def route_marker_line(self, line: str):
+        """Find the handler for a line by the markers of events that have no fixed tag, or None."""
+        for marker, handler in self.marker_handlers:
+            if marker in line:
+                return handler
+        return None
 
     def read_log_line(self, line: str, upload_kills: bool) -> None:
         # Always scan for Continental bounty interactions first when in the PU.
         if self.game_mode == "SC_Default":
             self.bounty_tracker.inspect_line(line)
 
-        if upload_kills and "<Vehicle Control Flow>" in line:
-                if (
-                    ("CVehicleMovementBase::SetDriver:" in line and "requesting control token for" in line) or
-                    ("CVehicle::Initialize::<lambda_1>::operator ():" in line and "granted control token for" in line)
-                ):
-                    ship_data = self._extract_ship_info(line)
-                    if ship_data:
-                        self.active_ship["current"] = ship_data["ship_type"]
-                        self.active_ship["previous"] = ship_data["ship_type"]
-                        self.active_ship_id = ship_data["ship_id"]
-                        self.log.info(f"Entered ship: {self.active_ship['current']} (ID: {self.active_ship_id})")
-                        self.gui.update_vehicle_status(self.active_ship["current"])
-                    return
-                if (
-                    ("CVehicleMovementBase::ClearDriver:" in line and "releasing control token for" in line) or
-                    ("losing control token for" in line)
-                ):
-                    self.active_ship["current"] = "FPS"
-                    self.active_ship_id = "N/A"
-                    self.log.info("Exited ship: Defaulted to FPS (on-foot)")
-                    self.gui.update_vehicle_status("FPS")
-                    return
-                
-        if "<Context Establisher Done>" in line:
-            self.set_game_mode(line)
-            self.log.debug(f"read_log_line(): set_game_mode with: {line}.")
-        elif "CPlayerShipRespawnManager::OnVehicleSpawned" in line and (
-                "SC_Default" != self.game_mode) and (self.player_geid["current"] in line):
+        # The tailer and the backfill only hand over prefiltered lines, so the marker fallback rarely runs
+        handler = self.route_log_line(line) or self.route_marker_line(line)
+        if handler:
+            handler(line, upload_kills)
+
+    def _on_vehicle_control_flow(self, line: str, upload_kills: bool) -> None:
+        if not upload_kills:
+            return
+        change, ship_data = self.parse_vehicle_control(line)
+        if change == "enter":
+            if ship_data:
+                self.active_ship["current"] = ship_data["ship_type"]
+                self.active_ship["previous"] = ship_data["ship_type"]
+                self.active_ship_id = ship_data["ship_id"]
+                self.log.info(f"Entered ship: {self.active_ship['current']} (ID: {self.active_ship_id})")
+                self.gui.update_vehicle_status(self.active_ship["current"])
+        elif change == "exit":
+            self.active_ship["current"] = "FPS"
+            self.active_ship_id = "N/A"
+            self.log.info("Exited ship: Defaulted to FPS (on-foot)")
+            self.gui.update_vehicle_status("FPS")
+
+    def parse_vehicle_control(self, line: str) -> tuple:
+        """Classify a Vehicle Control Flow line as ("enter", ship data), ("exit", None) or (None, None)."""
+        if (
+            ("CVehicleMovementBase::SetDriver:" in line and "requesting control token for" in line) or
+            ("CVehicle::Initialize::<lambda_1>::operator ():" in line and "granted control token for" in line)
+        ):
+            return "enter", self._extract_ship_info(line)
+        if (
+            ("CVehicleMovementBase::ClearDriver:" in line and "releasing control token for" in line) or
+            ("losing control token for" in line)
+        ):
+            return "exit", None
+        return None, None
+
+    def _on_context_established(self, line: str, upload_kills: bool) -> None:
+        self.set_game_mode(line)
+        self.log.debug(f"read_log_line(): set_game_mode with: {line}.")
+
+    def _on_vehicle_spawned(self, line: str, upload_kills: bool) -> None:
+        if (
+            "CPlayerShipRespawnManager::OnVehicleSpawned" in line and
+            "SC_Default" != self.game_mode and self.player_geid["current"] in line
+        ):
             self.set_ac_ship(line)
             self.log.debug(f"read_log_line(): set_ac_ship with: {line}.")
-        elif ("<Vehicle Destruction>" in line or
-            "<local client>: Entering control state dead" in line) and (
-                self.active_ship_id in line):
+
+    def _on_vehicle_destruction(self, line: str, upload_kills: bool) -> None:
+        if self.active_ship_id in line:
             self.log.debug(f"read_log_line(): destroy_player_zone with: {line}")
             self.destroy_player_zone()
-        elif self.rsi_handle["current"] in line:
-            if "OnEntityEnterZone" in line:
-                self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
-                self.set_player_zone(line, False)
-            if "CActor::Kill" in line and not self.check_ignored_victims(line) and upload_kills:
-                kill_result = self.parse_kill_line(line, self.rsi_handle["current"])
-                self.log.debug(f"read_log_line(): Processing kill_result with raw log: {line}.")
-                self.log.debug(f"read_log_line(): Enriched kill_result payload is: {kill_result}.")
-                event_time = self._extract_timestamp(line)
-                # Do not send
-                if kill_result["result"] == "exclusion" or kill_result["result"] == "reset":
-                    self.log.debug(f"read_log_line(): Not posting {kill_result['result']} death: {line}.")
-                    return
-                # Log a message for the current user's death
-                elif kill_result["result"] == "killed" or kill_result["result"] == "suicide":
-                    self.curr_killstreak = 0
-                    self.gui.curr_killstreak_label.config(text=f"Kill Streak: {self.curr_killstreak}", fg="#FFA500")
-                    self.death_total += 1
-                    self.gui.session_deaths_label.config(text=f"Session Deaths: {self.death_total}", fg="#f44747")
-                    self.log.info("You have fallen in the service of BlightVeil.")
-                    if kill_result["result"] == "killed":
-                        killer_name = kill_result["data"]["killer"]
-                        weapon_name = kill_result["data"].get("weapon")
-                        death_context = self._categorize_player_death(killer_name, weapon_name, line)
-                        weapon_text = weapon_name if weapon_name else "Unknown weapon"
-                        if death_context == "collision":
-                            death_message = "Collision"
-                        elif death_context == "environment":
-                            death_message = "NPC/Game Environment"
-                        else:
-                            death_message = f"{killer_name} killed you using {weapon_text}"
-                        self.log.info(death_message)
-
-                        self.gui.log_mode_kill(
-                            self.game_mode,
-                            event_time,
-                            death_message,
-                            "death",
-                            killer=killer_name,
-                            victim=kill_result["data"].get("victim"),
-                            context=death_context,
-                        )
+
+    def _on_actor_state_dead(self, line: str, upload_kills: bool) -> None:
+        if "<local client>: Entering control state dead" in line:
+            self._on_vehicle_destruction(line, upload_kills)
+
+    def _on_entity_enter_zone(self, line: str, upload_kills: bool) -> None:
+        if "OnEntityEnterZone" in line and self.rsi_handle["current"] in line:
+            self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
+            self.set_player_zone(line, False)
+
+    def _on_jump_drive_state_changed(self, line: str, upload_kills: bool) -> None:
+        self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
+        self.set_player_zone(line, True)
+
+    def _on_actor_death(self, line: str, upload_kills: bool) -> None:
+        if (
+            self.rsi_handle["current"] in line and "CActor::Kill" in line and upload_kills and
+            not self.check_ignored_victims(line)
+        ):
+            kill_result = self.parse_kill_line(line, self.rsi_handle["current"])
+            self.log.debug(f"read_log_line(): Processing kill_result with raw log: {line}.")
+            self.log.debug(f"read_log_line(): Enriched kill_result payload is: {kill_result}.")
+            event_time = self._extract_timestamp(line)
+            # Do not send
+            if kill_result.result == "exclusion" or kill_result.result == "reset":
+                self.log.debug(f"read_log_line(): Not posting {kill_result.result} death: {line}.")
+                return
+            # Log a message for the current user's death
+            elif kill_result.result == "killed" or kill_result.result == "suicide":
+                self.curr_killstreak = 0
+                self.gui.curr_killstreak_label.config(text=f"Kill Streak: {self.curr_killstreak}", fg="#FFA500")
+                self.death_total += 1
+                self.gui.session_deaths_label.config(text=f"Session Deaths: {self.death_total}", fg="#f44747")
+                self.log.info("You have fallen in the service of BlightVeil.")
+                if kill_result.result == "killed":
+                    killer_name = kill_result.killer
+                    weapon_name = kill_result.weapon
+                    death_context = self._categorize_player_death(killer_name, weapon_name, line)
+                    weapon_text = weapon_name if weapon_name else "Unknown weapon"
+                    if death_context == "collision":
+                        death_message = "Collision"
+                    elif death_context == "environment":
+                        death_message = "NPC/Game Environment"
                     else:
-                        suicide_weapon = kill_result["data"].get("weapon")
-                        if suicide_weapon:
-                            suicide_weapon = self.get_sc_data("weapons", suicide_weapon)
-                        suicide_description = "You died (self-inflicted)"
-                        if suicide_weapon:
-                            suicide_description += f" with {suicide_weapon}"
-                        self.gui.log_mode_kill(
-                            self.game_mode,
-                            event_time,
-                            suicide_description,
-                            "suicide",
-                            killer=kill_result["data"].get("killer"),
-                            victim=kill_result["data"].get("victim"),
-                            context="suicide",
-                        )
-                    if self.sounds:
-                        self.sounds.play_death_sound()
-                    # Send death-event to the server via heartbeat
-                    self.cm.post_heartbeat_event(kill_result["data"]["victim"], kill_result["data"]["zone"], None)
-                    self.destroy_player_zone()
-                    if kill_result["result"] == "killed" and self.game_mode == "EA_FreeFlight":
-                        death_result = self.parse_death_line(line, self.rsi_handle["current"])
-                        self.api.post_kill_event(death_result, "reportACKill")
-                # Log a message for the current user's kill
-                elif kill_result["result"] == "killer":
-                    self.curr_killstreak += 1
-                    if self.curr_killstreak > self.max_killstreak:
-                        self.max_killstreak = self.curr_killstreak
-                    self.kill_total += 1
-                    self.gui.curr_killstreak_label.config(text=f"Kill Streak: {self.curr_killstreak}", fg="#FFA500")
-                    self.gui.max_killstreak_label.config(text=f"Max Kill Streak: {self.max_killstreak}", fg="#00FF7F")
-                    self.gui.session_kills_label.config(text=f"Total Session Kills: {self.kill_total}", fg="#04B431")
-                    self.log.success(f"You have killed {kill_result['data']['victim']},")
-                    self.log.info(f"and brought glory to BlightVeil.")
-                    self.sounds.play_kill_sound()
-                    self.api.post_kill_event(kill_result, "reportKill")
-
-                    weapon_name = kill_result["data"].get("weapon")
-                    if weapon_name:
-                        weapon_name = self.get_sc_data("weapons", weapon_name)
-                    description = f"You killed {kill_result['data']['victim']}"
-                    if weapon_name:
-                        description += f" with {weapon_name}"
+                        death_message = f"{killer_name} killed you using {weapon_text}"
+                    self.log.info(death_message)
+
+                    self.gui.log_mode_kill(
+                        self.game_mode,
+                        event_time,
+                        death_message,
+                        "death",
+                        killer=killer_name,
+                        victim=kill_result.victim,
+                        context=death_context,
+                    )
+                else:
+                    suicide_weapon = kill_result.weapon
+                    if suicide_weapon:
+                        suicide_weapon = self.get_sc_data("weapons", suicide_weapon)
+                    suicide_description = "You died (self-inflicted)"
+                    if suicide_weapon:
+                        suicide_description += f" with {suicide_weapon}"
                     self.gui.log_mode_kill(
                         self.game_mode,
                         event_time,
-                        description,
-                        "kill",
-                        killer=kill_result["data"].get("player"),
-                        victim=kill_result["data"].get("victim"),
-                        context="pvp",
+                        suicide_description,
+                        "suicide",
+                        killer=kill_result.killer,
+                        victim=kill_result.victim,
+                        context="suicide",
+                    )
+                if self.sounds:
+                    self.sounds.play_death_sound()
+                # Send death-event to the server via heartbeat, the payload is taken now before the zone is reset
+                self.cm.post_heartbeat_event(kill_result.victim, kill_result.zone, None)
+                self.destroy_player_zone()
+                if kill_result.result == "killed" and self.game_mode == "EA_FreeFlight":
+                    death_event = self.parse_death_line(line, self.rsi_handle["current"])
+                    self.kill_batcher.add(death_event, "reportACKill", on_overflow=self.pickle_kill_event)
+            # Log a message for the current user's kill
+            elif kill_result.result == "killer":
+                self.curr_killstreak += 1
+                if self.curr_killstreak > self.max_killstreak:
+                    self.max_killstreak = self.curr_killstreak
+                self.kill_total += 1
+                self.gui.curr_killstreak_label.config(text=f"Kill Streak: {self.curr_killstreak}", fg="#FFA500")
+                self.gui.max_killstreak_label.config(text=f"Max Kill Streak: {self.max_killstreak}", fg="#00FF7F")
+                self.gui.session_kills_label.config(text=f"Total Session Kills: {self.kill_total}", fg="#04B431")
+                self.log.success(f"You have killed {kill_result.victim},")
+                self.log.info(f"and brought glory to BlightVeil.")
+                self.sounds.play_kill_sound()
+                self.kill_batcher.add(kill_result, "reportKill", on_overflow=self.pickle_kill_event)
+
+                weapon_name = kill_result.weapon
+                if weapon_name:
+                    weapon_name = self.get_sc_data("weapons", weapon_name)
+                description = f"You killed {kill_result.victim}"
+                if weapon_name:
+                    description += f" with {weapon_name}"
+                self.gui.log_mode_kill(
+                    self.game_mode,
+                    event_time,
+                    description,
+                    "kill",
+                    killer=kill_result.player,
+                    victim=kill_result.victim,
+                    context="pvp",
+                )
+
+                if self.game_mode == "SC_Default":
+                    self.bounty_tracker.handle_kill(
+                        killer=kill_result.player,
+                        victim=kill_result.victim,
+                        weapon=kill_result.weapon,
+                        raw_line=line,
                     )
 
-                    if self.game_mode == "SC_Default":
-                        self.bounty_tracker.handle_kill(
-                            killer=kill_result['data']['player'],
-                            victim=kill_result['data']['victim'],
-                            weapon=kill_result['data'].get('weapon'),
-                            raw_line=line,
-                        )
+            else:
+                self.log.error(f"Kill failed to parse: {line}")
 
-                else:
-                    self.log.error(f"Kill failed to parse: {line}")
-        elif "<Jump Drive State Changed>" in line:
-            self.log.debug(f"read_log_line(): set_player_zone with: {line}.")
-            self.set_player_zone(line, True)
+    @staticmethod
+    def parse_game_mode(line:str) -> str:
+        """Get the game rules from a Context Establisher Done line."""
+        return line.split(' ')[8].split("=")[1].strip("\"")
 
     def set_game_mode(self, line:str) -> None:
         """Parse log for current active game mode."""
-        split_line = line.split(' ')
-        curr_game_mode = split_line[8].split("=")[1].strip("\"")
+        curr_game_mode = self.parse_game_mode(line)
         if self.game_mode != curr_game_mode:
             self.game_mode = curr_game_mode
         if "SC_Default" == curr_game_mode:
@@ -351,42 +528,52 @@ class LogParser():
 
     def set_player_zone(self, line: str, use_jd) -> None:
         """Set current active ship zone."""
-        if not use_jd:
-            line_index = line.index("-> Entity ") + len("-> Entity ")
-        else:
-            line_index = line.index("adam: ") + len("adam: ")
-        if 0 == line_index:
+        zone_event = self.parse_zone_line(line, use_jd)
+        if zone_event is None:
+            return
+        if zone_event.ship_type == "FPS":
             self.log.debug(f"Active Zone Change: {self.active_ship['current']}")
             self.active_ship["current"] = "FPS"
             self.active_ship_id = "N/A"
             self.gui.update_vehicle_status("FPS")
             return
+        self.active_ship["current"] = zone_event.ship_type
+        self.active_ship["previous"] = zone_event.ship_type
+        self.active_ship_id = zone_event.ship_id
+        self.log.debug(f"Active Zone Change: {self.active_ship['current']} with ID: {self.active_ship_id}")
+        self.cm.post_heartbeat_event(None, None, self.active_ship["current"])
+        self.gui.update_vehicle_status(self.active_ship["current"])
+
+    def parse_zone_line(self, line: str, use_jd) -> Optional[ZoneEvent]:
+        """Get the ship zone an OnEntityEnterZone or jump drive line moves the player to, None if it is not a ship."""
+        if not use_jd:
+            line_index = line.index("-> Entity ") + len("-> Entity ")
+        else:
+            line_index = line.index("adam: ") + len("adam: ")
+        if 0 == line_index:
+            return ZoneEvent("FPS", "N/A")
         if not use_jd:
             potential_zone = line[line_index:].split(' ')[0]
             potential_zone = potential_zone[1:-1]
         else:
             potential_zone = line[line_index:].split(' ')[0]
-        for x in self.global_ship_list:
-            if potential_zone.startswith(x):
-                self.active_ship["current"] = potential_zone[:potential_zone.rindex('_')]
-                self.active_ship["previous"] = potential_zone[:potential_zone.rindex('_')]
-                self.active_ship_id = potential_zone[potential_zone.rindex('_') + 1:]
-                self.log.debug(f"Active Zone Change: {self.active_ship['current']} with ID: {self.active_ship_id}")
-                self.cm.post_heartbeat_event(None, None, self.active_ship["current"])
-                self.gui.update_vehicle_status(self.active_ship["current"])
-                return
-      
+        ship = self.api.sc_data_index["zones"].classify(potential_zone)
+        if ship is None:
+            return None
+        return ZoneEvent(*ship)
+
     def check_ignored_victims(self, line) -> bool:
         """Check if any ignored victims are present in the given line."""
-        for data in self.api.sc_data["ignoredVictimRules"]:
-            if data["value"].lower() in line.lower():
-                self.log.debug(f"Found the human readable string: {data['value']} in the raw log string: {line}")
-                return True
+        value = self.api.sc_data_index["ignoredVictimRules"].match(line)
+        if value is not None:
+            self.log.debug(f"Found the human readable string: {value} in the raw log string: {line}")
+            return True
         return False
 
-    def check_exclusion_scenarios(self, line:str) -> bool:
+    def check_exclusion_scenarios(self, line:str, game_mode:str = None) -> bool:
         """Check for kill edgecase scenarios."""
-        if self.game_mode == "EA_FreeFlight":
+        game_mode = game_mode or self.game_mode
+        if game_mode == "EA_FreeFlight":
             if "Crash" in line:
                 self.log.info("Probably a ship reset, ignoring kill!")
                 return False
@@ -394,7 +581,7 @@ class LogParser():
                 self.log.info("Self-destruct detected in Free Flight, ignoring kill!")
                 return False
 
-        elif self.game_mode == "EA_SquadronBattle":
+        elif game_mode == "EA_SquadronBattle":
             # Add your specific conditions for Squadron Battle mode
             if "Crash" in line:
                 self.log.info("Crash detected in Squadron Battle, ignoring kill!")
@@ -426,101 +613,74 @@ class LogParser():
     def get_sc_data(self, data_type:str, data_id:str) -> str:
         """Get the human readable string from the parsed log value."""
         try:
-            for data in self.api.sc_data[data_type]:
-                if data["id"] in data_id:
-                    self.log.debug(f"Found the human readable string: {data['name']} of the raw log string: {data_id}")
-                    return data["name"]
+            name = self.api.sc_data_index[data_type].resolve(data_id)
+            if name is not None:
+                self.log.debug(f"Found the human readable string: {name} of the raw log string: {data_id}")
+                return name
             self.log.warning(f"Did not find the human readable version of the raw log string: {data_id}")
         except Exception as e:
             self.log.error(f"get_weapon(): {e.__class__.__name__} {e}")
             return data_id
 
-    def parse_kill_line(self, line:str, curr_user:str):
-        """Parse kill event."""
+    def parse_kill_line(self, line:str, curr_user:str, state=None) -> LogEvent:
+        """Parse kill event. ``state`` supplies game mode and ship info, defaults to the live parser."""
+        state = state or self
         try:
-            kill_result = {"result": "", "data": {}}
-
-            if not self.check_exclusion_scenarios(line):
-                kill_result["result"] = "exclusion"
-                return kill_result
+            if not self.check_exclusion_scenarios(line, state.game_mode):
+                return LogEvent("exclusion")
             
-            split_line = line.split(' ')
-
-            kill_time = split_line[0].strip('\'')
-            killed = split_line[5].strip('\'')
-            killed_zone = split_line[9].strip('\'')
-            killer = split_line[12].strip('\'')
-            weapon = split_line[15].strip('\'')
-            rsi_profile = f"https://robertsspaceindustries.com/citizens/{killed}"
+            kill, reason = self.kill_line_parser.parse(line)
+            if not kill:
+                self.log.error(f"parse_kill_line(): Rejected kill line, {reason}: {line}")
+                return LogEvent()
+            kill_time = kill.time
+            killed = kill.victim
+            killed_zone = kill.zone
+            killer = kill.killer
+            weapon = kill.weapon
 
             if killed == killer:
                 # Current user killed themselves
-                kill_result["result"] = "suicide"
-                kill_result["data"] = {
-                    'player': curr_user,
-                    'victim': curr_user,
-                    'killer': curr_user,
-                    'weapon': weapon,
-                    'zone': killed_zone,
-                    'game_mode': self.game_mode,
-                    'client_ver': self.local_version
-                }
+                return DeathEvent(
+                    "suicide", curr_user, curr_user, curr_user, weapon, killed_zone, state.game_mode, self.local_version
+                )
             elif killed == curr_user:
                 mapped_weapon = self.get_sc_data("weapons", weapon)
                 # Current user died
-                kill_result["result"] = "killed"
-                kill_result["data"] = {
-                    'player': curr_user,
-                    'victim': curr_user,
-                    'killer': killer,
-                    'weapon': mapped_weapon,
-                    'zone': self.active_ship["current"],
-                    'game_mode': self.game_mode,
-                    'client_ver': self.local_version
-                }
+                return DeathEvent(
+                    "killed", curr_user, curr_user, killer, mapped_weapon, state.active_ship["current"],
+                    state.game_mode, self.local_version
+                )
             elif killer.lower() == "unknown":
                 # Potential Ship reset
-                kill_result["result"] = "reset"
+                return LogEvent("reset")
             else:
                 # Current user killed other player
-                if self.game_mode == "EA_FreeFlight" and self.active_ship["current"] == "FPS":
+                if state.game_mode == "EA_FreeFlight" and state.active_ship["current"] == "FPS":
                     # Handle ship change when people reset in AC FF too fast
-                    killers_ship = self.active_ship["previous"]
+                    killers_ship = state.active_ship["previous"]
                 else:
-                    killers_ship = self.active_ship["current"]
-
-                kill_result["result"] = "killer"
-                kill_result["data"] = {
-                    'player': curr_user,
-                    'killers_ship': killers_ship,
-                    'victim': killed,
-                    'time': kill_time,
-                    'zone': killed_zone,
-                    'weapon': weapon,
-                    'rsi_profile': rsi_profile,
-                    'game_mode': self.game_mode,
-                    'client_ver': self.local_version,
-                    'anonymize_state': self.anonymize_state
-                }
-            return kill_result
+                    killers_ship = state.active_ship["current"]
+
+                return KillEvent(
+                    curr_user, killers_ship, killed, kill_time, killed_zone, weapon, state.game_mode,
+                    self.local_version, self.anonymize_state["enabled"]
+                )
         except Exception as e:
             self.log.error(f"parse_kill_line(): {e.__class__.__name__} {e}")
-            return {"result": "", "data": None}
+            return LogEvent()
 
-    def parse_death_line(self, line:str, curr_user:str):
+    def parse_death_line(self, line:str, curr_user:str) -> LogEvent:
         """Parse death event."""
         try:
-            death_result = {"result": "", "data": {}}
-
             if not self.check_exclusion_scenarios(line):
-                death_result["result"] = "exclusion"
-                return death_result
+                return LogEvent("exclusion")
 
-            split_line = line.split(' ')
-            kill_time = split_line[0].strip('\'')
-            killer = split_line[12].strip('\'')
-            weapon = split_line[15].strip('\'')
-            mapped_weapon = self.get_sc_data("weapons", weapon)
+            kill, reason = self.kill_line_parser.parse(line)
+            if not kill:
+                self.log.error(f"parse_death_line(): Rejected kill line, {reason}: {line}")
+                return LogEvent()
+            mapped_weapon = self.get_sc_data("weapons", kill.weapon)
 
             # Handle ship change when people reset in AC FF too fast
             if self.active_ship["current"] == "FPS":
@@ -528,48 +688,71 @@ class LogParser():
             else:
                 victim_ship = self.active_ship["current"]
 
-            death_result["result"] = "killed"
-            death_result["data"] = {
-                'time': kill_time,
-                'player': killer,
-                'victim': curr_user,
-                'victim_ship': victim_ship,
-                'weapon': mapped_weapon,
-                'zone': self.active_ship["current"],
-                'game_mode': self.game_mode,
-                'client_ver': self.local_version
-            }
-            return death_result
+            return ACDeathEvent(
+                kill.time, kill.killer, curr_user, victim_ship, mapped_weapon, self.active_ship["current"],
+                self.game_mode, self.local_version
+            )
         except Exception as e:
             self.log.error(f"parse_kill_line(): {e.__class__.__name__} {e}")
-            return {"result": "", "data": None}
-
-    def find_rsi_handle(self) -> str:
-        """Get the current user's RSI handle."""
-        acct_str = "<Legacy login response> [CIG-net] User Login Success"
-        sc_log = open(self.log_file_location, "r")
-        lines = sc_log.readlines()
-        for line in lines:
-            if -1 != line.find(acct_str):
-                line_index = line.index("Handle[") + len("Handle[")
-                if 0 == line_index:
-                    self.log.error("RSI Handle not found. Please ensure the game is running and the log file is accessible.")
-                    self.gui.api_status_label.config(text="Key Status: Error", fg="yellow")
-                    return "N/A"
-                potential_handle = line[line_index:].split(' ')[0]
-                return potential_handle[0:-1]
-        self.log.error("RSI Handle not found. Please ensure the game is running and the log file is accessible.")
-        self.gui.api_status_label.config(text="Key Status: Error", fg="yellow")
-        return "N/A"
-
-    def find_rsi_geid(self) -> str:
-        """Get the current user's GEID."""
-        acct_kw = "AccountLoginCharacterStatus_Character"
-        sc_log = open(self.log_file_location, "r")
-        lines = sc_log.readlines()
-        for line in lines:
-            if -1 != line.find(acct_kw):
-                return line.split(' ')[11]
+            return LogEvent()
+
+    def find_rsi_identity(self) -> tuple:
+        """Get the current user's RSI handle and GEID in a single forward pass over the log.
+
+        Reading stops as soon as both are known. Otherwise the scan remembers how far
+        it got, so the next poll only reads what the game has written since.
+        """
+        scan = self._identity_scan
+        try:
+            if scan["identity"] is None or not self.checkpoint.is_same_log(scan["identity"], self.log_file_location):
+                # New or rotated log, start over. A restarted game can grow its new log past the old offset
+                # before the next poll, so the file itself is compared and not its size
+                scan.update(identity=self.checkpoint.identify(self.log_file_location), offset=0, handle="N/A", geid="N/A")
+            if scan["handle"] == "N/A" or scan["geid"] == "N/A":
+                reader = LogReader(self.log_file_location, prefilter=self.identity_prefilter)
+                reader.open(scan["offset"])
+                with reader:
+                    for line in reader.iter_lines():
+                        if scan["handle"] == "N/A" and -1 != line.find(self.login_success_marker):
+                            scan["handle"] = self.parse_rsi_handle(line)
+                        elif scan["geid"] == "N/A" and -1 != line.find(self.character_status_marker):
+                            scan["geid"] = line.split(' ')[11]
+                        if scan["handle"] != "N/A" and scan["geid"] != "N/A":
+                            break
+                    scan["offset"] = reader.offset
+        except Exception as e:
+            self.log.error(f"find_rsi_identity(): {e.__class__.__name__} {e}")
+        if scan["handle"] == "N/A":
+            self.log.error("RSI Handle not found. Please ensure the game is running and the log file is accessible.")
+            self.gui.api_status_label.config(text="Key Status: Error", fg="yellow")
+        return scan["handle"], scan["geid"]
+
+    @staticmethod
+    def parse_rsi_handle(line: str) -> str:
+        """Pull the handle out of a User Login Success line."""
+        line_index = line.find("Handle[")
+        if -1 == line_index:
+            return "N/A"
+        potential_handle = line[line_index + len("Handle["):].split(' ')[0]
+        return potential_handle[0:-1]
+
+    def scan_backup_logs(self) -> list:
+        """Classify the kills and deaths recorded in the rotated logs next to Game.log. Nothing is uploaded."""
+        results = []
+        try:
+            backups = LogBackupScanner.find_backup_logs(self.log_file_location)
+            self.log.info(f"Scanning {len(backups)} backup logs for kills and deaths ...")
+            started = monotonic()
+            for backup, kill_result in self.backup_scanner.scan_backups(self.log_file_location):
+                results.append((backup, kill_result))
+            kills = sum(1 for _, kill_result in results if kill_result.result == "killer")
+            self.log.info(
+                f"Found {kills} kills and {len(results) - kills} deaths in {len(backups)} backup logs "
+                f"({monotonic() - started:.1f} s)."
+            )
+        except Exception as e:
+            self.log.error(f"scan_backup_logs(): {e.__class__.__name__} {e}")
+        return results
 
     def _sync_gui_session_stats(self) -> None:
         """Refresh the GUI's session stat header to match tracked totals."""
@@ -636,8 +819,14 @@ class LogParser():
         self._sync_gui_session_stats()
         self.update_kd_ratio()
 
+    def pickle_kill_event(self, kill_result: LogEvent, endpoint: str) -> None:
+        """Move a kill that overflowed the upload queue to the kill outbox, which sends it later."""
+        if self.api.cfg_handler.add_pickle(kill_result.to_dict(), endpoint):
+            self.log.warning(f"Kill upload queue is full. Pickling kill of {kill_result.victim}.")
+
     def set_logger(self, logger) -> None:
         """Attach the main application logger and forward it to helpers."""
         self.log = logger
         self.bounty_tracker.set_logger(logger)
+        self.kill_batcher.set_logger(logger)
 
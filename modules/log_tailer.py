@@ -0,0 +1,355 @@
+"""Low latency tailing of the Star Citizen Game.log."""
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import sys
+from time import sleep, time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from modules.log_checkpoint import LogCheckpoint
+from modules.log_timestamp import LogTimestampParser
+
+
+class LatencyStats:
+    """Rolling log-to-dispatch latency figures for the tail loop, from the moment a line was logged."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.count} lines, avg {self.mean * 1000:.2f} ms, "
+            f"last {self.last * 1000:.2f} ms, max {self.max * 1000:.2f} ms"
+        )
+
+
+class _WindowsChangeNotifier:
+    """Wake up on size/write changes in the log directory (Win32 change notifications)."""
+
+    _FILE_NOTIFY_CHANGE_SIZE = 0x00000008
+    _FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+    _WAIT_OBJECT_0 = 0x00000000
+    _INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    def __init__(self, directory: str) -> None:
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        self._kernel32.FindFirstChangeNotificationW.argtypes = (ctypes.c_wchar_p, ctypes.c_int, ctypes.c_uint32)
+        self._kernel32.FindNextChangeNotification.argtypes = (ctypes.c_void_p,)
+        self._kernel32.FindCloseChangeNotification.argtypes = (ctypes.c_void_p,)
+        self._kernel32.WaitForSingleObject.argtypes = (ctypes.c_void_p, ctypes.c_uint32)
+        self._kernel32.WaitForSingleObject.restype = ctypes.c_uint32
+        handle = self._kernel32.FindFirstChangeNotificationW(
+            directory, False, self._FILE_NOTIFY_CHANGE_SIZE | self._FILE_NOTIFY_CHANGE_LAST_WRITE
+        )
+        if not handle or handle == self._INVALID_HANDLE_VALUE:
+            raise OSError(ctypes.get_last_error(), "FindFirstChangeNotificationW failed")
+        self._handle = handle
+
+    def wait(self, timeout: float) -> bool:
+        result = self._kernel32.WaitForSingleObject(self._handle, int(timeout * 1000))
+        if result == self._WAIT_OBJECT_0:
+            self._kernel32.FindNextChangeNotification(self._handle)
+            return True
+        return False
+
+    def close(self) -> None:
+        if self._handle:
+            self._kernel32.FindCloseChangeNotification(self._handle)
+            self._handle = None
+
+
+class _InotifyChangeNotifier:
+    """Wake up on modifications of the log file (Linux inotify, used for development)."""
+
+    _IN_MODIFY = 0x00000002
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+
+    def __init__(self, file_path: str) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(file_path), self._IN_MODIFY) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        # Drain the pending events, we only care that something happened
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class LinePrefilter:
+    """Pick out the lines of a raw byte chunk that contain any trigger marker.
+
+    Markers are searched for directly in the undecoded bytes, so the cost of a
+    chunk is a handful of C level scans plus decoding only the lines that hit.
+    ``folded_markers`` are lowercase and matched case-insensitively.
+    """
+
+    def __init__(self, markers: Iterable[bytes], folded_markers: Iterable[bytes] = ()) -> None:
+        self.markers = tuple(markers)
+        self.folded_markers = tuple(marker.lower() for marker in folded_markers)
+
+    def select(self, data: bytes, end: int) -> List[str]:
+        """Decode the lines of ``data[:end]`` that contain a marker, in file order."""
+        spans: Dict[int, int] = {}
+        self._scan(spans, data, data, end, self.markers)
+        if self.folded_markers:
+            self._scan(spans, data, data.lower(), end, self.folded_markers)
+        return [
+            data[start:spans[start]].rstrip(b"\r").decode("utf-8", errors="replace") + "\n"
+            for start in sorted(spans)
+        ]
+
+    def _scan(self, spans: Dict[int, int], data: bytes, haystack: bytes, end: int, markers) -> None:
+        for marker in markers:
+            pos = haystack.find(marker, 0, end)
+            while pos != -1:
+                pos = haystack.find(marker, self._add_span(spans, data, pos, end), end)
+
+    @staticmethod
+    def _add_span(spans: Dict[int, int], data: bytes, pos: int, end: int) -> int:
+        """Record the line around ``pos`` and return where the next search should resume."""
+        line_start = data.rfind(b"\n", 0, pos) + 1
+        line_end = data.find(b"\n", pos, end)
+        if line_end == -1:
+            line_end = end
+        spans[line_start] = line_end
+        return line_end + 1
+
+
+class LogReader:
+    """Stream complete lines out of the log through a fixed size read buffer.
+
+    Only one chunk plus the unfinished trailing line is held in memory at any
+    time, no matter how large the log is. With a ``prefilter`` only the lines
+    containing one of its markers are decoded and handed out.
+    """
+
+    def __init__(self, log_file_location: str, chunk_size: int = 64 * 1024, prefilter: Optional[LinePrefilter] = None) -> None:
+        self.log_file_location = log_file_location
+        self.chunk_size = chunk_size
+        self.prefilter = prefilter
+        self._buffer = bytearray(chunk_size)
+        self._view = memoryview(self._buffer)
+        self._file = None
+        self._partial = b""
+        self._offset = 0
+
+    def __enter__(self) -> "LogReader":
+        if not self._file:
+            self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def offset(self) -> int:
+        """Byte offset just past the last complete line handed out."""
+        return self._offset
+
+    def open(self, offset: int = 0) -> None:
+        """Open the log and position the reader at ``offset``."""
+        self.close_file()
+        self._file = open(self.log_file_location, "rb")
+        self._file.seek(offset)
+        self._offset = offset
+        self._partial = b""
+
+    def close_file(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        self.close_file()
+
+    def _read_chunk(self) -> Optional[List[str]]:
+        """Read one buffer worth of data. Returns None at end of file, else the completed lines."""
+        size = self._file.readinto(self._buffer)
+        if not size:
+            return None
+        data = self._partial + self._view[:size]
+        end = data.rfind(b"\n") + 1
+        self._partial = data[end:]
+        if not end:
+            return []
+        self._offset += end
+        if self.prefilter:
+            return self.prefilter.select(data, end - 1)
+        return [
+            raw.rstrip(b"\r").decode("utf-8", errors="replace") + "\n"
+            for raw in data[:end - 1].split(b"\n")
+        ]
+
+    def read_lines(self) -> List[str]:
+        """Read up to one chunk of new data and return the complete lines in it."""
+        return self._read_chunk() or []
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield every complete line from the current position up to the end of the file."""
+        lines = self._read_chunk()
+        while lines is not None:
+            yield from lines
+            lines = self._read_chunk()
+
+
+def iter_log_lines(
+    log_file_location: str, offset: int = 0, chunk_size: int = 64 * 1024, prefilter: Optional[LinePrefilter] = None
+) -> Iterator[str]:
+    """Stream the lines of a log file from ``offset`` and close it once the caller is done."""
+    reader = LogReader(log_file_location, chunk_size, prefilter)
+    reader.open(offset)
+    with reader:
+        yield from reader.iter_lines()
+
+
+class LogTailer(LogReader):
+    """Follow a growing log file and hand back complete lines as soon as they are written.
+
+    Data is read in bulk binary chunks. Between reads the tailer blocks on a
+    filesystem change notification when the platform offers one, otherwise it
+    falls back to polling with an adaptive backoff: short sleeps right after
+    activity, growing towards ``max_poll`` while the log stays idle.
+    Rotation is detected by the file's identity (see ``LogCheckpoint``), not
+    only by its size, as a new log can outgrow the old offset between polls.
+    """
+
+    def __init__(
+        self,
+        log_file_location: str,
+        chunk_size: int = 64 * 1024,
+        min_poll: float = 0.01,
+        max_poll: float = 0.25,
+        prefilter: Optional[LinePrefilter] = None,
+        checkpoint: Optional[LogCheckpoint] = None,
+    ) -> None:
+        super().__init__(log_file_location, chunk_size, prefilter)
+        self.checkpoint = checkpoint or LogCheckpoint()
+        self.identity = None
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.latency = LatencyStats()
+        self.timestamp_parser = LogTimestampParser()
+        self._poll_interval = min_poll
+        self._notifier = None
+
+    @property
+    def uses_notifications(self) -> bool:
+        return self._notifier is not None
+
+    def open(self, offset: int = 0) -> None:
+        """Open the log, position the reader at ``offset`` and start listening for changes."""
+        super().open(offset)
+        self.identity = self.checkpoint.identify(self.log_file_location)
+        self._poll_interval = self.min_poll
+        if self._notifier is None:
+            self._notifier = self._create_notifier()
+
+    def close(self) -> None:
+        self.close_file()
+        if self._notifier:
+            self._notifier.close()
+            self._notifier = None
+
+    def _read_chunk(self) -> Optional[List[str]]:
+        lines = super()._read_chunk()
+        if lines is not None:
+            self._poll_interval = self.min_poll
+        return lines
+
+    def has_rotated(self) -> bool:
+        """Check if the game started a new log underneath us."""
+        try:
+            if os.stat(self.log_file_location).st_size < self._offset + len(self._partial):
+                return True
+        except FileNotFoundError:
+            # The game is between moving the old log away and creating the new one
+            return False
+        if self.identity is None:
+            return False
+        if not self.checkpoint.is_same_log(self.identity, self.log_file_location):
+            return True
+        if self.identity["head_length"] < self.checkpoint.head_size:
+            # Opened while the header was still being written, compare on more of it from now on
+            self.identity = self.checkpoint.identify(self.log_file_location)
+        return False
+
+    def reopen(self) -> None:
+        """Start reading a freshly rotated log from the beginning."""
+        self.close()
+        self.open(0)
+
+    def wait(self) -> None:
+        """Block until the log probably has new data."""
+        if self._notifier:
+            try:
+                # Change notifications may lag behind cached writes or not fire at all for a file held open,
+                # so never wait longer than the polling fallback would
+                if self._notifier.wait(min(self._poll_interval * 4, self.max_poll)):
+                    return
+            except OSError:
+                self._notifier.close()
+                self._notifier = None
+        else:
+            sleep(self._poll_interval)
+        self._poll_interval = min(self._poll_interval * 2, self.max_poll)
+
+    def dispatch(self, lines: List[str], handler, *args) -> None:
+        """Run ``handler`` over ``lines`` and record how long after being logged each line got through it.
+
+        The line's own timestamp covers the game's write, the wait for the
+        change and the read. Lines without one count from when they were read.
+        """
+        read_at = time()
+        for line in lines:
+            handler(line, *args)
+            timestamp = self.timestamp_parser.parse(line)
+            logged_at = timestamp[1] if timestamp else read_at
+            # The log has millisecond stamps, never report a line as dispatched before it was written
+            self.latency.record(max(0.0, time() - logged_at))
+
+    def _create_notifier(self):
+        try:
+            if sys.platform == "win32":
+                return _WindowsChangeNotifier(os.path.dirname(os.path.abspath(self.log_file_location)))
+            if sys.platform.startswith("linux"):
+                return _InotifyChangeNotifier(self.log_file_location)
+        except (OSError, AttributeError):
+            pass
+        return None
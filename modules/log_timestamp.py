@@ -0,0 +1,62 @@
+"""Fast parsing of the timestamp prefix of Game.log lines."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+
+class LogTimestampParser:
+    """Turn the ``<YYYY-MM-DDTHH:MM:SS.mmmZ>`` line prefix into a display time and a UTC epoch.
+
+    The fixed layout is cut apart with slices and int conversions. Log events
+    arrive in bursts within the same second, so the whole-second part is only
+    validated and converted once per distinct second and cached.
+    """
+
+    # <2025-10-15T20:24:35.039Z>
+    prefix_length = 26
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self.cache_size = cache_size
+        self._seconds: Dict[str, Tuple[str, int]] = {}
+
+    def parse(self, line: str) -> Optional[Tuple[str, float]]:
+        """Return (``HH:MM:SS``, epoch seconds) for a line in the standard layout, otherwise None."""
+        if (
+            len(line) < self.prefix_length
+            or line[0] != "<"
+            or line[11] != "T"
+            or line[20] != "."
+            or line[24] != "Z"
+            or line[25] != ">"
+        ):
+            return None
+        second = line[1:20]
+        cached = self._seconds.get(second)
+        if cached is None:
+            cached = self._parse_second(second)
+            if cached is None:
+                return None
+            if len(self._seconds) >= self.cache_size:
+                self._seconds.clear()
+            self._seconds[second] = cached
+        millis = line[21:24]
+        if not millis.isdigit():
+            return None
+        display, epoch = cached
+        return display, epoch + int(millis) / 1000
+
+    @staticmethod
+    def _parse_second(second: str) -> Optional[Tuple[str, int]]:
+        """Validate and convert ``YYYY-MM-DDTHH:MM:SS``, slow but only once per distinct second."""
+        if second[4] != "-" or second[7] != "-" or second[13] != ":" or second[16] != ":":
+            return None
+        try:
+            parsed = datetime(
+                int(second[0:4]), int(second[5:7]), int(second[8:10]),
+                int(second[11:13]), int(second[14:16]), int(second[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            return None
+        return second[11:19], int(parsed.timestamp())
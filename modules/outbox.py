@@ -0,0 +1,176 @@
+"""Crash safe journal of the kills waiting to be uploaded to Servitor."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import RLock
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+
+class KillOutbox:
+    """Append-only JSON lines journal of kills that could not be uploaded yet.
+
+    Adding a kill appends an ``add`` record, an upload appends an ``ack``
+    record, nothing is ever rewritten in place. Every record is flushed to the
+    OS right away, so a crash of the Kill Tracker loses nothing. fsync is
+    batched: at most every ``sync_interval`` seconds or ``sync_batch`` records,
+    and whenever ``sync`` is called. Opening the journal replays it; a torn
+    last line from a power cut is skipped. Once the acked records outnumber
+    the waiting ones the journal is compacted by writing the waiting kills to
+    a new file and swapping it in. The waiting kills are indexed by a hash of
+    endpoint and payload, which deduplicates adds. Kills added before a
+    journal is opened are kept in memory and written on ``open``.
+    """
+
+    def __init__(self, sync_interval: float = 1.0, sync_batch: int = 64, compact_min_records: int = 1000) -> None:
+        self.path: Optional[Path] = None
+        self.sync_interval = sync_interval
+        self.sync_batch = sync_batch
+        self.compact_min_records = compact_min_records
+        # Kill id -> {"kill_result": ..., "endpoint": ...}, oldest first
+        self._pending: Dict[str, Dict] = {}
+        self._file = None
+        self._records = 0
+        self._unsynced = 0
+        self._last_sync = monotonic()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether added kills go to a journal on disk, not only to memory."""
+        return self._file is not None
+
+    def is_pending(self, kill_result: Dict, endpoint: str) -> bool:
+        return self.kill_id(kill_result, endpoint) in self._pending
+
+    @staticmethod
+    def kill_id(kill_result: Dict, endpoint: str) -> str:
+        """Identify a kill by its endpoint and payload."""
+        data = json.dumps(kill_result.get("data"), sort_keys=True)
+        return hashlib.sha1(f"{endpoint}\n{data}".encode()).hexdigest()
+
+    def open(self, path: Path) -> None:
+        """Load the journal at ``path`` and append to it from now on."""
+        path = Path(path)
+        with self._lock:
+            if self._file is not None and path == self.path:
+                return
+            # Kills already in another journal stay there, only unwritten ones move over
+            unwritten = self._pending if self._file is None else {}
+            self.close()
+            self.path = path
+            self._pending, self._records, torn = self._replay(path)
+            self._file = open(path, "a", encoding="utf-8")
+            for record in unwritten.values():
+                self.add(record["kill_result"], record["endpoint"])
+            if torn:
+                self.compact()
+            else:
+                self.maybe_compact()
+
+    @staticmethod
+    def _replay(path: Path) -> Tuple[Dict[str, Dict], int, bool]:
+        pending: Dict[str, Dict] = {}
+        records = 0
+        torn = False
+        try:
+            f = open(path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return pending, records, torn
+        with f:
+            for line in f:
+                records += 1
+                try:
+                    if not line.endswith("\n"):
+                        raise ValueError("unterminated record")
+                    record = json.loads(line)
+                    if record["op"] == "add":
+                        pending[record["id"]] = {"kill_result": record["kill_result"], "endpoint": record["endpoint"]}
+                    elif record["op"] == "ack":
+                        pending.pop(record["id"], None)
+                except (ValueError, KeyError, TypeError):
+                    # Only the record being written when the power went out can be incomplete
+                    torn = True
+        return pending, records, torn
+
+    def add(self, kill_result: Dict, endpoint: str) -> bool:
+        """Journal a kill for a later upload, unless it is already waiting. Returns True if it was added."""
+        kill_id = self.kill_id(kill_result, endpoint)
+        with self._lock:
+            if kill_id in self._pending:
+                return False
+            self._pending[kill_id] = {"kill_result": kill_result, "endpoint": endpoint}
+            self._write({"op": "add", "id": kill_id, "endpoint": endpoint, "kill_result": kill_result})
+            return True
+
+    def ack(self, kill_result: Dict, endpoint: str) -> None:
+        """Mark a kill as uploaded."""
+        kill_id = self.kill_id(kill_result, endpoint)
+        with self._lock:
+            if self._pending.pop(kill_id, None) is not None:
+                self._write({"op": "ack", "id": kill_id})
+
+    def peek(self, limit: int) -> List[Dict]:
+        """Get up to ``limit`` of the oldest waiting kills, without removing them."""
+        with self._lock:
+            batch = []
+            for record in self._pending.values():
+                if len(batch) >= limit:
+                    break
+                batch.append(record)
+            return batch
+
+    def _write(self, record: Dict) -> None:
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        self._records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.sync_batch or monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """fsync the records written since the last sync."""
+        with self._lock:
+            if self._file is not None and self._unsynced:
+                os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._last_sync = monotonic()
+
+    def maybe_compact(self) -> None:
+        """Compact the journal once acked records make up most of it."""
+        with self._lock:
+            if self._records - len(self._pending) >= max(self.compact_min_records, len(self._pending)):
+                self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the waiting kills."""
+        with self._lock:
+            if self._file is None:
+                return
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for kill_id, record in self._pending.items():
+                    f.write(json.dumps({"op": "add", "id": kill_id, "endpoint": record["endpoint"], "kill_result": record["kill_result"]}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(temp_path, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._records = len(self._pending)
+            self._unsynced = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self.sync()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,70 @@
+"""On-disk copy of the last good Servitor data maps, with their HTTP validators."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+
+def diff_sc_data(old: List[Dict], new: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Get (added, removed) entries between two versions of a data map in O(n), by canonical JSON."""
+    old_keys = [json.dumps(entry, sort_keys=True) for entry in old]
+    new_keys = [json.dumps(entry, sort_keys=True) for entry in new]
+    old_set, new_set = set(old_keys), set(new_keys)
+    added = [entry for entry, key in zip(new, new_keys) if key not in old_set]
+    removed = [entry for entry, key in zip(old, old_keys) if key not in new_set]
+    return added, removed
+
+
+class ScDataCache:
+    """Keep each data map with the ETag / Last-Modified it was served with.
+
+    The cache is loaded at startup, so names resolve from the first kill, and
+    its validators turn the periodic refresh into conditional requests that
+    Servitor can answer with an empty 304. The file is rewritten through a
+    temporary file and ``os.replace``, a crash never leaves half a cache.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
+        self.cache_path = cache_path or Path.cwd() / "bv_killtracker_sc_data.json"
+        self._entries: Dict[str, Dict] = {}
+        self._lock = Lock()
+
+    def load(self) -> Dict[str, List[Dict]]:
+        """Read the cache file and get the data maps in it. A missing or broken file is an empty cache."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            entries = {
+                data_type: entry for data_type, entry in entries.items()
+                if isinstance(entry, dict) and isinstance(entry.get("data"), list)
+            }
+        except (OSError, ValueError, AttributeError):
+            entries = {}
+        with self._lock:
+            self._entries = entries
+        return {data_type: entry["data"] for data_type, entry in entries.items()}
+
+    def validators(self, data_type: str) -> Dict[str, str]:
+        """Conditional request headers for a data map, empty if it was never cached."""
+        entry = self._entries.get(data_type, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, data_type: str, data: List[Dict], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Remember a data map as served and write the cache file."""
+        entry = {"etag": etag, "last_modified": last_modified, "data": data}
+        with self._lock:
+            if self._entries.get(data_type) == entry:
+                return
+            self._entries[data_type] = entry
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(temp_path, self.cache_path)
@@ -0,0 +1,171 @@
+"""Lookup structures built from the Servitor data maps."""
+from __future__ import annotations
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+class NameResolver:
+    """Map raw log ids such as ``KLWE_LaserRepeater_S3_4021`` to human readable names.
+
+    A Servitor entry matches when its id occurs anywhere in the raw id. All ids
+    are compiled into an Aho-Corasick automaton (a trie with failure links), so
+    a lookup is a single pass over the raw id and costs the same no matter how
+    many entries Servitor sends. The longest matching id wins, ties go to the
+    entry listed first. Results are memoized per raw id. A resolver is
+    immutable, refreshed data gets a new one.
+    """
+
+    def __init__(self, entries: List[Dict], cache_size: int = 1024) -> None:
+        # Node 0 is the root, each node has its edges, failure link and the best id ending there
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._best: List[Optional[Tuple[int, int, str]]] = [None]
+        for rank, data in enumerate(entries):
+            data_id = data.get("id")
+            if not data_id:
+                continue
+            node = 0
+            for char in data_id:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][char] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._best.append(None)
+                node = child
+            # Keep the first entry for duplicate ids, like the list scan did
+            if self._best[node] is None:
+                self._best[node] = (len(data_id), rank, data["name"])
+        self._link()
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _link(self) -> None:
+        """Set the failure links breadth first, every node also inherits the best id of its longest proper suffix."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                # An id ending at this node is longer than any id ending at its suffix
+                if self._best[child] is None:
+                    self._best[child] = self._best[fail]
+                queue.append(child)
+
+    def _resolve(self, raw_id: str) -> Optional[str]:
+        """Get the name of the longest id contained in ``raw_id``, None if nothing matches."""
+        goto, fail, best_at = self._goto, self._fail, self._best
+        best = None
+        node = 0
+        for char in raw_id:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            match = best_at[node]
+            if match and (best is None or match[0] > best[0] or (match[0] == best[0] and match[1] < best[1])):
+                best = match
+        return best[2] if best else None
+
+
+class IgnoredVictimMatcher:
+    """Find the first ignoredVictimRules value contained in a log line, ignoring case.
+
+    The lowercased rule values are folded into one regex shaped like a trie
+    (shared prefixes are matched only once), so a line is lowercased and
+    scanned once however many rules Servitor sends. Empty values are skipped,
+    they would otherwise match every line.
+    """
+
+    def __init__(self, rules: List[Dict]) -> None:
+        values = {}
+        for data in rules:
+            value = data.get("value")
+            if value:
+                values.setdefault(value.lower(), value)
+        self._values = values
+        self._pattern = re.compile(self._trie_pattern(values)) if values else None
+
+    @classmethod
+    def _trie_pattern(cls, words) -> str:
+        trie: Dict = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return cls._node_pattern(trie)
+
+    @classmethod
+    def _node_pattern(cls, node: Dict) -> str:
+        branches = [re.escape(char) + cls._node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ends here but longer ones continue, the greedy optional keeps the longest match
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    def match(self, line: str) -> Optional[str]:
+        """Get the rule value found in ``line``, None if the line is not ignored."""
+        if self._pattern is None:
+            return None
+        found = self._pattern.search(line.lower())
+        if found is None:
+            return None
+        return self._values[found.group()]
+
+
+class ZoneClassifier:
+    """Split ship zones like ``AEGS_Gladius_6734193926082`` into (ship type, ship id).
+
+    A zone is a ship when the token before its first underscore is a known
+    manufacturer code. Manufacturers found in the Servitor ships data are
+    added to the built in codes. Results are cached per zone string.
+    """
+
+    manufacturers = frozenset((
+        'DRAK', 'ORIG', 'AEGS', 'ANVL', 'CRUS', 'BANU', 'MISC',
+        'KRIG', 'XNAA', 'ARGO', 'VNCL', 'ESPR', 'RSI', 'CNOU',
+        'GRIN', 'TMBL', 'GAMA'
+    ))
+
+    def __init__(self, ships: List[Dict] = (), cache_size: int = 1024) -> None:
+        codes = set(ZoneClassifier.manufacturers)
+        for data in ships:
+            prefix, underscore, _ = (data.get("id") or "").partition("_")
+            if underscore and prefix:
+                codes.add(prefix)
+        self.manufacturers = frozenset(codes)
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, zone: str) -> Optional[Tuple[str, str]]:
+        """Get (ship type, ship id) of a ship zone, None for anything that is not a ship."""
+        prefix, underscore, _ = zone.partition("_")
+        if not underscore or prefix not in self.manufacturers:
+            return None
+        cut = zone.rindex("_")
+        return zone[:cut], zone[cut + 1:]
+
+
+# Index name -> (SC data type it is built from, builder)
+SC_DATA_INDEXERS = {
+    "weapons": ("weapons", NameResolver),
+    "ships": ("ships", NameResolver),
+    "ignoredVictimRules": ("ignoredVictimRules", IgnoredVictimMatcher),
+    "zones": ("ships", ZoneClassifier),
+}
+
+
+def build_sc_data_index(sc_data: Dict[str, List[Dict]], data_type: Optional[str] = None) -> Dict:
+    """Build the lookup structures from SC data, all of them or only the ones fed by ``data_type``."""
+    return {
+        name: builder(sc_data.get(source, []))
+        for name, (source, builder) in SC_DATA_INDEXERS.items()
+        if data_type is None or source == data_type
+    }
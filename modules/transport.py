@@ -0,0 +1,63 @@
+"""Shared HTTP transport: one pooled keep-alive session for every Servitor call."""
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class Transport:
+    """Pooled ``requests.Session`` with per-endpoint timeouts and retries with jitter.
+
+    All clients share one session, so the heartbeat, kill uploads and data
+    pulls reuse the same few keep-alive connections instead of opening a new
+    one per call. A failed connect is retried for every method, since the
+    request never reached the server. A read error or a 429/5xx status is only
+    retried for GET, because retrying a POST could report a kill twice.
+    Exhausted status retries return the last response, so callers keep
+    handling status codes themselves.
+    """
+
+    # (connect, read) seconds per kind of call
+    timeouts: Dict[str, Tuple[float, float]] = {
+        "heartbeat": (3.05, 5),
+        "kill": (5, 15),
+        "key": (5, 15),
+        "data": (5, 30),
+        "update": (5, 10),
+    }
+    default_timeout = (5, 30)
+
+    def __init__(self, pool_size: int = 8, retries: int = 3, backoff_factor: float = 0.5, backoff_jitter: float = 0.5) -> None:
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            allowed_methods=frozenset(("GET", "HEAD")),
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def timeout(self, kind: str) -> Tuple[float, float]:
+        return self.timeouts.get(kind, self.default_timeout)
+
+    def get(self, url: str, kind: str = "", **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout(kind))
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, kind: str = "", **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout(kind))
+        return self.session.post(url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
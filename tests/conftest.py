@@ -0,0 +1,51 @@
+"""Shared stand-ins for the Kill Tracker modules the tests do not exercise."""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.log_parser import LogParser  # noqa: E402
+from modules.sc_data_index import build_sc_data_index  # noqa: E402
+
+
+class NullModule():
+    """Stand-in for the GUI, sounds and Commander Mode modules: swallows every call."""
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return None
+
+
+class RecordingLogger():
+    """Logger that keeps the messages so tests can look at them."""
+    def __init__(self):
+        self.messages = []
+
+    def _record(self, level, msg):
+        self.messages.append((level, msg))
+
+    def debug(self, msg): self._record("debug", msg)
+    def info(self, msg): self._record("info", msg)
+    def warning(self, msg): self._record("warning", msg)
+    def error(self, msg): self._record("error", msg)
+    def success(self, msg): self._record("success", msg)
+
+
+class FakeApiClient():
+    def __init__(self):
+        self.api_key = {"value": "test"}
+        self.sc_data = {"weapons": [], "ships": [], "ignoredVictimRules": []}
+        self.sc_data_index = build_sc_data_index(self.sc_data)
+        self.connection_healthy = False
+
+
+def make_parser():
+    parser = LogParser(
+        NullModule(), FakeApiClient(), NullModule(), NullModule(), "test", {"active": True},
+        {"current": "SIIIN"}, {"current": "201926434272"}, {"current": "FPS"}, {"enabled": False},
+    )
+    parser.log = RecordingLogger()
+    return parser
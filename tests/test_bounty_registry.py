@@ -0,0 +1,54 @@
+import json
+import os
+
+from modules.bounty_registry import BountyRegistry
+
+from conftest import RecordingLogger
+
+
+def write_targets(path, targets, mtime):
+    path.write_text(json.dumps(targets) if isinstance(targets, dict) else targets, encoding="utf-8")
+    # Same second writes must still look like a change
+    os.utime(path, ns=(mtime, mtime))
+
+
+def make_registry(tmp_path):
+    registry = BountyRegistry(tmp_path / "bounty_targets.json", check_interval=0)
+    registry.set_logger(RecordingLogger())
+    return registry
+
+
+def test_targets_are_looked_up_by_normalized_handle(tmp_path):
+    write_targets(tmp_path / "bounty_targets.json", {"SIIIN": None, "4TCH": "Kill in a Gladius"}, 1)
+    registry = make_registry(tmp_path)
+    assert registry.lookup("'siiin'") == ("SIIIN", "")
+    assert registry.lookup("4TCH[215423956176]") == ("4TCH", "Kill in a Gladius")
+    assert registry.lookup("Nobody") is None
+
+
+def test_broken_file_keeps_the_previous_targets(tmp_path):
+    targets_file = tmp_path / "bounty_targets.json"
+    write_targets(targets_file, {"SIIIN": None}, 1)
+    registry = make_registry(tmp_path)
+    assert registry.lookup("SIIIN") == ("SIIIN", "")
+
+    write_targets(targets_file, '{"SIIIN": null, "4TCH":', 2)
+    assert registry.lookup("SIIIN") == ("SIIIN", "")
+    assert registry.lookup("4TCH") is None
+    write_targets(targets_file, '["SIIIN"]', 3)
+    assert registry.lookup("SIIIN") == ("SIIIN", "")
+    errors = [msg for level, msg in registry.log.messages if level == "error"]
+    assert len(errors) == 2 and "JSONDecodeError" in errors[0] and "ValueError" in errors[1]
+
+    write_targets(targets_file, {"4TCH": None}, 4)
+    assert registry.lookup("4TCH") == ("4TCH", "")
+    assert registry.lookup("SIIIN") is None
+
+
+def test_load_error_before_the_logger_exists_is_logged_not_printed(tmp_path, capsys):
+    write_targets(tmp_path / "bounty_targets.json", "{broken", 1)
+    registry = BountyRegistry(tmp_path / "bounty_targets.json", check_interval=0)
+    assert registry.lookup("SIIIN") is None
+    assert capsys.readouterr().out == ""
+    registry.set_logger(RecordingLogger())
+    assert [level for level, _ in registry.log.messages] == ["error"]
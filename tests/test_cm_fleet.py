@@ -0,0 +1,128 @@
+from queue import Queue
+
+from modules.commander_mode.cm_core import CM_Core
+from modules.commander_mode.cm_fleet import FleetStore
+
+from conftest import NullModule, RecordingLogger
+
+
+class FakeListbox():
+    """Just enough of tk.Listbox to check which rows get drawn where."""
+    def __init__(self):
+        self.rows = []
+        self.colors = []
+
+    def insert(self, index, text):
+        index = len(self.rows) if index == "end" else index
+        self.rows.insert(index, text)
+        self.colors.insert(index, None)
+
+    def delete(self, first, last=None):
+        if last is None:
+            del self.rows[first]
+            del self.colors[first]
+        else:
+            self.rows.clear()
+            self.colors.clear()
+
+    def itemconfig(self, index, options):
+        self.colors[index] = options["fg"]
+
+    def get(self, index):
+        return self.rows[index]
+
+
+class FakeApi():
+    api_key = {"value": "key"}
+    api_fqdn = "http://localhost"
+    transport = None
+
+
+def make_core():
+    core = CM_Core(NullModule(), FakeApi(), {"active": True}, {"active": True}, {"current": "SIIIN"}, {"current": "FPS"}, Queue())
+    core.log = RecordingLogger()
+    core.connected_users_listbox = FakeListbox()
+    core.allocated_forces_listbox = FakeListbox()
+    return core
+
+
+def user(player, zone="FPS", status="alive"):
+    return {"player": player, "zone": zone, "status": status}
+
+
+def allocated_rows(core):
+    return [f"{u['player']} - Zone: {u['zone']}" for u in core.alloc_users]
+
+
+def test_fleet_store_reports_joins_leaves_and_changes():
+    fleet = FleetStore()
+    delta = fleet.apply([user("Bravo"), user("Alpha")])
+    assert [u["player"] for u in delta.joined] == ["Bravo", "Alpha"] and not delta.left and not delta.changed
+    assert fleet.players == ["Alpha", "Bravo"]
+
+    delta = fleet.apply([user("Alpha", zone="AEGS_Gladius"), user("Charlie")])
+    assert [u["player"] for u in delta.joined] == ["Charlie"]
+    assert [u["player"] for u in delta.left] == ["Bravo"]
+    assert delta.changed == [user("Alpha", zone="AEGS_Gladius")]
+    assert fleet.players == ["Alpha", "Charlie"]
+    assert not any(fleet.apply([user("Alpha", zone="AEGS_Gladius"), user("Charlie")]))
+
+
+def test_joins_and_leaves_keep_the_connected_list_sorted():
+    core = make_core()
+    core.refresh_user_list([user("Delta"), user("Alpha")])
+    core.refresh_user_list([user("Delta"), user("Alpha"), user("Charlie"), user("Bravo")])
+    assert core.connected_users_listbox.rows == ["Alpha", "Bravo", "Charlie", "Delta"]
+    core.refresh_user_list([user("Delta"), user("Alpha"), user("Echo")])
+    assert core.connected_users_listbox.rows == ["Alpha", "Delta", "Echo"]
+    assert core.connected_users_listbox.rows == core.shown_users == core.fleet.players
+
+
+def test_search_filter_applies_to_joining_users():
+    core = make_core()
+    core.user_filter = "a"
+    core.refresh_user_list([user("Alpha"), user("Echo"), user("Bravo")])
+    assert core.connected_users_listbox.rows == ["Alpha", "Bravo"]
+    core.refresh_user_list([user("Alpha"), user("Echo")])
+    assert core.connected_users_listbox.rows == ["Alpha"]
+
+
+def test_leave_from_the_middle_then_change_a_later_allocated_user():
+    core = make_core()
+    roster = [user("Alpha"), user("Bravo"), user("Charlie"), user("Delta")]
+    core.refresh_user_list(roster)
+    core.allocate_all_users()
+    assert allocated_rows(core) == core.allocated_forces_listbox.rows
+
+    # Bravo disconnects while Delta, below it, dies in another ship
+    core.refresh_user_list([user("Alpha"), user("Charlie"), user("Delta", zone="ANVL_Arrow", status="dead")])
+    listbox = core.allocated_forces_listbox
+    assert listbox.rows == ["Alpha - Zone: FPS", "Charlie - Zone: FPS", "Delta - Zone: ANVL_Arrow"]
+    assert listbox.colors == ["#04B431", "#04B431", "red"]
+    assert core.alloc_index == {"Alpha": 0, "Charlie": 1, "Delta": 2}
+
+    # A later change to Charlie must still land on Charlie's row
+    core.refresh_user_list([user("Alpha"), user("Charlie", zone="AEGS_Gladius"), user("Delta", zone="ANVL_Arrow", status="dead")])
+    assert listbox.rows == ["Alpha - Zone: FPS", "Charlie - Zone: AEGS_Gladius", "Delta - Zone: ANVL_Arrow"]
+    assert listbox.rows == allocated_rows(core)
+
+
+def test_several_allocated_users_leave_at_once():
+    core = make_core()
+    core.refresh_user_list([user("Alpha"), user("Bravo"), user("Charlie"), user("Delta"), user("Echo")])
+    core.allocate_all_users()
+    core.refresh_user_list([user("Bravo"), user("Echo", status="dead")])
+    assert core.allocated_forces_listbox.rows == ["Bravo - Zone: FPS", "Echo - Zone: FPS"]
+    assert core.allocated_forces_listbox.colors == ["#04B431", "red"]
+    assert core.alloc_index == {"Bravo": 0, "Echo": 1}
+
+
+def test_a_change_that_only_touches_other_fields_keeps_the_row():
+    core = make_core()
+    core.refresh_user_list([user("Alpha")])
+    core.allocate_all_users()
+    drawn = []
+    core.allocated_forces_insert = lambda text, index: drawn.append((text, index))
+    core.refresh_user_list([dict(user("Alpha"), is_commander=True)])
+    assert drawn == []
+    assert core.alloc_users[0]["is_commander"] is True
@@ -0,0 +1,28 @@
+from conftest import make_parser
+
+DEATH_LINE = (
+    "<2025-10-15T20:24:35.039Z> [Notice] <Actor Death> CActor::Kill: 'SIIIN' [201926434272] in zone "
+    "'AEGS_Gladius_6734193926082' killed by '4TCH' [215423956176] using 'ESPR_BallisticCannon_S5_6607088543131' "
+    "[Class unknown] with damage type 'VehicleDestruction' from direction x: 0.000000, y: 0.000000, z: 0.000000 "
+    "[Team_ActorTech][Actor]\n"
+)
+
+
+class RecordingCommander():
+    """Commander Mode stand-in that records each heartbeat event with the ship state at call time."""
+    def __init__(self, active_ship):
+        self.active_ship = active_ship
+        self.events = []
+
+    def post_heartbeat_event(self, target_name, killed_zone, player_ship):
+        self.events.append((target_name, killed_zone, player_ship, self.active_ship["current"]))
+
+
+def test_death_heartbeat_is_taken_before_the_zone_is_reset():
+    parser = make_parser()
+    parser.cm = RecordingCommander(parser.active_ship)
+    parser.active_ship["current"] = "AEGS_Gladius"
+    parser.active_ship_id = "6734193926082"
+    parser.read_log_line(DEATH_LINE, True)
+    assert parser.cm.events == [("SIIIN", "AEGS_Gladius", None, "AEGS_Gladius")]
+    assert parser.active_ship["current"] == "FPS"
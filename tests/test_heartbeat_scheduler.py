@@ -0,0 +1,194 @@
+import threading
+import time
+
+from modules.commander_mode.cm_heartbeat import HeartbeatScheduler
+
+from conftest import RecordingLogger
+
+ADVERTISES_DELTAS = {"partial_heartbeats": True}
+
+
+class FakeCommander():
+    """The parts of CM_Core the heartbeat scheduler uses, recording every beat."""
+    def __init__(self, accept=None, response=None):
+        self.log = RecordingLogger()
+        self.heartbeat_status = {"active": True}
+        self.api_key = {"value": "key"}
+        self.heartbeat_interval = 0.02
+        self.start_battle = False
+        self.zone = "FPS"
+        self.sent = []
+        self.accept = accept or (lambda payload: True)
+        self.response = response or {}
+        self.heartbeat = HeartbeatScheduler(self)
+
+    def heartbeat_state(self):
+        return {"is_heartbeat": True, "player": "SIIIN", "zone": self.zone, "client_ver": "7.0", "status": "alive", "mode": "commander"}
+
+    def send_heartbeat(self, payload):
+        self.sent.append(payload)
+        return dict(self.response) if self.accept(payload) else None
+
+    def toggle_commander(self):
+        self.heartbeat_status["active"] = False
+
+
+def run_until(cm, condition, timeout=3.0):
+    worker = threading.Thread(target=cm.heartbeat.run, daemon=True)
+    worker.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+    finally:
+        cm.heartbeat_status["active"] = False
+        cm.heartbeat.wake()
+        worker.join(2)
+
+
+def test_beats_send_the_full_state_first_then_only_changes():
+    cm = FakeCommander(response=ADVERTISES_DELTAS)
+    run_until(cm, lambda: len(cm.sent) >= 2)
+    first, second = cm.sent[:2]
+    assert first["zone"] == "FPS" and first["status"] == "alive"
+    assert second == {"is_heartbeat": True, "player": "SIIIN", "client_ver": "7.0", "mode": "commander"}
+
+
+def test_full_beats_only_unless_the_server_advertises_deltas():
+    cm = FakeCommander()
+    run_until(cm, lambda: len(cm.sent) >= 4)
+    assert all(payload["zone"] == "FPS" and payload["status"] == "alive" for payload in cm.sent)
+    assert not cm.heartbeat.deltas_active
+    assert cm.heartbeat.summary().endswith("full beats only")
+
+
+def test_deltas_stop_when_the_server_stops_advertising_them():
+    def withdraw_on_the_first_delta(payload):
+        if "zone" not in payload:
+            cm.response = {}
+        return True
+
+    cm = FakeCommander(accept=withdraw_on_the_first_delta, response=ADVERTISES_DELTAS)
+    run_until(cm, lambda: len(cm.sent) >= 5)
+    assert ["zone" in payload for payload in cm.sent[:2]] == [True, False]
+    assert all("zone" in payload for payload in cm.sent[2:])
+    assert not cm.heartbeat.deltas_active
+
+
+def test_zone_changes_are_coalesced_into_the_next_beat():
+    cm = FakeCommander()
+    cm.heartbeat_interval = 0.2
+    worker = threading.Thread(target=cm.heartbeat.run, daemon=True)
+    worker.start()
+    try:
+        for zone in ("AEGS_Gladius", "ANVL_Arrow", "DRAK_Cutlass"):
+            cm.zone = zone
+            cm.heartbeat.state_changed()
+        deadline = time.monotonic() + 2
+        while not cm.sent:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+    finally:
+        cm.heartbeat_status["active"] = False
+        cm.heartbeat.wake()
+        worker.join(2)
+    assert [payload["zone"] for payload in cm.sent] == ["DRAK_Cutlass"]
+    assert cm.heartbeat.coalesced == 3
+
+
+def test_events_are_sent_right_away():
+    cm = FakeCommander()
+    cm.heartbeat_interval = 10
+    death = {"is_heartbeat": True, "player": "SIIIN", "zone": "AEGS_Gladius", "status": "dead"}
+    worker = threading.Thread(target=cm.heartbeat.run, daemon=True)
+    worker.start()
+    started = time.monotonic()
+    cm.heartbeat.send_now(death)
+    try:
+        while not cm.sent:
+            assert time.monotonic() - started < 2
+            time.sleep(0.005)
+    finally:
+        cm.heartbeat_status["active"] = False
+        cm.heartbeat.wake()
+        worker.join(2)
+    assert cm.sent == [death]
+
+
+def test_rejected_deltas_fall_back_to_full_beats_for_the_session():
+    # A server that only takes beats with the full state
+    cm = FakeCommander(accept=lambda payload: "zone" in payload, response=ADVERTISES_DELTAS)
+    run_until(cm, lambda: len(cm.sent) >= 8)
+    assert cm.heartbeat.failures == 1
+    assert not cm.heartbeat.deltas_active
+    assert all("zone" in payload for payload in cm.sent[2:])
+    assert any("full state for the rest of the session" in msg for _, msg in cm.log.messages)
+
+
+def test_an_outage_does_not_switch_deltas_off():
+    down = {"value": False}
+    cm = FakeCommander(accept=lambda payload: not down["value"], response=ADVERTISES_DELTAS)
+    run_until(cm, lambda: len(cm.sent) >= 2)
+    # Delta beat and the full one after it both fail, then the server is back
+    down["value"] = True
+    cm.heartbeat_status["active"] = True
+    run_until(cm, lambda: cm.heartbeat.failures >= 2)
+    down["value"] = False
+    cm.heartbeat_status["active"] = True
+    sent_before = len(cm.sent)
+    run_until(cm, lambda: len(cm.sent) >= sent_before + 3)
+    assert cm.heartbeat.deltas_active
+    assert "zone" not in cm.sent[-1]
+
+
+def test_send_deltas_off_sends_the_full_state_every_beat():
+    cm = FakeCommander(response=ADVERTISES_DELTAS)
+    cm.heartbeat.send_deltas = False
+    run_until(cm, lambda: len(cm.sent) >= 3)
+    assert all(payload["zone"] == "FPS" for payload in cm.sent)
+
+
+def test_interval_backs_off_when_idle_and_returns_on_activity():
+    cm = FakeCommander()
+    cm.heartbeat_interval = 5
+    scheduler = cm.heartbeat
+    scheduler.interval = 5
+    scheduler._last_activity = time.monotonic() - 120
+    steps = []
+    for _ in range(4):
+        scheduler.interval = scheduler._next_interval()
+        steps.append(scheduler.interval)
+    assert steps == [10, 20, 30, 30]
+
+    cm.start_battle = True
+    assert scheduler._next_interval() == 5
+    cm.start_battle = False
+    scheduler.state_changed()
+    assert scheduler.interval == 5
+    assert scheduler._next_interval() == 5
+
+
+def test_server_interval_is_honoured_and_clamped():
+    cm = FakeCommander()
+    scheduler = cm.heartbeat
+    scheduler._read_response({"heartbeat_interval": 12})
+    assert scheduler._next_interval() == 12
+    scheduler._read_response({"heartbeat_interval": 0.01})
+    assert scheduler._next_interval() == scheduler.min_interval
+    scheduler._read_response({"heartbeat_interval": 10_000})
+    assert scheduler._next_interval() == scheduler.max_interval
+    scheduler._read_response({})
+    scheduler.state_changed()
+    assert scheduler._next_interval() == cm.heartbeat_interval
+
+
+def test_event_overflow_drops_the_oldest_and_is_counted():
+    cm = FakeCommander()
+    scheduler = HeartbeatScheduler(cm, max_events=3)
+    for i in range(5):
+        scheduler.send_now({"is_heartbeat": True, "player": f"Victim_{i}", "status": "dead"})
+    assert [event["player"] for event in scheduler._events] == ["Victim_2", "Victim_3", "Victim_4"]
+    assert scheduler.dropped == 2
+    assert "2 events dropped" in scheduler.summary()
+    assert sum("dropped the oldest event" in msg for _, msg in cm.log.messages) == 2
@@ -0,0 +1,87 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from modules.api_client import API_Client
+from modules.key_expiry import KeyExpiryScheduler
+
+from conftest import NullModule, RecordingLogger
+
+
+class Label():
+    def __init__(self):
+        self.texts = []
+
+    def config(self, text, fg):
+        self.texts.append(text)
+
+
+class FakeApi():
+    """The parts of API_Client the countdown uses, with a key lifetime per key."""
+    def __init__(self, lifetimes):
+        self.log = RecordingLogger()
+        self.cm = None
+        self.gui = NullModule()
+        self.gui.api_status_label = Label()
+        self.cfg_handler = NullModule()
+        self.api_key = {"value": "first"}
+        self.monitoring = {"active": True}
+        self.rsi_handle = {"current": "SIIIN"}
+        self.countdown_active = True
+        self.key_status_valid_color = "green"
+        self.key_status_invalid_color = "red"
+        self.lifetimes = lifetimes
+        self.expires_at = {}
+        self.key_expiry = KeyExpiryScheduler(self, data_refresh_interval=3600)
+
+    def post_api_key_expiration_time(self):
+        key = self.api_key["value"]
+        if key not in self.expires_at:
+            scheduler = self.key_expiry
+            now = datetime.now(scheduler.server_tz).astimezone(scheduler.local_tz).replace(tzinfo=None)
+            self.expires_at[key] = now + timedelta(seconds=self.lifetimes[key])
+        return self.expires_at[key].strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def get_data_map(self, data_type):
+        pass
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_new_key_during_the_countdown_shows_its_own_expiry():
+    api = FakeApi({"first": 5 * 3600 + 600, "second": 2 * 3600 + 600})
+    worker = threading.Thread(target=api.key_expiry.run, daemon=True)
+    worker.start()
+    try:
+        wait_for(lambda: api.gui.api_status_label.texts)
+        assert api.gui.api_status_label.texts[-1].startswith("Key Status: Valid (Expires in 5 hours")
+        # Activating the second key while the countdown runs
+        api.api_key["value"] = "second"
+        api.key_expiry.revalidate_soon()
+        wait_for(lambda: api.gui.api_status_label.texts[-1].startswith("Key Status: Valid (Expires in 2 hours"))
+        assert 2 * 3600 < api.key_expiry.remaining() < 2 * 3600 + 600
+    finally:
+        api.countdown_active = False
+        api.key_expiry.revalidate_soon()
+        worker.join(2)
+
+
+def test_load_activate_key_revalidates_a_running_countdown(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    api = API_Client(NullModule(), NullModule(), {"active": True}, "test", {"current": "SIIIN"})
+    api.log = RecordingLogger()
+    api.gui.key_entry.get = lambda: "second"
+    monkeypatch.setattr(api, "validate_api_key", lambda key: True)
+    revalidations = []
+    monkeypatch.setattr(api.key_expiry, "revalidate_soon", lambda: revalidations.append(True))
+    api.countdown_active = True
+
+    api.load_activate_key()
+
+    assert api.api_key["value"] == "second"
+    assert revalidations == [True]
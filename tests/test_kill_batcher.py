@@ -0,0 +1,147 @@
+import threading
+import time
+
+import pytest
+
+from modules.api_client import API_Client
+from modules.cfg_handler import Cfg_Handler
+from modules.kill_batcher import KillBatcher
+from modules.log_events import KillEvent
+from modules.transport import Transport
+from tools.stub_servitor import start_stub_servitor
+
+from conftest import NullModule, RecordingLogger, make_parser
+
+
+def make_kill(i):
+    return KillEvent(
+        "SIIIN", "AEGS_Gladius", f"Victim_{i}", "<2025-10-15T20:24:35.039Z>", "ANVL_Hornet_F7A_Mk2_1",
+        "KLWE_LaserRepeater_S3", "SC_Default", "test", False,
+    )
+
+
+class RecordingApi():
+    """post_kill_batch stand-in that records each post and can hold the worker until released."""
+    def __init__(self):
+        self.posts = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def post_kill_batch(self, kill_results, endpoint):
+        self.release.wait(5)
+        self.posts.append((endpoint, [kill_result.victim for kill_result in kill_results]))
+        return kill_results
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def make_cfg_handler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg_handler = Cfg_Handler({"enabled": True}, {"active": True}, {"current": "SIIIN"})
+    cfg_handler.log = RecordingLogger()
+    cfg_handler._set_cfg_vars()
+    return cfg_handler
+
+
+def test_kills_within_the_window_go_up_together_per_endpoint():
+    api = RecordingApi()
+    batcher = KillBatcher(api, window=0.2, max_batch=25)
+    batcher.add(make_kill(0), "reportKill")
+    batcher.add(make_kill(1), "reportACKill")
+    batcher.add(make_kill(2), "reportKill")
+    wait_for(lambda: batcher.kills == 3)
+    assert api.posts == [("reportKill", ["Victim_0", "Victim_2"]), ("reportACKill", ["Victim_1"])]
+
+
+def test_full_batches_are_split_at_max_batch():
+    api = RecordingApi()
+    batcher = KillBatcher(api, window=0.2, max_batch=2)
+    for i in range(5):
+        batcher.add(make_kill(i), "reportKill")
+    wait_for(lambda: batcher.kills == 5)
+    assert [victims for _, victims in api.posts] == [["Victim_0", "Victim_1"], ["Victim_2", "Victim_3"], ["Victim_4"]]
+
+
+def test_overflow_moves_the_oldest_kills_to_the_pickle_buffer(tmp_path, monkeypatch):
+    parser = make_parser()
+    parser.api.cfg_handler = make_cfg_handler(tmp_path, monkeypatch)
+    api = RecordingApi()
+    # A long window keeps every kill waiting in the queue
+    batcher = KillBatcher(api, window=30, max_batch=100, maxsize=3)
+    for i in range(5):
+        batcher.add(make_kill(i), "reportKill", on_overflow=parser.pickle_kill_event)
+
+    assert batcher.overflowed == 2
+    assert batcher.dropped == 0
+    assert batcher.depth == 3
+    assert batcher.oldest_age > 0
+    assert "3 waiting" in batcher.summary() and "2 overflowed" in batcher.summary()
+    outbox = parser.api.cfg_handler.outbox
+    assert [record["kill_result"]["data"]["victim"] for record in outbox.peek(10)] == ["Victim_0", "Victim_1"]
+    assert all(record["endpoint"] == "reportKill" for record in outbox.peek(10))
+
+
+def test_overflow_without_fallback_is_dropped_and_logged():
+    api = RecordingApi()
+    api.release.clear()
+    batcher = KillBatcher(api, window=30, max_batch=100, maxsize=1)
+    batcher.log = RecordingLogger()
+    batcher.add(make_kill(0), "reportKill")
+    batcher.add(make_kill(1), "reportKill")
+    assert batcher.overflowed == 1
+    assert batcher.dropped == 1
+    assert any("dropped a kill" in msg for _, msg in batcher.log.messages)
+    api.release.set()
+
+
+@pytest.fixture
+def stub_servitor():
+    server = start_stub_servitor()
+    yield server
+    server.shutdown()
+
+
+def make_api(tmp_path, monkeypatch, server):
+    cfg_handler = make_cfg_handler(tmp_path, monkeypatch)
+    api = API_Client(cfg_handler, NullModule(), {"active": True}, "test", {"current": "SIIIN"})
+    api.log = RecordingLogger()
+    api.api_key["value"] = "test"
+    api.api_fqdn = f"http://127.0.0.1:{server.server_port}"
+    return api
+
+
+def test_post_kill_batch_sends_one_array(tmp_path, monkeypatch, stub_servitor):
+    api = make_api(tmp_path, monkeypatch, stub_servitor)
+    uploaded = api.post_kill_batch([make_kill(i) for i in range(4)], "reportKill")
+    assert len(uploaded) == 4
+    assert (stub_servitor.stats.kill_posts, stub_servitor.stats.kills) == (1, 4)
+
+
+def test_rejected_batch_is_posted_one_by_one_and_batching_pauses(tmp_path, monkeypatch, stub_servitor):
+    stub_servitor.accept_batches = False
+    api = make_api(tmp_path, monkeypatch, stub_servitor)
+    uploaded = api.post_kill_batch([make_kill(i) for i in range(3)], "reportKill")
+    assert len(uploaded) == 3
+    assert stub_servitor.stats.rejected == 1
+    assert api.kill_batch_unsupported_until > time.monotonic()
+    # The next batch goes one by one straight away
+    api.post_kill_batch([make_kill(i) for i in range(3, 5)], "reportKill")
+    assert stub_servitor.stats.rejected == 1
+    assert stub_servitor.stats.kills == 5
+
+
+def test_failed_batch_is_pickled(tmp_path, monkeypatch, stub_servitor):
+    api = make_api(tmp_path, monkeypatch, stub_servitor)
+    stub_servitor.shutdown()
+    stub_servitor.server_close()
+    # No connect retries, the refused connection fails right away
+    api.transport = Transport(retries=0)
+    uploaded = api.post_kill_batch([make_kill(i) for i in range(3)], "reportKill")
+    assert uploaded == []
+    assert not api.connection_healthy
+    assert len(api.cfg_handler.outbox) == 3
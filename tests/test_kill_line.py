@@ -0,0 +1,53 @@
+from modules.kill_line import KillLineParser
+
+KILL = (
+    "<2025-10-15T20:24:35.039Z> [Notice] <Actor Death> CActor::Kill: '4TCH' [215423956176] in zone "
+    "'ANVL_Hornet_F7CM_Mk2_6734193926082' killed by 'SIIIN' [201926434272] using 'ESPR_BallisticCannon_S5_6607088543131' "
+    "[Class unknown] with damage type 'VehicleDestruction' from direction x: 0.000000, y: 0.000000, z: 0.000000 "
+    "[Team_ActorTech][Actor]\n"
+)
+
+
+def test_well_formed_kill_line_is_split_into_its_fields():
+    kill, reason = KillLineParser().parse(KILL)
+    assert reason == ""
+    assert (kill.time, kill.victim, kill.victim_id) == ("<2025-10-15T20:24:35.039Z>", "4TCH", "215423956176")
+    assert (kill.zone, kill.killer, kill.killer_id) == ("ANVL_Hornet_F7CM_Mk2_6734193926082", "SIIIN", "201926434272")
+    assert (kill.weapon, kill.weapon_class, kill.damage_type) == ("ESPR_BallisticCannon_S5_6607088543131", "Class unknown", "VehicleDestruction")
+
+
+def test_names_with_spaces_are_taken_whole():
+    kill, _ = KillLineParser().parse(KILL.replace("'4TCH'", "'PU Pilot 07'"))
+    assert kill.victim == "PU Pilot 07"
+
+
+def test_line_without_killed_by_is_rejected():
+    kill, reason = KillLineParser().parse(KILL.replace(" killed by ", " destroyed by "))
+    assert kill is None
+    assert reason == "zone is not followed by \"' killed by '\""
+
+
+def test_truncated_zone_is_rejected():
+    kill, reason = KillLineParser().parse(KILL[:KILL.index("ANVL_Hornet") + 10] + "\n")
+    assert kill is None
+    assert reason.startswith("zone is not followed by")
+
+
+def test_truncated_weapon_is_rejected():
+    kill, reason = KillLineParser().parse(KILL[:KILL.index("ESPR_Ballistic") + 8] + "\n")
+    assert kill is None
+    assert reason.startswith("weapon is not followed by")
+
+
+def test_empty_required_field_is_rejected():
+    kill, reason = KillLineParser().parse(KILL.replace("using 'ESPR_BallisticCannon_S5_6607088543131'", "using ''"))
+    assert kill is None
+    assert reason == "weapon is empty"
+
+
+def test_actor_death_lines_that_are_not_kills_are_rejected():
+    parser = KillLineParser()
+    corpse = "<2025-10-15T20:24:36.100Z> [Notice] <Actor Death> CActor::ClearCorpse: '4TCH' [215423956176] corpse removed\n"
+    assert parser.parse(corpse) == (None, "not a CActor::Kill line")
+    assert parser.parse("[Notice] <Actor Death> CActor::Kill: 'x'\n") == (None, "line does not start with a timestamp")
+    assert parser.parse("<2025-10-15T20:24:36.100Z [Notice] CActor::Kill: 'x'\n") == (None, "timestamp is not closed")
@@ -0,0 +1,56 @@
+import inspect
+
+import pytest
+
+from modules.log_backfill import ParallelLogClassifier
+from modules.log_tailer import LogReader
+
+from conftest import REPO_ROOT, make_parser
+
+
+def parallel_parser():
+    parser = make_parser()
+    parser.backfill_classifier = ParallelLogClassifier(parser.line_prefilter, workers=2, min_parallel_size=0)
+    generators = []
+    iter_lines = parser.backfill_classifier.iter_lines
+
+    def recording_iter_lines(*args):
+        generators.append(iter_lines(*args))
+        return generators[-1]
+
+    parser.backfill_classifier.iter_lines = recording_iter_lines
+    return parser, generators
+
+
+def test_parallel_backfill_replays_every_relevant_line():
+    parser, generators = parallel_parser()
+    with LogReader(str(REPO_ROOT / "Game.log"), prefilter=parser.line_prefilter) as reader:
+        assert parser.load_old_log(reader) > 0
+    assert inspect.getgeneratorstate(generators[0]) == inspect.GEN_CLOSED
+
+
+def test_pool_is_shut_down_when_a_handler_raises():
+    parser, generators = parallel_parser()
+
+    def broken_handler(line, upload_kills):
+        raise RuntimeError("handler failed")
+
+    parser.dispatch_log_line = broken_handler
+    with LogReader(str(REPO_ROOT / "Game.log"), prefilter=parser.line_prefilter) as reader:
+        with pytest.raises(RuntimeError):
+            parser.load_old_log(reader)
+    assert inspect.getgeneratorstate(generators[0]) == inspect.GEN_CLOSED
+
+
+def test_pool_is_shut_down_when_monitoring_stops():
+    parser, generators = parallel_parser()
+    seen = []
+
+    def stop_after_first(line, upload_kills):
+        seen.append(line)
+        parser.monitoring["active"] = False
+
+    parser.dispatch_log_line = stop_after_first
+    with LogReader(str(REPO_ROOT / "Game.log"), prefilter=parser.line_prefilter) as reader:
+        assert parser.load_old_log(reader) == 1
+    assert inspect.getgeneratorstate(generators[0]) == inspect.GEN_CLOSED
@@ -0,0 +1,83 @@
+import shutil
+
+from modules.log_events import LogEvent
+
+from conftest import REPO_ROOT, make_parser
+
+
+def test_scan_backup_logs_finds_kills_and_reports_counts(tmp_path):
+    backups = tmp_path / "logbackups"
+    backups.mkdir()
+    shutil.copy(REPO_ROOT / "Game.log", backups / "Game Build(10392434) 15 Oct 25.log")
+    (tmp_path / "Game.log").write_text("")
+    parser = make_parser()
+    parser.log_file_location = str(tmp_path / "Game.log")
+
+    results = parser.scan_backup_logs()
+
+    assert results
+    assert all(isinstance(kill_result, LogEvent) for _, kill_result in results)
+    assert {kill_result.result for _, kill_result in results} <= {"killer", "killed", "suicide"}
+    kills = sum(1 for _, kill_result in results if kill_result.result == "killer")
+    assert ("info", f"Found {kills} kills and {len(results) - kills} deaths") in [
+        (level, msg.split(" in ")[0]) for level, msg in parser.log.messages
+    ]
+
+
+def test_scan_backup_logs_without_backups_is_empty(tmp_path):
+    (tmp_path / "Game.log").write_text("")
+    parser = make_parser()
+    parser.log_file_location = str(tmp_path / "Game.log")
+    assert parser.scan_backup_logs() == []
+
+
+LOGIN = "<2025-10-15T08:28:38.476Z> [Notice] <Legacy login response> [CIG-net] User Login Success - Handle[{handle}] - Time[164817729] [Team_GameServices][Login]\n"
+KILL = (
+    "<2025-10-15T20:24:35.039Z> [Notice] <Actor Death> CActor::Kill: '{victim}' [215423956176] in zone "
+    "'ANVL_Hornet_F7CM_Mk2_6734193926082' killed by '{killer}' [201926434272] using 'ESPR_BallisticCannon_S5_6607088543131' "
+    "[Class unknown] with damage type 'VehicleDestruction' from direction x: 0.000000, y: 0.000000, z: 0.000000 "
+    "[Team_ActorTech][Actor]{tail}\n"
+)
+
+
+def context_line():
+    with open(REPO_ROOT / "Game.log", encoding="utf-8") as f:
+        return next(line for line in f if "<Context Establisher Done>" in line and 'gamerules="SC_Default"' in line)
+
+
+def scan_both_ways(parser, log):
+    """Scan ``log`` through the memory map and through the process pool, which must agree."""
+    scanner = parser.backup_scanner
+    mapped = scanner.scan_file(log)
+    scanner.classifier.workers = 2
+    scanner.classifier.min_parallel_size = 0
+    pooled = scanner.scan_file(log)
+    assert [k.to_dict() for k in mapped] == [k.to_dict() for k in pooled]
+    return mapped
+
+
+def test_line_with_several_markers_is_classified_once(tmp_path):
+    log = tmp_path / "backup.log"
+    # A kill line that carries its tag twice, as when two writes end up on one line
+    log.write_text(
+        LOGIN.format(handle="SIIIN") + context_line()
+        + KILL.format(victim="4TCH", killer="SIIIN", tail=" <Actor Death> CActor::Kill"),
+        encoding="utf-8",
+    )
+    results = scan_both_ways(make_parser(), log)
+    assert [kill_result.result for kill_result in results] == ["killer"]
+
+
+def test_every_login_switches_the_player(tmp_path):
+    log = tmp_path / "backup.log"
+    log.write_text(
+        KILL.format(victim="Nobody", killer="SIIIN", tail="")
+        + LOGIN.format(handle="SIIIN") + context_line()
+        + KILL.format(victim="4TCH", killer="SIIIN", tail="")
+        + LOGIN.format(handle="4TCH") + context_line()
+        + KILL.format(victim="Bob", killer="4TCH", tail=""),
+        encoding="utf-8",
+    )
+    results = scan_both_ways(make_parser(), log)
+    # The kill before the first login has nobody to belong to
+    assert [(kill_result.result, kill_result.victim) for kill_result in results] == [("killer", "4TCH"), ("killer", "Bob")]
@@ -0,0 +1,81 @@
+import os
+
+from modules.log_checkpoint import LogCheckpoint
+
+HEADER = "<2025-10-15T08:28:26.203Z> Log started on Wed Oct 15 08:28:26 2025\n"
+LINE = "<2025-10-15T08:30:00.000Z> [Notice] <Actor Death> CActor::Kill: filler\n"
+
+
+def write_log(path, header=HEADER, lines=50):
+    path.write_text(header + LINE * lines, encoding="utf-8")
+
+
+def save(checkpoint, log, offset):
+    checkpoint.save(str(log), offset, "SC_Default", "AEGS_Gladius", "123")
+
+
+def test_checkpoint_round_trip_and_growth(tmp_path):
+    log = tmp_path / "Game.log"
+    write_log(log)
+    checkpoint = LogCheckpoint(tmp_path / "checkpoint.json")
+    save(checkpoint, log, 1000)
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(LINE * 10)
+
+    loaded = LogCheckpoint(tmp_path / "checkpoint.json").load(str(log))
+    assert loaded["offset"] == 1000
+    assert (loaded["game_mode"], loaded["active_ship"], loaded["active_ship_id"]) == ("SC_Default", "AEGS_Gladius", "123")
+
+
+def test_checkpoint_of_a_rotated_log_is_ignored(tmp_path):
+    log = tmp_path / "Game.log"
+    write_log(log)
+    checkpoint = LogCheckpoint(tmp_path / "checkpoint.json")
+    save(checkpoint, log, 1000)
+    # The game starts a new, longer log under the same name
+    new_log = tmp_path / "Game.new"
+    write_log(new_log, HEADER.replace("08:28:26", "09:00:00"), lines=200)
+    os.replace(new_log, log)
+    assert checkpoint.load(str(log)) is None
+
+
+def test_checkpoint_of_a_rewritten_log_is_ignored(tmp_path):
+    log = tmp_path / "Game.log"
+    write_log(log)
+    checkpoint = LogCheckpoint(tmp_path / "checkpoint.json")
+    save(checkpoint, log, 1000)
+    # Same file, new session header, as when the creation time is reused
+    with open(log, "r+", encoding="utf-8") as f:
+        f.write(HEADER.replace("08:28:26", "09:00:00"))
+    assert checkpoint.load(str(log)) is None
+
+
+def test_checkpoint_past_the_end_of_the_log_is_ignored(tmp_path):
+    log = tmp_path / "Game.log"
+    write_log(log)
+    checkpoint = LogCheckpoint(tmp_path / "checkpoint.json")
+    save(checkpoint, log, 1000)
+    with open(log, "r+", encoding="utf-8") as f:
+        f.truncate(500)
+    assert checkpoint.load(str(log)) is None
+
+
+def test_broken_checkpoint_file_is_ignored(tmp_path):
+    log = tmp_path / "Game.log"
+    write_log(log)
+    (tmp_path / "checkpoint.json").write_text("{not json", encoding="utf-8")
+    assert LogCheckpoint(tmp_path / "checkpoint.json").load(str(log)) is None
+
+
+def test_short_log_keeps_its_identity_while_it_grows(tmp_path):
+    log = tmp_path / "Game.log"
+    log.write_text(HEADER, encoding="utf-8")
+    checkpoint = LogCheckpoint(tmp_path / "checkpoint.json")
+    identity = checkpoint.identify(str(log))
+    assert identity["head_length"] < checkpoint.head_size
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(LINE * 50)
+    assert checkpoint.is_same_log(identity, str(log))
+    os.replace(log, tmp_path / "old.log")
+    write_log(log, HEADER.replace("08:28:26", "09:00:00"))
+    assert not checkpoint.is_same_log(identity, str(log))
@@ -0,0 +1,54 @@
+from conftest import make_parser
+
+STAMP = "<2025-10-15T20:24:35.039Z> [Notice]"
+
+
+def test_registered_tags_route_to_their_handler():
+    parser = make_parser()
+    assert parser.route_log_line(f"{STAMP} <Actor Death> CActor::Kill: 'x'\n") == parser._on_actor_death
+    assert parser.route_log_line(f"{STAMP} <Vehicle Destruction> CVehicle::OnAdvanceDestroyLevel\n") == parser._on_vehicle_destruction
+    assert parser.route_log_line(f"{STAMP} <Some Other Tag> nothing to see\n") is None
+
+
+def test_respawn_and_death_are_found_under_any_tag():
+    parser = make_parser()
+    spawned = f"{STAMP} <Renamed Respawn Tag> CPlayerShipRespawnManager::OnVehicleSpawned: ship for 201926434272\n"
+    dead = f"{STAMP} <[ActorState] Renamed> Player 'SIIIN' <local client>: Entering control state dead\n"
+    assert parser.route_marker_line(spawned) == parser._on_vehicle_spawned
+    assert parser.route_marker_line(dead) == parser._on_actor_state_dead
+    # The raw byte prefilter must let them through as well
+    data = (spawned + f"{STAMP} <Unrelated> filler\n" + dead).encode()
+    assert parser.line_prefilter.select(data, len(data) - 1) == [spawned, dead]
+
+
+def test_local_death_under_unknown_tag_resets_the_ship():
+    parser = make_parser()
+    parser.active_ship["current"] = "AEGS_Gladius"
+    parser.active_ship_id = "123456"
+    destroyed = []
+    parser.destroy_player_zone = lambda: destroyed.append(True)
+    parser.read_log_line(f"{STAMP} <Unknown> Player 'SIIIN' [123456] <local client>: Entering control state dead\n", True)
+    assert destroyed == [True]
+
+
+def test_unregistered_tags_are_rejected_by_the_table_alone():
+    parser = make_parser()
+    spawned = f"{STAMP} <Renamed Respawn Tag> CPlayerShipRespawnManager::OnVehicleSpawned: ship for 201926434272\n"
+    assert parser.route_log_line(spawned) is None
+    assert parser.route_marker_line(spawned) == parser._on_vehicle_spawned
+    assert parser.route_marker_line(f"{STAMP} <Some Other Tag> nothing to see\n") is None
+
+
+def test_entering_a_ship_zone_sets_the_active_ship():
+    parser = make_parser()
+    line = (
+        f"{STAMP} <CEntityComponentInstancedInterior::OnEntityEnterZone> [InstancedInterior] OnEntityEnterZone - "
+        "InstancedInterior [AEGS_Gladius_6734193926082] [6734193926082] -> Entity [AEGS_Gladius_6734193926082] "
+        "[6734193926082] -- m_openDoors[0], m_managerGEID[201926434272], m_ownerGEID[SIIIN][201926434272]\n"
+    )
+    assert parser.route_log_line(line) == parser._on_entity_enter_zone
+    data = line.encode()
+    assert parser.line_prefilter.select(data, len(data) - 1) == [line]
+    parser.read_log_line(line, True)
+    assert parser.active_ship["current"] == "AEGS_Gladius"
+    assert parser.active_ship_id == "6734193926082"
@@ -0,0 +1,79 @@
+import os
+
+from modules.log_checkpoint import LogCheckpoint
+from modules.log_tailer import LogTailer
+
+LINE = "<2025-10-15T08:30:00.000Z> [Notice] <Actor Death> CActor::Kill: filler\n"
+
+
+def header(started):
+    return f"<2025-10-15T{started}.203Z> Log started on Wed Oct 15 {started} 2025\n"
+
+
+def make_tailer(tmp_path, log):
+    return LogTailer(str(log), checkpoint=LogCheckpoint(tmp_path / "checkpoint.json"))
+
+
+def test_appending_is_not_a_rotation(tmp_path):
+    log = tmp_path / "Game.log"
+    log.write_text(header("08:28:26") + LINE * 5, encoding="utf-8")
+    tailer = make_tailer(tmp_path, log)
+    tailer.open()
+    try:
+        assert len(tailer.read_lines()) == 6
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(LINE * 3)
+        assert len(tailer.read_lines()) == 3
+        assert not tailer.has_rotated()
+    finally:
+        tailer.close()
+
+
+def test_new_log_longer_than_the_old_offset_is_a_rotation(tmp_path):
+    log = tmp_path / "Game.log"
+    log.write_text(header("08:28:26") + LINE * 5, encoding="utf-8")
+    tailer = make_tailer(tmp_path, log)
+    tailer.open()
+    try:
+        tailer.read_lines()
+        new_log = tmp_path / "Game.new"
+        new_log.write_text(header("09:00:00") + LINE * 50, encoding="utf-8")
+        os.replace(new_log, log)
+        assert tailer.read_lines() == []
+        assert tailer.has_rotated()
+        tailer.reopen()
+        lines = tailer.read_lines()
+        assert lines[0] == header("09:00:00")
+        assert len(lines) == 51
+        assert not tailer.has_rotated()
+    finally:
+        tailer.close()
+
+
+def test_log_rewritten_in_place_is_a_rotation(tmp_path):
+    log = tmp_path / "Game.log"
+    log.write_text(header("08:28:26") + LINE * 5, encoding="utf-8")
+    tailer = make_tailer(tmp_path, log)
+    tailer.open()
+    try:
+        tailer.read_lines()
+        with open(log, "w", encoding="utf-8") as f:
+            f.write(header("09:00:00") + LINE * 50)
+        assert tailer.has_rotated()
+    finally:
+        tailer.close()
+
+
+def test_missing_log_waits_for_the_new_one(tmp_path):
+    log = tmp_path / "Game.log"
+    log.write_text(header("08:28:26"), encoding="utf-8")
+    tailer = make_tailer(tmp_path, log)
+    tailer.open()
+    try:
+        tailer.read_lines()
+        os.replace(log, tmp_path / "backup.log")
+        assert not tailer.has_rotated()
+        log.write_text(header("09:00:00"), encoding="utf-8")
+        assert tailer.has_rotated()
+    finally:
+        tailer.close()
@@ -0,0 +1,74 @@
+import random
+
+from modules.sc_data_index import NameResolver
+
+
+def linear_scan(entries, raw_id):
+    """The list scan get_sc_data used to do, first listed id contained in the raw id."""
+    for data in entries:
+        if data["id"] in raw_id:
+            return data["name"]
+    return None
+
+
+def longest_scan(entries, raw_id):
+    """Linear reference for the resolver's rule: the longest contained id, the first listed one on ties."""
+    best = None
+    for data in entries:
+        if data["id"] in raw_id and (best is None or len(data["id"]) > len(best["id"])):
+            best = data
+    return best["name"] if best else None
+
+
+def test_longest_contained_id_wins():
+    entries = [
+        {"id": "KLWE_LaserRepeater", "name": "Laser Repeater"},
+        {"id": "KLWE_LaserRepeater_S3", "name": "Laser Repeater S3"},
+        {"id": "S3", "name": "Size 3"},
+    ]
+    resolver = NameResolver(entries)
+    assert resolver.resolve("KLWE_LaserRepeater_S3_4021") == "Laser Repeater S3"
+    assert resolver.resolve("KLWE_LaserRepeater_S2_4021") == "Laser Repeater"
+    assert resolver.resolve("UNKN_Thing_S3") == "Size 3"
+    assert resolver.resolve("UNKN_Thing") is None
+    # Listed longest first, the old scan agrees
+    assert linear_scan([entries[1], entries[0]], "KLWE_LaserRepeater_S3_4021") == "Laser Repeater S3"
+
+
+def test_overlapping_ids_of_equal_length_go_to_the_first_listed():
+    entries = [
+        {"id": "GATS_Ball", "name": "Later in the id"},
+        {"id": "ESPR_GATS", "name": "Earlier in the id"},
+        {"id": "ESPR_GATS", "name": "Duplicate id"},
+    ]
+    resolver = NameResolver(entries)
+    # Both ids overlap on GATS and have the same length, list order decides like the old scan
+    assert resolver.resolve("ESPR_GATS_Ball_1") == "Later in the id" == linear_scan(entries, "ESPR_GATS_Ball_1")
+    assert NameResolver(entries[1:]).resolve("ESPR_GATS_Ball_1") == "Earlier in the id"
+
+
+def test_failure_links_find_ids_after_a_partial_match():
+    entries = [
+        {"id": "abcd", "name": "abcd"},
+        {"id": "bcx", "name": "bcx"},
+        {"id": "cxy", "name": "cxy"},
+    ]
+    resolver = NameResolver(entries)
+    # "abc" fails at x, the match must continue from the suffix "bc"
+    assert resolver.resolve("abcxy") == "bcx"
+    assert resolver.resolve("zzabcd") == "abcd"
+    assert resolver.resolve("abcabcxyz") == "bcx"
+
+
+def test_matches_the_linear_reference_on_random_ids():
+    rng = random.Random(7)
+    alphabet = "ab_c"
+    entries = [
+        {"id": "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))), "name": f"Entry {i}"}
+        for i in range(60)
+    ]
+    entries.append({"id": "", "name": "Empty ids never match"})
+    resolver = NameResolver(entries)
+    for _ in range(2000):
+        raw_id = "".join(rng.choice(alphabet + "x") for _ in range(rng.randint(0, 20)))
+        assert resolver.resolve(raw_id) == longest_scan([e for e in entries if e["id"]], raw_id), raw_id
@@ -0,0 +1,136 @@
+import json
+
+import pytest
+
+from modules.cfg_handler import Cfg_Handler
+from modules.outbox import KillOutbox
+
+from conftest import RecordingLogger
+
+
+def make_kill(i):
+    return {"result": "killer", "data": {"player": "SIIIN", "victim": f"Victim_{i}", "time": f"<2025-10-15T20:24:{i:02d}.039Z>"}}
+
+
+def open_outbox(path, **kwargs):
+    outbox = KillOutbox(**kwargs)
+    outbox.open(path)
+    return outbox
+
+
+def test_replay_keeps_unacked_kills_in_order(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    outbox = open_outbox(path)
+    for i in range(5):
+        assert outbox.add(make_kill(i), "reportKill")
+    assert not outbox.add(make_kill(0), "reportKill")
+    outbox.ack(make_kill(1), "reportKill")
+    outbox.close()
+
+    reopened = open_outbox(path)
+    assert [record["kill_result"] for record in reopened.peek(10)] == [make_kill(i) for i in (0, 2, 3, 4)]
+
+
+def test_replay_skips_a_torn_last_line_and_compacts(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    outbox = open_outbox(path)
+    outbox.add(make_kill(0), "reportKill")
+    outbox.add(make_kill(1), "reportACKill")
+    outbox.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "id": "abc", "endpoint": "reportKill", "kill_res')
+
+    reopened = open_outbox(path)
+    assert len(reopened) == 2
+    reopened.close()
+    # The torn record is gone from the file after the compaction
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["endpoint"] for line in lines] == ["reportKill", "reportACKill"]
+
+
+def test_compaction_drops_acked_records(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    outbox = open_outbox(path, compact_min_records=10)
+    for i in range(20):
+        outbox.add(make_kill(i), "reportKill")
+    for i in range(18):
+        outbox.ack(make_kill(i), "reportKill")
+    outbox.maybe_compact()
+    outbox.close()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert [record["kill_result"] for record in open_outbox(path).peek(10)] == [make_kill(18), make_kill(19)]
+
+
+def test_kills_added_before_open_are_written_on_open(tmp_path):
+    outbox = KillOutbox()
+    outbox.add(make_kill(0), "reportKill")
+    assert not outbox.is_open
+    outbox.open(tmp_path / "outbox.jsonl")
+    outbox.close()
+    assert len(open_outbox(tmp_path / "outbox.jsonl")) == 1
+
+
+def make_cfg_handler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg_handler = Cfg_Handler({"enabled": True}, {"active": True}, {"current": "SIIIN"})
+    cfg_handler.log = RecordingLogger()
+    return cfg_handler
+
+
+def write_legacy_config(tmp_path, monkeypatch, kills):
+    cfg_handler = make_cfg_handler(tmp_path, monkeypatch)
+    cfg_handler._set_cfg_vars()
+    cfg_handler.outbox.close()
+    cfg_handler.cfg_dict["pickle"] = [{"kill_result": kill, "endpoint": "reportKill"} for kill in kills]
+    cfg_handler.save_cfg("all", "")
+
+
+def saved_config(cfg_handler):
+    fresh = Cfg_Handler({"enabled": True}, {"active": True}, {"current": "SIIIN"})
+    fresh.log = RecordingLogger()
+    fresh.crypt_key, fresh.cfg_path = cfg_handler.crypt_key, cfg_handler.cfg_path
+    fresh.load_cfg("key")
+    return fresh.cfg_dict
+
+
+def test_migration_moves_the_config_buffer_to_the_outbox(tmp_path, monkeypatch):
+    kills = [make_kill(i) for i in range(3)]
+    write_legacy_config(tmp_path, monkeypatch, kills)
+    cfg_handler = make_cfg_handler(tmp_path, monkeypatch)
+    cfg_handler._set_cfg_vars()
+    cfg_handler.load_cfg("key")
+
+    assert [record["kill_result"] for record in cfg_handler.outbox.peek(10)] == kills
+    assert "pickle" not in cfg_handler.cfg_dict
+    assert "pickle" not in saved_config(cfg_handler)
+
+
+def test_migration_keeps_the_config_buffer_when_the_outbox_is_not_open(tmp_path, monkeypatch):
+    kills = [make_kill(i) for i in range(3)]
+    write_legacy_config(tmp_path, monkeypatch, kills)
+    cfg_handler = make_cfg_handler(tmp_path, monkeypatch)
+    monkeypatch.setattr(cfg_handler.outbox, "open", lambda path: (_ for _ in ()).throw(OSError("read-only")))
+    cfg_handler._set_cfg_vars()
+    cfg_handler.load_cfg("key")
+
+    assert len(cfg_handler.cfg_dict["pickle"]) == 3
+    # Any later save still carries the legacy buffer
+    cfg_handler.save_cfg("volume", {"level": 0.5, "is_muted": False})
+    assert len(saved_config(cfg_handler)["pickle"]) == 3
+
+
+@pytest.mark.parametrize("failing", ["add", "sync"])
+def test_migration_keeps_the_config_buffer_when_the_journal_fails(tmp_path, monkeypatch, failing):
+    kills = [make_kill(i) for i in range(3)]
+    write_legacy_config(tmp_path, monkeypatch, kills)
+    cfg_handler = make_cfg_handler(tmp_path, monkeypatch)
+    cfg_handler._set_cfg_vars()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(cfg_handler.outbox, failing, fail)
+    cfg_handler.load_cfg("key")
+
+    assert len(cfg_handler.cfg_dict["pickle"]) == 3
+    assert len(saved_config(cfg_handler)["pickle"]) == 3
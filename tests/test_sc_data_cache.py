@@ -0,0 +1,104 @@
+import json
+
+from modules.api_client import API_Client
+from modules.sc_data_cache import ScDataCache
+
+from conftest import NullModule, RecordingLogger
+
+WEAPONS = [{"id": "KLWE_LaserRepeater_S3", "name": "Attrition-3"}]
+NEW_WEAPONS = WEAPONS + [{"id": "BEHR_BallisticGatling_S4", "name": "Revenant"}]
+
+
+class FakeResponse():
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class FakeTransport():
+    """Answers GETs from a list of canned responses and records the request headers."""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, kind="", headers=None, **kwargs):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+def make_api(tmp_path, monkeypatch, *responses):
+    # The cache file lives in the working directory
+    monkeypatch.chdir(tmp_path)
+    api = API_Client(NullModule(), NullModule(), {"active": True}, "test", {"current": "SIIIN"})
+    api.log = RecordingLogger()
+    api.api_key["value"] = "test"
+    api.transport = FakeTransport(*responses)
+    return api
+
+
+def test_missing_or_broken_cache_file_is_an_empty_cache(tmp_path):
+    cache = ScDataCache(tmp_path / "sc_data.json")
+    assert cache.load() == {}
+    assert cache.validators("weapons") == {}
+    for broken in ("{not json", "[1, 2]", json.dumps({"weapons": {"etag": "x"}, "ships": "nope"})):
+        (tmp_path / "sc_data.json").write_text(broken, encoding="utf-8")
+        assert cache.load() == {}
+        assert cache.validators("weapons") == {}
+
+
+def test_stored_maps_and_validators_survive_a_restart(tmp_path):
+    cache = ScDataCache(tmp_path / "sc_data.json")
+    cache.store("weapons", WEAPONS, '"v1"', "Wed, 15 Oct 2025 08:00:00 GMT")
+    reloaded = ScDataCache(tmp_path / "sc_data.json")
+    assert reloaded.load() == {"weapons": WEAPONS}
+    assert reloaded.validators("weapons") == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 15 Oct 2025 08:00:00 GMT"}
+    assert not (tmp_path / "sc_data.json.tmp").exists()
+
+
+def test_not_modified_reuses_the_cached_map(tmp_path, monkeypatch):
+    api = make_api(
+        tmp_path, monkeypatch,
+        FakeResponse(200, {"weapons": WEAPONS}, {"ETag": '"v1"'}),
+        FakeResponse(304),
+    )
+    api.get_data_map("weapons")
+    api.get_data_map("weapons")
+    assert api.transport.requests[0].get("If-None-Match") is None
+    assert api.transport.requests[1]["If-None-Match"] == '"v1"'
+    assert api.sc_data["weapons"] == WEAPONS
+    assert api.sc_data_index["weapons"].resolve("KLWE_LaserRepeater_S3_4021") == "Attrition-3"
+    assert api.connection_healthy
+
+
+def test_cached_map_is_used_from_startup(tmp_path, monkeypatch):
+    ScDataCache(tmp_path / "bv_killtracker_sc_data.json").store("weapons", WEAPONS, '"v1"', None)
+    api = make_api(tmp_path, monkeypatch, FakeResponse(304))
+    # Names resolve before the first refresh went out
+    assert api.sc_data_index["weapons"].resolve("KLWE_LaserRepeater_S3_4021") == "Attrition-3"
+    api.get_data_map("weapons")
+    assert api.transport.requests[0] == {"Authorization": "test", "If-None-Match": '"v1"'}
+    assert api.sc_data["weapons"] == WEAPONS
+
+
+def test_a_new_map_replaces_the_cached_one(tmp_path, monkeypatch):
+    ScDataCache(tmp_path / "bv_killtracker_sc_data.json").store("weapons", WEAPONS, '"v1"', None)
+    api = make_api(tmp_path, monkeypatch, FakeResponse(200, {"weapons": NEW_WEAPONS}, {"ETag": '"v2"'}))
+    api.get_data_map("weapons")
+    assert api.sc_data["weapons"] == NEW_WEAPONS
+    assert api.sc_data_index["weapons"].resolve("BEHR_BallisticGatling_S4_77") == "Revenant"
+    reloaded = ScDataCache(tmp_path / "bv_killtracker_sc_data.json")
+    assert reloaded.load()["weapons"] == NEW_WEAPONS
+    assert reloaded.validators("weapons") == {"If-None-Match": '"v2"'}
+
+
+def test_server_error_keeps_the_cached_map(tmp_path, monkeypatch):
+    ScDataCache(tmp_path / "bv_killtracker_sc_data.json").store("weapons", WEAPONS, '"v1"', None)
+    api = make_api(tmp_path, monkeypatch, FakeResponse(500))
+    api.get_data_map("weapons")
+    assert api.sc_data["weapons"] == WEAPONS
+    assert not api.connection_healthy
+    assert ScDataCache(tmp_path / "bv_killtracker_sc_data.json").load()["weapons"] == WEAPONS
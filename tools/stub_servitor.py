@@ -0,0 +1,146 @@
+"""Local stand-in for Servitor, for load testing the Kill Tracker uploads.
+
+Accepts kills on /reportKill and /reportACKill either one per request or as a
+JSON array, answers /validateKey like a valid key and serves the data maps in
+server.data_maps (empty by default) with an ETag, honouring If-None-Match.
+Heartbeats get server.commanders as the roster, plus server.heartbeat_interval
+when it is set.
+Counts requests and kills so batching can be compared in requests/sec.
+
+    python tools/stub_servitor.py --port 25966 --latency 20
+    python tools/stub_servitor.py --no-batch   (reject array payloads like an older Servitor)
+
+Point the Kill Tracker at it by setting API_Client.api_fqdn to http://127.0.0.1:<port>.
+"""
+import argparse
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import monotonic, sleep
+
+
+class StubStats:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.started = monotonic()
+        self.requests = 0
+        self.kill_posts = 0
+        self.kills = 0
+        self.rejected = 0
+        self.not_modified = 0
+
+    def summary(self) -> str:
+        elapsed = max(monotonic() - self.started, 1e-9)
+        return (
+            f"{self.requests} requests ({self.requests / elapsed:,.1f}/s), {self.kills} kills in "
+            f"{self.kill_posts} kill posts, {self.rejected} batches rejected, "
+            f"{self.not_modified} data maps not modified"
+        )
+
+
+class StubServitorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "StubServitor"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, code: int, body, headers=None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"null")
+
+    def do_POST(self) -> None:
+        payload = self._read_json()
+        stats = self.server.stats
+        with stats.lock:
+            stats.requests += 1
+        if self.server.latency:
+            sleep(self.server.latency)
+        if self.path in ("/reportKill", "/reportACKill"):
+            if isinstance(payload, list) and not self.server.accept_batches:
+                with stats.lock:
+                    stats.rejected += 1
+                return self._reply(400, {"error": "expected a single kill object"})
+            kills = payload if isinstance(payload, list) else [payload]
+            with stats.lock:
+                stats.kill_posts += 1
+                stats.kills += len(kills)
+            return self._reply(200, {"accepted": len(kills)})
+        if self.path == "/validateKey":
+            expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+            body = {"expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ")[:-4] + "Z", "commanders": list(self.server.commanders)}
+            if self.server.heartbeat_interval is not None:
+                body["heartbeat_interval"] = self.server.heartbeat_interval
+            return self._reply(200, body)
+        self._reply(404, {"error": "unknown endpoint"})
+
+    def do_GET(self) -> None:
+        with self.server.stats.lock:
+            self.server.stats.requests += 1
+        if self.path.startswith("/api/server/data/"):
+            data_type = self.path.rsplit("/", 1)[-1]
+            body = {data_type: self.server.data_maps.get(data_type, [])}
+            etag = '"' + hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                with self.server.stats.lock:
+                    self.server.stats.not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            return self._reply(200, body, {"ETag": etag})
+        self._reply(404, {"error": "unknown endpoint"})
+
+
+def start_stub_servitor(port: int = 0, latency_ms: float = 0, accept_batches: bool = True, verbose: bool = False) -> ThreadingHTTPServer:
+    """Serve the stub on a background thread, port 0 picks a free one (see server.server_port)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubServitorHandler)
+    server.daemon_threads = True
+    server.stats = StubStats()
+    server.latency = latency_ms / 1000
+    server.accept_batches = accept_batches
+    server.verbose = verbose
+    server.data_maps = {}
+    server.commanders = []
+    server.heartbeat_interval = None
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--port", type=int, default=25966)
+    arg_parser.add_argument("--latency", type=float, default=0, help="milliseconds added to every POST")
+    arg_parser.add_argument("--no-batch", action="store_true", help="reject array payloads")
+    arg_parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = arg_parser.parse_args()
+
+    server = start_stub_servitor(args.port, args.latency, not args.no_batch, args.verbose)
+    print(f"Stub Servitor listening on http://127.0.0.1:{server.server_port}")
+    try:
+        while True:
+            sleep(10)
+            print(server.stats.summary())
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    print(server.stats.summary())
+
+
+if __name__ == "__main__":
+    main()